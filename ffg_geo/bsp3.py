@@ -6,13 +6,34 @@ Binary space partitioning (BSP) representation of a mesh in 3D.
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
+import functools
 import math
 from typing import Any, List, Optional, Tuple, Union
 
+import numpy
+
 from .vector3 import Vector3
 
+# Below this many polygons, polygons are measured against planes one at a time on plain floats: the fixed cost of the
+# NumPy calls that measure a batch at once outweighs the arithmetic they save.
+_BATCH_MIN_POLYGONS = 16
+
 
 class BSP3(object):
+    # Corner i of the unit cube has its x, y, and z coordinates negative or positive according to bits 0, 1, and 2 of i.
+    CUBE_CORNERS = numpy.array([[sx, sy, sz] for sz in (-1.0, 1.0) for sy in (-1.0, 1.0) for sx in (-1.0, 1.0)],
+                               dtype=numpy.float64)
+    # The corners of each face of the cube, counter-clockwise when viewed from outside. The faces are in the order -x,
+    # +x, -y, +y, -z, +z.
+    CUBE_FACES = (
+        (0, 4, 6, 2),
+        (1, 3, 7, 5),
+        (0, 1, 5, 4),
+        (2, 6, 7, 3),
+        (0, 2, 3, 1),
+        (4, 5, 7, 6)
+    )
+
     def __init__(self) -> None:
         self.polygons = []  # type: List['BSPPolygon3']
 
@@ -74,19 +95,17 @@ class BSP3(object):
 
     def save_stl(self, filename: str) -> None:
         import stl
-        import numpy
-        number_of_triangles = 0
-        for polygon in self.polygons:
-            number_of_triangles += (len(polygon.vertices) - 2)
-        data = numpy.zeros(number_of_triangles, dtype=stl.Mesh.dtype)
-        on_triangle = 0
-        for polygon in self.polygons:
-            for i in range(2, len(polygon.vertices)):
-                a, b, c = polygon.vertices[0].pos, polygon.vertices[i - 1].pos, polygon.vertices[i].pos
-                n = b.minus(a).cross(c.minus(a)).unit()
-                data['vectors'][on_triangle] = numpy.array([[a.x, a.y, a.z], [b.x, b.y, b.z], [c.x, c.y, c.z]])
-                data['normals'][on_triangle] = numpy.array([n.x, n.y, n.z])
-                on_triangle += 1
+        # Fan triangulate every polygon as (0, i - 1, i) and gather the corners of all the triangles.
+        empty = [numpy.empty((0, 3), dtype=numpy.float64)]
+        a = numpy.concatenate(empty + [numpy.repeat(p.positions[:1], len(p.vertices) - 2, axis=0)
+                                       for p in self.polygons])
+        b = numpy.concatenate(empty + [p.positions[1:-1] for p in self.polygons])
+        c = numpy.concatenate(empty + [p.positions[2:] for p in self.polygons])
+        normals = numpy.cross(b - a, c - a)
+        normals /= numpy.linalg.norm(normals, axis=1, keepdims=True)
+        data = numpy.zeros(len(a), dtype=stl.Mesh.dtype)
+        data['vectors'] = numpy.stack((a, b, c), axis=1)
+        data['normals'] = normals
         mesh = stl.mesh.Mesh(data)
         mesh.save(filename, mode=stl.Mode.ASCII, update_normals=False)
 
@@ -102,60 +121,56 @@ class BSP3(object):
 
     @staticmethod
     def cube(center: Tuple[float, float, float], radius: Union[float, Tuple[float, float, float]]) -> 'BSP3':
-        c = Vector3(center[0], center[1], center[2])
         if not isinstance(radius, tuple):
-            radius = [float(radius), float(radius), float(radius)]
-        r = Vector3(radius[0], radius[1], radius[2])
-        polygon_info = [
-            [[0, 4, 6, 2], [-1.0, 0.0, 0.0]],
-            [[1, 3, 7, 5], [+1.0, 0.0, 0.0]],
-            [[0, 1, 5, 4], [0.0, -1.0, 0.0]],
-            [[2, 6, 7, 3], [0.0, +1.0, 0.0]],
-            [[0, 2, 3, 1], [0.0, 0.0, -1.0]],
-            [[4, 5, 7, 6], [0.0, 0.0, +1.0]]
-        ]
+            radius = (float(radius), float(radius), float(radius))
+        corners = numpy.ones((8, 4), dtype=numpy.float64)
+        corners[:, :3] = numpy.asarray(center, dtype=numpy.float64) + numpy.asarray(radius, dtype=numpy.float64) * \
+            BSP3.CUBE_CORNERS
+        corner_vertices = [BSPVertex3(Vector3(x, y, z)) for x, y, z in corners[:, :3].tolist()]
         polygons = []
-        for info in polygon_info:
-            vertices = []
-            for i in info[0]:
-                pos = Vector3(
-                    c.x + r.x * (2 * bool(i & 1) - 1),
-                    c.y + r.y * (2 * bool(i & 2) - 1),
-                    c.z + r.z * (2 * bool(i & 4) - 1)
-                )
-                # norm = Vector3(info[1][0], info[1][1], info[1][2])
-                # vertex = BSPVertex3(pos, norm)
-                vertex = BSPVertex3(pos)
-                vertices.append(vertex)
-            polygon = BSPPolygon3(vertices, None)
-            polygons.append(polygon)
+        for face in BSP3.CUBE_FACES:
+            vertices = [corner_vertices[i] for i in face]
+            polygons.append(BSPPolygon3(vertices, None, corners[face, :]))
         return BSP3.from_polygons(polygons)
 
     @staticmethod
-    def sphere(center: Tuple[float, float, float], radius: float, slices: int, stacks: int) -> 'BSP3':
-        c = Vector3(center[0], center[1], center[2])
-
-        def vertex(theta, phi):
-            theta *= math.pi * 2.0
-            phi *= math.pi
-            direction = Vector3(
-                math.cos(theta) * math.sin(phi),
-                math.cos(phi),
-                math.sin(theta) * math.sin(phi)
-            )
-            # return BSPVertex3(c.plus(direction.times(radius)), direction)
-            return BSPVertex3(c.plus(direction.times(radius)))
+    @functools.lru_cache(maxsize=32)
+    def unit_sphere(slices: int, stacks: int) -> numpy.ndarray:
+        # The (slices + 1, stacks + 1, 3) grid of unit directions of a sphere, which are also the normals of its
+        # vertices. Cached, and read-only, so repeated spheres of the same resolution skip the trigonometry.
+        theta, phi = numpy.meshgrid(numpy.arange(slices + 1) / slices * (math.pi * 2.0),
+                                    numpy.arange(stacks + 1) / stacks * math.pi, indexing='ij')
+        sin_phi = numpy.sin(phi)
+        directions = numpy.stack((numpy.cos(theta) * sin_phi, numpy.cos(phi), numpy.sin(theta) * sin_phi), axis=-1)
+        directions.flags.writeable = False
+        return directions
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def unit_circle(slices: int) -> numpy.ndarray:
+        # The (slices + 1, 2) cosines and sines of the angles around a cylinder, cached and read-only like unit_sphere.
+        angles = numpy.arange(slices + 1) / slices * math.pi * 2.0
+        cos_sin = numpy.stack((numpy.cos(angles), numpy.sin(angles)), axis=-1)
+        cos_sin.flags.writeable = False
+        return cos_sin
+
+    @staticmethod
+    def sphere(center: Tuple[float, float, float], radius: float, slices: int, stacks: int) -> 'BSP3':
+        grid = numpy.ones((slices + 1, stacks + 1, 4), dtype=numpy.float64)
+        grid[..., :3] = numpy.asarray(center, dtype=numpy.float64) + BSP3.unit_sphere(slices, stacks) * radius
+        positions = grid[..., :3].tolist()
         polygons = []
         for i in range(slices):
             for j in range(stacks):
-                vertices = [vertex(i / slices, j / stacks)]
+                corners = [(i, j)]
                 if j > 0:
-                    vertices.append(vertex((i + 1) / slices, j / stacks))
+                    corners.append((i + 1, j))
                 if j < (stacks - 1):
-                    vertices.append(vertex((i + 1) / slices, (j + 1) / stacks))
-                vertices.append(vertex(i / slices, (j + 1) / stacks))
-                polygons.append(BSPPolygon3(vertices, None))
+                    corners.append((i + 1, j + 1))
+                corners.append((i, j + 1))
+                vertices = [BSPVertex3(Vector3(*positions[a][b])) for a, b in corners]
+                rows_i, rows_j = zip(*corners)
+                polygons.append(BSPPolygon3(vertices, None, grid[rows_i, rows_j]))
         return BSP3.from_polygons(polygons)
 
     @staticmethod
@@ -168,42 +183,42 @@ class BSP3(object):
         is_y = (math.fabs(axis_z.y) > 0.5)
         axis_x = Vector3(float(is_y), float(not is_y), 0.0).cross(axis_z).unit()
         axis_y = axis_x.cross(axis_z).unit()
-        # start_vertex = BSPVertex3(s, axis_z.negated())
-        start_vertex = BSPVertex3(s)
-        # end_vertex = BSPVertex3(e, axis_z.negated())
-        end_vertex = BSPVertex3(e)
+        cos_sin = BSP3.unit_circle(slices)
+        # The outward directions around the axis, which are also the normals of the side vertices.
+        out = cos_sin[:, 0:1] * numpy.array((axis_x.x, axis_x.y, axis_x.z)) + \
+            cos_sin[:, 1:2] * numpy.array((axis_y.x, axis_y.y, axis_y.z))
+        # Row 0 is the start, row 1 is the end, rows [2, slices + 3) are the start ring, and the rest are the end ring.
+        rows = numpy.ones((2 * slices + 4, 4), dtype=numpy.float64)
+        rows[0, :3] = (s.x, s.y, s.z)
+        rows[1, :3] = (e.x, e.y, e.z)
+        rows[2:slices + 3, :3] = numpy.array((s.x, s.y, s.z)) + out * radius
+        top = s.plus(ray)
+        rows[slices + 3:, :3] = numpy.array((top.x, top.y, top.z)) + out * radius
+        positions = rows[:, :3].tolist()
         polygons = []
 
-        # def point(stack, slice_, normal_blend):
-        def point(stack, slice_):
-            angle = slice_ * math.pi * 2.0
-            out = axis_x.times(math.cos(angle)).plus(axis_y.times(math.sin(angle)))
-            pos = s.plus(ray.times(stack)).plus(out.times(radius))
-            # normal = out.times(1.0 - math.fabs(normal_blend)).plus(axis_z.times(normal_blend))
-            # return BSPVertex3(pos, normal)
-            return BSPVertex3(pos)
+        def polygon(indices):
+            return BSPPolygon3([BSPVertex3(Vector3(*positions[index])) for index in indices], None, rows[indices, :])
 
         for i in range(slices):
-            t0 = i / slices
-            t1 = (i + 1) / slices
-            # polygons.append(BSPPolygon3([start_vertex.clone(), point(0, t0, -1), point(0, t1, -1)], None))
-            polygons.append(BSPPolygon3([start_vertex.clone(), point(0, t0), point(0, t1)], None))
-            # polygons.append(BSPPolygon3([point(0, t1, 0), point(0, t0, 0), point(1, t0, 0), point(1, t1, 0)], None))
-            polygons.append(BSPPolygon3([point(0, t1), point(0, t0), point(1, t0), point(1, t1)], None))
-            # polygons.append(BSPPolygon3([end_vertex.clone(), point(1, t1, 0), point(1, t0, 1)], None))
-            polygons.append(BSPPolygon3([end_vertex.clone(), point(1, t1), point(1, t0)], None))
+            b0, b1 = i + 2, i + 3
+            t0, t1 = b0 + slices + 1, b1 + slices + 1
+            polygons.append(polygon([0, b0, b1]))
+            polygons.append(polygon([b1, b0, t0, t1]))
+            polygons.append(polygon([1, t1, t0]))
         return BSP3.from_polygons(polygons)
 
 
 class BSPVertex3(object):
     # def __init__(self, pos: 'Vector3', normal: 'Vector3') -> None:
     def __init__(self, pos: 'Vector3') -> None:
-        self.pos = Vector3(pos.x, pos.y, pos.z)  # type: Vector3
+        self.pos = pos  # type: Vector3
         # self.normal = Vector3(normal.x, normal.y, normal.z)  # type: Vector3
 
     def clone(self) -> 'BSPVertex3':
         # return BSPVertex3(self.pos.clone(), self.normal.clone())
-        return BSPVertex3(self.pos.clone())
+        # Vertices are immutable value objects (flip is a no-op without normals), so they can be shared.
+        return self
 
     def flip(self) -> None:
         # self.normal = self.normal.negated()
@@ -216,94 +231,212 @@ class BSPVertex3(object):
 
 class BSPPlane3(object):
     EPSILON = 1.e-5
+    COPLANAR = 0
+    FRONT = 1
+    BACK = 2
+    SPANNING = 3
+    KEY_DIGITS = 7
 
     def __init__(self, normal: Vector3, w: float) -> None:
         self.normal = normal
         self.w = w
+        # The plane equation (nx, ny, nz, -w), such that its dot product with a homogeneous position (x, y, z, 1) is the
+        # signed distance of the position from the plane.
+        self.equation = numpy.array((normal.x, normal.y, normal.z, -w), dtype=numpy.float64)  # type: numpy.ndarray
+        # Rounded signatures of this plane and of its flip, so that a polygon measured coplanar with this plane and
+        # lying on it, or on its flip, is put in front or back without the dot product of the normals. A matching
+        # signature alone does not make a polygon coplanar: far from the origin, planes that round alike can be more
+        # than EPSILON apart.
+        d = BSPPlane3.KEY_DIGITS
+        self.key = (round(normal.x, d), round(normal.y, d), round(normal.z, d), round(w, d))  # type: Tuple[float, ...]
+        self.flipped_key = tuple(-k for k in self.key)  # type: Tuple[float, ...]
 
     def clone(self) -> 'BSPPlane3':
-        return BSPPlane3(self.normal.clone(), self.w)
+        # Copy the derived fields rather than deriving them again; the normal and the keys are immutable and shared.
+        plane = BSPPlane3.__new__(BSPPlane3)
+        plane.normal = self.normal
+        plane.w = self.w
+        plane.equation = self.equation.copy()
+        plane.key = self.key
+        plane.flipped_key = self.flipped_key
+        return plane
 
     def flip(self) -> None:
         self.normal = self.normal.negated()
         self.w = -self.w
+        self.equation = -self.equation
+        self.key, self.flipped_key = self.flipped_key, self.key
 
     def split_polygon(self, polygon: 'BSPPolygon3', coplanar_front: List['BSPPolygon3'],
                       coplanar_back: List['BSPPolygon3'], front: List['BSPPolygon3'],
                       back: List['BSPPolygon3']) -> None:
-        coplanar_type = 0
-        front_type = 1
-        back_type = 2
-        spanning_type = 3
-        polygon_type = 0
-        types = []
-        num_vertices = len(polygon.vertices)
-        for i in range(num_vertices):
-            t = self.normal.dot(polygon.vertices[i].pos) - self.w
-            if t < -BSPPlane3.EPSILON:
-                vertex_type = back_type
-            elif t > BSPPlane3.EPSILON:
-                vertex_type = front_type
-            else:
-                vertex_type = coplanar_type
+        polygon_type, types, distances = self.measure(polygon)
+        self.place_polygon(polygon, polygon_type, types, distances, coplanar_front, coplanar_back, front, back)
+
+    def measure(self, polygon: 'BSPPolygon3') -> Tuple[int, List[int], List[float]]:
+        # The type of the polygon, and the type and the signed distance of each of its vertices, on plain floats: for
+        # one polygon of a handful of vertices, the fixed cost of a few NumPy calls outweighs the arithmetic.
+        normal = self.normal
+        nx, ny, nz, w = normal.x, normal.y, normal.z, self.w
+        epsilon = BSPPlane3.EPSILON
+        front, back, coplanar = BSPPlane3.FRONT, BSPPlane3.BACK, BSPPlane3.COPLANAR
+        distances = [nx * x + ny * y + nz * z - w for x, y, z in polygon.positions.tolist()]
+        types = [back if distance < -epsilon else front if distance > epsilon else coplanar for distance in distances]
+        polygon_type = coplanar
+        for vertex_type in types:
             polygon_type |= vertex_type
-            types.append(vertex_type)
-        if polygon_type == coplanar_type:
-            t = self.normal.dot(polygon.plane.normal)
-            if t > 0:
-                coplanar_front.append(polygon)
+        return polygon_type, types, distances
+
+    def split_polygons(self, polygons: List['BSPPolygon3'], coplanar_front: List['BSPPolygon3'],
+                       coplanar_back: List['BSPPolygon3'], front: List['BSPPolygon3'],
+                       back: List['BSPPolygon3']) -> None:
+        # Same as split_polygon on each polygon in turn, but the rows of the whole batch are laid out as one
+        # structure-of-arrays block with per-polygon offsets, so a single product measures every vertex and a single
+        # reduceat classifies every polygon.
+        if len(polygons) < _BATCH_MIN_POLYGONS:
+            for polygon in polygons:
+                self.split_polygon(polygon, coplanar_front, coplanar_back, front, back)
+            return
+        counts = [len(polygon.vertices) for polygon in polygons]
+        offsets = [0] * len(counts)
+        for i in range(1, len(counts)):
+            offsets[i] = offsets[i - 1] + counts[i - 1]
+        distances = numpy.concatenate([polygon.homogeneous_positions for polygon in polygons]).dot(self.equation)
+        types = BSPPlane3.classify(distances)
+        polygon_types = numpy.bitwise_or.reduceat(types, offsets).tolist()
+        self.place_polygons(polygons, polygon_types, offsets, counts, types, distances, coplanar_front, coplanar_back,
+                            front, back)
+
+    def place_polygons(self, polygons: List['BSPPolygon3'], polygon_types: List[int], offsets: List[int],
+                       counts: List[int], types: numpy.ndarray, distances: numpy.ndarray,
+                       coplanar_front: List['BSPPolygon3'], coplanar_back: List['BSPPolygon3'],
+                       front: List['BSPPolygon3'], back: List['BSPPolygon3']) -> None:
+        # Polygon i's vertex types and distances are types and distances[offsets[i]:offsets[i] + counts[i]].
+        types = types.tolist()
+        distances = distances.tolist()
+        for polygon, polygon_type, offset, count in zip(polygons, polygon_types, offsets, counts):
+            if polygon_type == BSPPlane3.COPLANAR:
+                self.place_coplanar(polygon, coplanar_front, coplanar_back)
             else:
-                coplanar_back.append(polygon)
-        elif polygon_type == front_type:
+                self.place_polygon(polygon, polygon_type, types[offset:offset + count],
+                                   distances[offset:offset + count], coplanar_front, coplanar_back, front, back)
+
+    @staticmethod
+    def classify(distances: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(distances < -BSPPlane3.EPSILON, BSPPlane3.BACK,
+                           numpy.where(distances > BSPPlane3.EPSILON, BSPPlane3.FRONT, BSPPlane3.COPLANAR))
+
+    def place_coplanar(self, polygon: 'BSPPolygon3', coplanar_front: List['BSPPolygon3'],
+                       coplanar_back: List['BSPPolygon3']) -> None:
+        if self.faces_front(polygon):
+            coplanar_front.append(polygon)
+        else:
+            coplanar_back.append(polygon)
+
+    def faces_front(self, polygon: 'BSPPolygon3') -> bool:
+        # The polygon has been measured coplanar. One lying on this plane or on its flip, by signature, faces the same
+        # way or the opposite way without the dot product of the normals.
+        key = polygon.plane.key
+        if key == self.key:
+            return True
+        if key == self.flipped_key:
+            return False
+        return self.normal.dot(polygon.plane.normal) > 0
+
+    def place_polygon(self, polygon: 'BSPPolygon3', polygon_type: int, types: List[int], distances: List[float],
+                      coplanar_front: List['BSPPolygon3'], coplanar_back: List['BSPPolygon3'],
+                      front: List['BSPPolygon3'], back: List['BSPPolygon3']) -> None:
+        if polygon_type == BSPPlane3.COPLANAR:
+            self.place_coplanar(polygon, coplanar_front, coplanar_back)
+        elif polygon_type == BSPPlane3.FRONT:
             front.append(polygon)
-        elif polygon_type == back_type:
+        elif polygon_type == BSPPlane3.BACK:
             back.append(polygon)
-        elif polygon_type == spanning_type:
-            f = []
-            b = []
+        else:
+            # Interpolate the crossing point of every spanning edge (i, j) on raw floats, reusing the signed distances
+            # from the classification: for polygons of a handful of vertices this beats any array or Vector3 arithmetic.
+            type_list = types
+            distance_list = distances
+            position_list = polygon.positions.tolist()
+            num_vertices = len(type_list)
+            crossings = []
+            # The rows of each half, as indices into the polygon's rows followed by the crossing rows: vertex i, then
+            # the crossing on edge (i, i + 1) if the edge spans the plane.
+            f_rows = []
+            b_rows = []
             for i in range(num_vertices):
-                j = (i + 1) % num_vertices
-                ti = types[i]
-                tj = types[j]
-                vi = polygon.vertices[i]
-                vj = polygon.vertices[j]
-                if ti != back_type:
-                    f.append(vi)
-                if ti != front_type:
-                    if ti != back_type:
-                        b.append(vi.clone())
-                    else:
-                        b.append(vi)
-                if (ti | tj) == spanning_type:
-                    t = (self.w - self.normal.dot(vi.pos)) / self.normal.dot(vj.pos.minus(vi.pos))
-                    v = vi.interpolate(vj, t)
-                    f.append(v)
-                    b.append(v.clone())
-            if len(f) >= 3:
-                front.append(BSPPolygon3(f, polygon.shared))
-            if len(b) >= 3:
-                back.append(BSPPolygon3(b, polygon.shared))
+                j = i + 1 if i + 1 < num_vertices else 0
+                ti = type_list[i]
+                if ti != BSPPlane3.BACK:
+                    f_rows.append(i)
+                if ti != BSPPlane3.FRONT:
+                    b_rows.append(i)
+                if (ti | type_list[j]) == BSPPlane3.SPANNING:
+                    di = distance_list[i]
+                    u = di / (di - distance_list[j])
+                    xi, yi, zi = position_list[i]
+                    xj, yj, zj = position_list[j]
+                    f_rows.append(num_vertices + len(crossings))
+                    b_rows.append(num_vertices + len(crossings))
+                    crossings.append((xi + u * (xj - xi), yi + u * (yj - yi), zi + u * (zj - zi), 1.0))
+            # The rows of both halves are gathered from the polygon's rows followed by the crossing rows, so neither
+            # half has to read its positions back out of its vertices.
+            rows = polygon.homogeneous_positions
+            if crossings:
+                rows = numpy.concatenate((rows, crossings))
+            vertices = polygon.vertices + [BSPVertex3(Vector3(x, y, z)) for x, y, z, _ in crossings]
+            if len(f_rows) >= 3:
+                front.append(BSPPolygon3([vertices[i] for i in f_rows], polygon.shared, rows[f_rows]))
+            if len(b_rows) >= 3:
+                back.append(BSPPolygon3([vertices[i] for i in b_rows], polygon.shared, rows[b_rows]))
 
     @staticmethod
     def from_points(a: Vector3, b: Vector3, c: Vector3) -> 'BSPPlane3':
-        n = b.minus(a).cross(c.minus(a)).unit()
-        return BSPPlane3(n, n.dot(a))
+        return BSPPlane3.from_coordinates(a.x, a.y, a.z, b.x, b.y, b.z, c.x, c.y, c.z)
+
+    @staticmethod
+    def from_positions(positions: numpy.ndarray) -> 'BSPPlane3':
+        (ax, ay, az), (bx, by, bz), (cx, cy, cz) = positions[:3, :3].tolist()
+        return BSPPlane3.from_coordinates(ax, ay, az, bx, by, bz, cx, cy, cz)
+
+    @staticmethod
+    def from_coordinates(ax: float, ay: float, az: float, bx: float, by: float, bz: float, cx: float, cy: float,
+                         cz: float) -> 'BSPPlane3':
+        # (b - a) x (c - a), normalized, on scalars rather than intermediate Vector3s.
+        ex, ey, ez = bx - ax, by - ay, bz - az
+        fx, fy, fz = cx - ax, cy - ay, cz - az
+        nx = ey * fz - ez * fy
+        ny = ez * fx - ex * fz
+        nz = ex * fy - ey * fx
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        nx, ny, nz = nx / length, ny / length, nz / length
+        return BSPPlane3(Vector3(nx, ny, nz), nx * ax + ny * ay + nz * az)
 
 
 class BSPPolygon3(object):
-    def __init__(self, vertices: List[BSPVertex3], shared: Any) -> None:
+    def __init__(self, vertices: List[BSPVertex3], shared: Any, homogeneous_positions: Optional[numpy.ndarray] = None,
+                 plane: Optional[BSPPlane3] = None) -> None:
         self.vertices = vertices
         self.shared = shared
-        self.plane = BSPPlane3.from_points(vertices[0].pos, vertices[1].pos, vertices[2].pos)
+        if homogeneous_positions is None:
+            homogeneous_positions = numpy.array([(v.pos.x, v.pos.y, v.pos.z, 1.0) for v in vertices],
+                                                dtype=numpy.float64)
+        self.homogeneous_positions = homogeneous_positions  # type: numpy.ndarray
+        self.positions = self.homogeneous_positions[:, :3]  # type: numpy.ndarray
+        if plane is None:
+            plane = BSPPlane3.from_positions(self.homogeneous_positions)
+        self.plane = plane  # type: BSPPlane3
 
     def clone(self) -> 'BSPPolygon3':
-        vertices = [v.clone() for v in self.vertices]
-        return BSPPolygon3(vertices, self.shared)
+        # The vertices and rows are never mutated in place, so only the vertex list and the plane, which flip mutates,
+        # are copied.
+        return BSPPolygon3(self.vertices[:], self.shared, self.homogeneous_positions, self.plane.clone())
 
     def flip(self) -> None:
+        # Vertices carry no normal, so BSPVertex3.flip is a no-op and only the winding needs reversing.
         self.vertices.reverse()
-        for vertex in self.vertices:
-            vertex.flip()
+        self.homogeneous_positions = self.homogeneous_positions[::-1]
+        self.positions = self.homogeneous_positions[:, :3]
         self.plane.flip()
 
 
@@ -317,75 +450,166 @@ class BSPNode3(object):
             self.build(polygons)
 
     def clone(self) -> 'BSPNode3':
-        node = BSPNode3()
-        if self.plane is not None:
-            node.plane = self.plane.clone()
-        if self.front is not None:
-            node.front = self.front.clone()
-        if self.back is not None:
-            node.back = self.back.clone()
-        node.polygons = [p.clone() for p in self.polygons]
-        return node
+        root = BSPNode3()
+        stack = [(self, root)]
+        while stack:
+            source, node = stack.pop()
+            if source.plane is not None:
+                node.plane = source.plane.clone()
+            if source.front is not None:
+                node.front = BSPNode3()
+                stack.append((source.front, node.front))
+            if source.back is not None:
+                node.back = BSPNode3()
+                stack.append((source.back, node.back))
+            node.polygons = [p.clone() for p in source.polygons]
+        return root
+
+    def nodes(self) -> List['BSPNode3']:
+        # Pre-order: the node, then its front subtree, then its back subtree.
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if node.back is not None:
+                stack.append(node.back)
+            if node.front is not None:
+                stack.append(node.front)
+        return nodes
 
     def invert(self) -> None:
-        for polygon in self.polygons:
-            polygon.flip()
-        if self.plane is not None:
-            self.plane.flip()
-        if self.front is not None:
-            self.front.invert()
-        if self.back is not None:
-            self.back.invert()
-        temp = self.front
-        self.front = self.back
-        self.back = temp
+        for node in self.nodes():
+            for polygon in node.polygons:
+                polygon.flip()
+            if node.plane is not None:
+                node.plane.flip()
+            node.front, node.back = node.back, node.front
 
     def clip_polygons(self, polygons: List[BSPPolygon3]) -> List[BSPPolygon3]:
+        return self.clip_polygon_lists([polygons])[0]
+
+    def clip_polygon_lists(self, polygon_lists: List[List[BSPPolygon3]]) -> List[List[BSPPolygon3]]:
+        # Clips each list of polygons independently, but breadth-first and all lists together: the rows of every
+        # polygon at one level of the tree are measured against the planes of their nodes in one product, then each
+        # polygon is sent to the front or back child of its node, split between them if it spans the plane. The
+        # polygons of a level are kept as flat lists rather than batched by node, so the bookkeeping is paid per polygon
+        # rather than per node and list. Polygons that reach an empty front child, or a node without a plane, are kept
+        # as they are, under the index of their list and the pre-order index from nodes() of that node, or of the
+        # parent of the empty front child, which comes before the parent's whole back subtree. Every node passes its
+        # polygons on in order, so a stable sort by both indices restores each list's front-then-back order.
         if self.plane is None:
-            return polygons[:]
-        front = []
-        back = []
-        for polygon in polygons:
-            self.plane.split_polygon(polygon, front, back, front, back)
-        if self.front is not None:
-            front = self.front.clip_polygons(front)
-        if self.back is not None:
-            back = self.back.clip_polygons(back)
-        else:
-            back = []
-        front.extend(back)
-        return front
+            return [polygons[:] for polygons in polygon_lists]
+        nodes = self.nodes()
+        order = {id(node): index for index, node in enumerate(nodes)}
+        planes = [node.plane for node in nodes]
+        front_of = [order.get(id(node.front), -1) for node in nodes]
+        back_of = [order.get(id(node.back), -1) for node in nodes]
+        equations = numpy.array([(0.0, 0.0, 0.0, 0.0) if plane is None else plane.equation for plane in planes])
+        kept_keys = []  # type: List[Tuple[int, int]]
+        kept = []  # type: List[BSPPolygon3]
+        level = [polygon for polygons in polygon_lists for polygon in polygons]
+        level_owners = [owner for owner, polygons in enumerate(polygon_lists) for _ in polygons]
+        level_nodes = [0] * len(level)
+        while level:
+            counts = [len(polygon.vertices) for polygon in level]
+            offsets = [0] * len(counts)
+            for i in range(1, len(counts)):
+                offsets[i] = offsets[i - 1] + counts[i - 1]
+            if len(level) < _BATCH_MIN_POLYGONS:
+                polygon_types = []
+                types = []
+                distances = []
+                for polygon, index in zip(level, level_nodes):
+                    polygon_type, polygon_vertex_types, polygon_distances = planes[index].measure(polygon)
+                    polygon_types.append(polygon_type)
+                    types.extend(polygon_vertex_types)
+                    distances.extend(polygon_distances)
+            else:
+                rows = numpy.concatenate([polygon.homogeneous_positions for polygon in level])
+                distance_array = numpy.einsum('ij,ij->i', rows, equations[numpy.repeat(level_nodes, counts)])
+                type_array = BSPPlane3.classify(distance_array)
+                polygon_types = numpy.bitwise_or.reduceat(type_array, offsets).tolist()
+                types = type_array.tolist()
+                distances = distance_array.tolist()
+            next_level = []  # type: List[BSPPolygon3]
+            next_owners = []  # type: List[int]
+            next_nodes = []  # type: List[int]
+            for polygon, owner, index, polygon_type, offset, count in zip(level, level_owners, level_nodes,
+                                                                          polygon_types, offsets, counts):
+                plane = planes[index]
+                if polygon_type == BSPPlane3.FRONT:
+                    fronts, backs = (polygon,), ()
+                elif polygon_type == BSPPlane3.BACK:
+                    fronts, backs = (), (polygon,)
+                elif polygon_type == BSPPlane3.COPLANAR:
+                    if plane.faces_front(polygon):
+                        fronts, backs = (polygon,), ()
+                    else:
+                        fronts, backs = (), (polygon,)
+                else:
+                    fronts, backs = [], []
+                    plane.place_polygon(polygon, polygon_type, types[offset:offset + count],
+                                        distances[offset:offset + count], fronts, backs, fronts, backs)
+                child = front_of[index]
+                for front in fronts:
+                    if child < 0:
+                        kept_keys.append((owner, index))
+                        kept.append(front)
+                    elif planes[child] is None:
+                        kept_keys.append((owner, child))
+                        kept.append(front)
+                    else:
+                        next_level.append(front)
+                        next_owners.append(owner)
+                        next_nodes.append(child)
+                child = back_of[index]
+                if child >= 0:
+                    for back in backs:
+                        if planes[child] is None:
+                            kept_keys.append((owner, child))
+                            kept.append(back)
+                        else:
+                            next_level.append(back)
+                            next_owners.append(owner)
+                            next_nodes.append(child)
+            level, level_owners, level_nodes = next_level, next_owners, next_nodes
+        results = [[] for _ in polygon_lists]  # type: List[List[BSPPolygon3]]
+        for i in sorted(range(len(kept)), key=kept_keys.__getitem__):
+            results[kept_keys[i][0]].append(kept[i])
+        return results
 
     def clip_to(self, bsp: 'BSPNode3') -> None:
-        self.polygons = bsp.clip_polygons(self.polygons)
-        if self.front is not None:
-            self.front.clip_to(bsp)
-        if self.back is not None:
-            self.back.clip_to(bsp)
+        # Every node's polygons are clipped against bsp independently of the other nodes, so all nodes are clipped as
+        # one batch.
+        nodes = self.nodes()
+        clipped = bsp.clip_polygon_lists([node.polygons for node in nodes])
+        for node, polygons in zip(nodes, clipped):
+            node.polygons = polygons
 
     def all_polygons(self) -> List[BSPPolygon3]:
-        polygons = self.polygons[:]
-        if self.front is not None:
-            polygons.extend(self.front.all_polygons())
-        if self.back is not None:
-            polygons.extend(self.back.all_polygons())
+        polygons = []
+        for node in self.nodes():
+            polygons.extend(node.polygons)
         return polygons
 
     def build(self, polygons: List[BSPPolygon3]) -> None:
-        if len(polygons) < 1:
-            return
-        if self.plane is None:
-            self.plane = polygons[0].plane.clone()
-        self.polygons.append(polygons[0])
-        front = []
-        back = []
-        for polygon in polygons[1:]:
-            self.plane.split_polygon(polygon, self.polygons, self.polygons, front, back)
-        if len(front) > 0:
-            if self.front is None:
-                self.front = BSPNode3()
-            self.front.build(front)
-        if len(back) > 0:
-            if self.back is None:
-                self.back = BSPNode3()
-            self.back.build(back)
+        stack = [(self, polygons)]
+        while stack:
+            node, polygons = stack.pop()
+            if len(polygons) < 1:
+                continue
+            if node.plane is None:
+                node.plane = polygons[0].plane.clone()
+            node.polygons.append(polygons[0])
+            front = []
+            back = []
+            node.plane.split_polygons(polygons[1:], node.polygons, node.polygons, front, back)
+            if len(front) > 0:
+                if node.front is None:
+                    node.front = BSPNode3()
+                stack.append((node.front, front))
+            if len(back) > 0:
+                if node.back is None:
+                    node.back = BSPNode3()
+                stack.append((node.back, back))
@@ -8,14 +8,19 @@ this method is not random.
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
+import math
 import random
 from typing import List, Tuple
 
+import numpy as np
+
 from ffg_geo.vector2 import Vector2
 
 
 class Generator:
     """A random Vector2 generator."""
+    __rng = np.random.default_rng()
+
     @staticmethod
     def seed(a: int = 0) -> None:
         """Seeds the generator.
@@ -23,6 +28,7 @@ class Generator:
         Args:
             a: The seed."""
         random.seed(a)
+        Generator.__rng = np.random.default_rng(a)
 
     @staticmethod
     def __make_square(x_min: float, x_max: float, y_min: float, y_max: float) -> Tuple[float, float, float, float]:
@@ -73,11 +79,8 @@ class Generator:
 
         Returns:
             A list of Vector2s."""
-        result = []
-        while len(result) < n:
-            v = Vector2(random.uniform(x_min, x_max), random.uniform(y_min, y_max))
-            result.append(v)
-        return result
+        points = Generator.__rng.uniform((x_min, y_min), (x_max, y_max), size=(max(n, 0), 2))
+        return [Vector2(x, y) for x, y in points.tolist()]
 
     @staticmethod
     def in_circle(n: int, x_min: float, x_max: float, y_min: float, y_max: float) -> List[Vector2]:
@@ -108,17 +111,18 @@ class Generator:
 
         Returns:
             A list of Vector2s."""
-        result = []
         r_x = abs(x_max - x_min) * 0.5
         r_y = abs(y_max - y_min) * 0.5
         x_center = (x_min + x_max) * 0.5
         y_center = (y_min + y_max) * 0.5
-        while len(result) < n:
-            v = Vector2(random.uniform(x_min, x_max), random.uniform(y_min, y_max))
-            if (((v[0] - x_center) ** 2) / (r_x ** 2)) + (((v[1] - y_center) ** 2) / (r_y ** 2)) > 1.0:
-                continue
-            result.append(v)
-        return result
+        # Area-preserving polar transform of the unit disk: taking the radius as sqrt(U) makes the points uniform over
+        # the disk, so no point has to be rejected.
+        u, v = Generator.__rng.random((2, max(n, 0)))
+        r = np.sqrt(u)
+        theta = 2.0 * math.pi * v
+        x = x_center + r_x * r * np.cos(theta)
+        y = y_center + r_y * r * np.sin(theta)
+        return [Vector2(x_, y_) for x_, y_ in zip(x.tolist(), y.tolist())]
 
     @staticmethod
     def on_axis(n: int, v_axis_min: float, v_axis_max: float, c_axis_val: float, v_axis: int,
@@ -170,47 +174,76 @@ class Generator:
 
         Returns:
             A list of Vector2s."""
-        if cuts < 1:
+        # Cut every region of the current level in half, level by level, keeping the leaf regions in the order the
+        # recursive definition visits them (lower before upper, left before right).
+        regions = [(x_min, x_max, y_min, y_max)]
+        for _ in range(cuts):
+            cut_regions = []
+            for x_min_, x_max_, y_min_, y_max_ in regions:
+                if axis == 0:
+                    # Cut on x axis.
+                    y_center = (y_min_ + y_max_) * 0.5
+                    cut_regions.append((x_min_, x_max_, y_min_, y_center))
+                    cut_regions.append((x_min_, x_max_, y_center, y_max_))
+                else:
+                    # Cut on y axis.
+                    x_center = (x_min_ + x_max_) * 0.5
+                    cut_regions.append((x_min_, x_center, y_min_, y_max_))
+                    cut_regions.append((x_center, x_max_, y_min_, y_max_))
+            regions = cut_regions
+            if alternate:
+                axis = 1 - axis
+        if method in ('s', 'h', 'v', 'c', 'e', 'o'):
             if method == 's':
-                # Square.
-                return Generator.in_square(n, x_min, x_max, y_min, y_max)
-            elif method == 'h':
-                # Horizontal line.
-                return Generator.on_axis(n, x_min, x_max, (y_min + y_max) * 0.5, 0, False)
-            elif method == 'v':
-                # Vertical line.
-                return Generator.on_axis(n, y_min, y_max, (x_min + x_max) * 0.5, 1, False)
-            elif method == 'c':
-                # Circle.
-                return Generator.in_circle(n, x_min, x_max, y_min, y_max)
-            elif method == 'e':
-                # Ellipse.
-                return Generator.in_ellipse(n, x_min, x_max, y_min, y_max)
-            elif method == 'o':
-                # On exact center.
-                x_center = (x_min + x_max) * 0.5
-                y_center = (y_min + y_max) * 0.5
-                return [Vector2(x_center, y_center) for _ in range(n)]
+                # Squares.
+                regions = [Generator.__make_square(*region) for region in regions]
             else:
-                # Rectangle.
-                return Generator.in_rect(n, x_min, x_max, y_min, y_max)
-        # Determine next axis.
-        if alternate:
-            n_axis = 1 - axis
-        else:
-            n_axis = axis
-        # Perform recursive cuts.
-        if axis == 0:
-            # Cut on x axis.
+                result = []
+                for region in regions:
+                    result.extend(Generator.__in_region(n, method, *region))
+                return result
+        # Rectangles (or squares), all generated at once.
+        bounds = np.array(regions, dtype=np.float64).reshape(-1, 4)
+        points = Generator.__rng.uniform(bounds[:, np.newaxis, 0::2], bounds[:, np.newaxis, 1::2],
+                                         size=(len(regions), max(n, 0), 2))
+        return [Vector2(x, y) for x, y in points.reshape(-1, 2).tolist()]
+
+    @staticmethod
+    def __in_region(n: int, method: str, x_min: float, x_max: float, y_min: float, y_max: float) -> List[Vector2]:
+        """Generates n random Vector2s in a single leaf region of in_regional_cut using the specified method.
+
+        Args:
+            n: The number of Vector2s to randomly generate.
+            method: The method to use to generate points.
+            x_min: The minimum x value of the region.
+            x_max: The maximum x value of the region.
+            y_min: The minimum y value of the region.
+            y_max: The maximum y value of the region.
+
+        Returns:
+            A list of Vector2s."""
+        if method == 's':
+            # Square.
+            return Generator.in_square(n, x_min, x_max, y_min, y_max)
+        elif method == 'h':
+            # Horizontal line.
+            return Generator.on_axis(n, x_min, x_max, (y_min + y_max) * 0.5, 0, False)
+        elif method == 'v':
+            # Vertical line.
+            return Generator.on_axis(n, y_min, y_max, (x_min + x_max) * 0.5, 1, False)
+        elif method == 'c':
+            # Circle.
+            return Generator.in_circle(n, x_min, x_max, y_min, y_max)
+        elif method == 'e':
+            # Ellipse.
+            return Generator.in_ellipse(n, x_min, x_max, y_min, y_max)
+        elif method == 'o':
+            # On exact center.
+            x_center = (x_min + x_max) * 0.5
             y_center = (y_min + y_max) * 0.5
-            lower = Generator.in_regional_cut(n, cuts - 1, n_axis, alternate, x_min, x_max, y_min, y_center, method)
-            upper = Generator.in_regional_cut(n, cuts - 1, n_axis, alternate, x_min, x_max, y_center, y_max, method)
-            return lower + upper
-        # Cut on y axis.
-        x_center = (x_min + x_max) * 0.5
-        left = Generator.in_regional_cut(n, cuts - 1, n_axis, alternate, x_min, x_center, y_min, y_max, method)
-        right = Generator.in_regional_cut(n, cuts - 1, n_axis, alternate, x_center, x_max, y_min, y_max, method)
-        return left + right
+            return [Vector2(x_center, y_center) for _ in range(n)]
+        # Rectangle.
+        return Generator.in_rect(n, x_min, x_max, y_min, y_max)
 
     @staticmethod
     def duplicate(vertices: List[Vector2], min_duplicates: int, max_duplicates: int) -> List[Vector2]:
@@ -227,14 +260,12 @@ class Generator:
 
         Returns:
             A shuffled list of duplicate vertices."""
-        result = []
-        for vertex in vertices:
-            num_duplicates = random.randrange(min_duplicates, max_duplicates + 1)
-            for _ in range(num_duplicates + 1):
-                new_vertex = Vector2(vertex[0], vertex[1])
-                result.append(new_vertex)
-        random.shuffle(result)
-        return result
+        # Draw every vertex's count at once, repeat the coordinate rows by their counts, and shuffle the rows.
+        counts = Generator.__rng.integers(min_duplicates, max_duplicates + 1, size=len(vertices)) + 1
+        coordinates = np.array([(vertex[0], vertex[1]) for vertex in vertices], dtype=np.float64).reshape(-1, 2)
+        duplicates = np.repeat(coordinates, counts, axis=0)
+        Generator.__rng.shuffle(duplicates, axis=0)
+        return [Vector2(x, y) for x, y in duplicates.tolist()]
 
     @staticmethod
     def in_grid(x_min: float, x_max: float, y_min: float, y_max: float, x_div: int, y_div: int) -> List[Vector2]:
@@ -250,14 +281,7 @@ class Generator:
 
         Returns:
             A list of vertices."""
-        result = []
-        x_div = min(x_div, 1)
-        y_div = min(y_div, 1)
-        x_step = (x_max - x_min) / x_div
-        y_step = (y_max - y_min) / y_div
-        for x_factor in range(x_div + 1):
-            x = x_step * x_factor + x_min
-            for y_factor in range(y_div + 1):
-                y = y_step * y_factor + y_min
-                result.append(Vector2(x, y))
-        return result
+        x_div = max(x_div, 1)
+        y_div = max(y_div, 1)
+        x, y = np.meshgrid(np.linspace(x_min, x_max, x_div + 1), np.linspace(y_min, y_max, y_div + 1), indexing='ij')
+        return [Vector2(x_, y_) for x_, y_ in zip(x.ravel().tolist(), y.ravel().tolist())]
@@ -8,6 +8,10 @@ License:
 
 from typing import List, Optional
 
+import numpy as np
+
+from .ifs3 import IFS3
+from .soa import NO_INDEX, ElementList, column, grow, position_column, reserve
 from .vector3 import Vector3
 
 
@@ -18,6 +22,8 @@ class HEDSHalfEdge3(object):
         source: The index of the source vertex for the half-edge.
         face: The index of the face adjacent to the half-edge.
         successor: The index of the successor half-edge to the half-edge."""
+    __slots__ = ('source', 'face', 'successor')
+
     def __init__(self, source: int, face: int, successor: int) -> None:
         """Initializes the HEDSHalfEdge3.
 
@@ -36,14 +42,18 @@ class HEDSVertex3(object):
     Attributes:
         position: The position vector of the vertex.
         in_halfedge: The index of an arbitrary half-edge going into the vertex.
-        data: Optional data index, used for associating vertices with data external to the HEDS."""
-    def __init__(self, position: Vector3, in_halfedge: int, data: Optional[int] = None) -> None:
+        data: Data index, used for associating vertices with data external to the HEDS. NO_INDEX (-1) if there
+            is none."""
+    __slots__ = ('position', 'in_halfedge', 'data')
+
+    def __init__(self, position: Vector3, in_halfedge: int, data: int = NO_INDEX) -> None:
         """Initializes the HEDSVertex3.
 
         Args:
             position: The position vector of the vertex.
             in_halfedge: The index of an arbitrary half-edge going into the vertex.
-            data: Optional data index, used for associating vertices with data external to the HEDS."""
+            data: Data index, used for associating vertices with data external to the HEDS. NO_INDEX (-1) if there
+                is none."""
         self.position = position
         self.in_halfedge = in_halfedge
         self.data = data
@@ -54,15 +64,19 @@ class HEDSFace3(object):
 
     Attributes:
         halfedge: The index of an arbitrary half-edge on the boundary of the face.
-        hole: Optional index of the first hole in the list of holes in this face. None if there are no holes.
-        data: Optional data index, used for associating faces with data external to the HEDS."""
-    def __init__(self, halfedge: int, hole: Optional[int] = None, data: Optional[int] = None) -> None:
+        hole: Index of the first hole in the list of holes in this face. NO_INDEX (-1) if there are no holes.
+        data: Data index, used for associating faces with data external to the HEDS. NO_INDEX (-1) if there
+            is none."""
+    __slots__ = ('halfedge', 'hole', 'data')
+
+    def __init__(self, halfedge: int, hole: int = NO_INDEX, data: int = NO_INDEX) -> None:
         """Initializes the HEDSFace3.
 
         Args:
             halfedge: The index of an arbitrary half-edge on the boundary of the face.
-            hole: Optional index of the first hole in the list of holes in this face. None if there are no holes.
-            data: Optional data index, used for associating faces with data external to the HEDS."""
+            hole: Index of the first hole in the list of holes in this face. NO_INDEX (-1) if there are no holes.
+            data: Data index, used for associating faces with data external to the HEDS. NO_INDEX (-1) if there
+                is none."""
         self.halfedge = halfedge
         self.hole = hole
         self.data = data
@@ -73,34 +87,115 @@ class HEDSHole3(object):
 
     Attributes:
         halfedge: The index of an arbitrary half-edge ont he boundary of the face.
-        successor: Optional index of the successor hole to this hole. None if there is no successor to this hole."""
-    def __init__(self, halfedge: int, successor: Optional[int] = None) -> None:
+        successor: Index of the successor hole to this hole. NO_INDEX (-1) if there is no successor to this hole."""
+    __slots__ = ('halfedge', 'successor')
+
+    def __init__(self, halfedge: int, successor: int = NO_INDEX) -> None:
         """Initializes the HEDSHole3.
 
         Args:
             halfedge: The index of an arbitrary half-edge ont he boundary of the face.
-            successor: Optional index of the successor hole to this hole. None if there is no successor to this hole."""
+            successor: Index of the successor hole to this hole. NO_INDEX (-1) if there is no successor to this hole."""
         self.halfedge = halfedge
         self.successor = successor
 
 
+class _HEDSHalfEdgeView3(HEDSHalfEdge3):
+    """Half-edge of a HEDS3 that reads and writes the HEDS's arrays."""
+    __slots__ = ('mesh', 'index')
+    source = column('he_source')
+    face = column('he_face')
+    successor = column('he_successor')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'HEDS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+
+class _HEDSVertexView3(HEDSVertex3):
+    """Vertex of a HEDS3 that reads and writes the HEDS's arrays."""
+    __slots__ = ('mesh', 'index')
+    position = position_column('v_pos')
+    in_halfedge = column('v_in_he')
+    data = column('v_data')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'HEDS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+
+class _HEDSFaceView3(HEDSFace3):
+    """Face of a HEDS3 that reads and writes the HEDS's arrays."""
+    __slots__ = ('mesh', 'index')
+    halfedge = column('f_halfedge')
+    hole = column('f_hole')
+    data = column('f_data')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'HEDS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+
+class _HEDSHoleView3(HEDSHole3):
+    """Hole of a HEDS3 that reads and writes the HEDS's arrays."""
+    __slots__ = ('mesh', 'index')
+    halfedge = column('hole_halfedge')
+    successor = column('hole_successor')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'HEDS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+
 class HEDS3(object):
-    """Half-edge data structure mesh representation.
+    """Half-edge data structure mesh representation, stored as arrays rather than as one object per element.
+
+    The arrays have spare capacity: only their first num_halfedges, num_vertices, num_faces, or num_holes entries are
+    meaningful. Absent indices and data indices are NO_INDEX (-1), as in the element classes. Removed half-edges and
+    holes leave their slot in place, marked by a source or half-edge of NO_INDEX, and the slot is reused by the next
+    addition.
+
+    The halfedges, vertices, faces, and holes attributes present the same elements as lists of element objects that
+    read and write the arrays, and assigning a list to one of them replaces the elements of that kind.
 
     Attributes:
-        halfedges: List of HEDSHalfEdge3 half-edges.
-        vertices: List of HEDSVertex3 vertices.
-        faces: List of HEDSFace3 faces.
-        holes: List of HEDSHole3 holes."""
+        halfedges: The half-edges, as HEDSHalfEdge3 that read and write the arrays.
+        vertices: The vertices, as HEDSVertex3 that read and write the arrays.
+        faces: The faces, as HEDSFace3 that read and write the arrays.
+        holes: The holes, as HEDSHole3 that read and write the arrays.
+        he_source: int32 array of the index of the source vertex of each half-edge.
+        he_face: int32 array of the index of the face adjacent to each half-edge.
+        he_successor: int32 array of the index of the successor half-edge of each half-edge.
+        v_pos: (capacity, 3) float64 array of vertex positions.
+        v_in_he: int32 array of the index of an arbitrary half-edge going into each vertex.
+        v_data: int32 array of vertex data indices.
+        f_halfedge: int32 array of the index of an arbitrary half-edge on the boundary of each face.
+        f_hole: int32 array of the index of the first hole of each face.
+        f_data: int32 array of face data indices.
+        hole_halfedge: int32 array of the index of an arbitrary half-edge on the boundary of each hole.
+        hole_successor: int32 array of the index of the successor hole of each hole.
+        num_halfedges: The number of half-edge slots, including removed ones.
+        num_vertices: The number of vertices.
+        num_faces: The number of faces.
+        num_holes: The number of hole slots, including removed ones."""
     def __init__(self, halfedges: Optional[List[HEDSHalfEdge3]] = None, vertices: Optional[List[HEDSVertex3]] = None,
-                 faces: Optional[List[HEDSFace3]] = None, holes: Optional[List[HEDSHole3]] = None) -> None:
+                 faces: Optional[List[HEDSFace3]] = None, holes: Optional[List[HEDSHole3]] = None, n_halfedges: int = 0,
+                 n_vertices: int = 0, n_faces: int = 0, n_holes: int = 0) -> None:
         """Initializes the HEDS3.
 
         Args:
             halfedges: List of HEDSHalfEdge3 half-edges.
             vertices: List of HEDSVertex3 vertices.
             faces: List of HEDSFace3 faces.
-            holes: List of HEDSHole3 holes."""
+            holes: List of HEDSHole3 holes.
+            n_halfedges: Capacity hint: the number of half-edges to allocate room for up front.
+            n_vertices: Capacity hint: the number of vertices to allocate room for up front.
+            n_faces: Capacity hint: the number of faces to allocate room for up front.
+            n_holes: Capacity hint: the number of holes to allocate room for up front."""
         if halfedges is None:
             halfedges = []
         if vertices is None:
@@ -109,7 +204,306 @@ class HEDS3(object):
             faces = []
         if holes is None:
             holes = []
-        self.halfedges = halfedges  # type: List[HEDSHalfEdge3]
-        self.vertices = vertices  # type: List[HEDSVertex3]
-        self.faces = faces  # type: List[HEDSFace3]
-        self.holes = holes  # type: List[HEDSHole3]
+        self.halfedges = halfedges
+        self.vertices = vertices
+        self.faces = faces
+        self.holes = holes
+        self.he_source = reserve(self.he_source, n_halfedges)
+        self.he_face = reserve(self.he_face, n_halfedges)
+        self.he_successor = reserve(self.he_successor, n_halfedges)
+        self.v_pos = reserve(self.v_pos, n_vertices)
+        self.v_in_he = reserve(self.v_in_he, n_vertices)
+        self.v_data = reserve(self.v_data, n_vertices)
+        self.f_halfedge = reserve(self.f_halfedge, n_faces)
+        self.f_hole = reserve(self.f_hole, n_faces)
+        self.f_data = reserve(self.f_data, n_faces)
+        self.hole_halfedge = reserve(self.hole_halfedge, n_holes)
+        self.hole_successor = reserve(self.hole_successor, n_holes)
+
+    @classmethod
+    def from_ifs3(cls, ifs: IFS3) -> 'HEDS3':
+        """Makes a HEDS of an IFS in bulk, filling each array in a few vectorized stores rather than adding its elements
+        one at a time. Removed triangles are skipped. Face i is the i-th remaining triangle, with half-edges 3i, 3i + 1,
+        and 3i + 2 leaving its vertices 0, 1, and 2.
+
+        Args:
+            ifs: The IFS.
+
+        Returns:
+            The HEDS."""
+        triangles = ifs.triangle_vertices[:ifs.num_triangles]
+        live = triangles[:, 0] != NO_INDEX
+        triangles = triangles[live]
+        num_faces = len(triangles)
+        heds = cls()
+        heds.he_source = triangles.reshape(-1).astype(np.int32)
+        heds.he_face = np.repeat(np.arange(num_faces, dtype=np.int32), 3)
+        heds.he_successor = np.arange(1, 3 * num_faces + 1, dtype=np.int32)
+        heds.he_successor[2::3] -= 3
+        heds.v_pos = ifs.positions[:ifs.num_vertices].copy()
+        heds.v_in_he = np.full(ifs.num_vertices, NO_INDEX, dtype=np.int32)
+        # Half-edge h goes into the source of its successor.
+        heds.v_in_he[heds.he_source[heds.he_successor]] = np.arange(3 * num_faces, dtype=np.int32)
+        heds.v_data = ifs.vertex_data[:ifs.num_vertices].copy()
+        heds.f_halfedge = np.arange(0, 3 * num_faces, 3, dtype=np.int32)
+        heds.f_hole = np.full(num_faces, NO_INDEX, dtype=np.int32)
+        heds.f_data = ifs.triangle_data[:ifs.num_triangles][live].astype(np.int32)
+        heds.num_halfedges = 3 * num_faces
+        heds.num_vertices = ifs.num_vertices
+        heds.num_faces = num_faces
+        return heds
+
+    def add_halfedge(self, source: int, face: int, successor: int) -> int:
+        """Adds a half-edge in the slot of a removed half-edge if there is one, otherwise appends it, growing the
+        half-edge arrays geometrically when they are full.
+
+        Args:
+            source: The index of the source vertex for the half-edge.
+            face: The index of the face adjacent to the half-edge.
+            successor: The index of the successor half-edge to the half-edge.
+
+        Returns:
+            The index of the half-edge."""
+        if not self.__free_halfedges:
+            return self.__append_halfedge(source, face, successor)
+        index = self.__free_halfedges.pop()
+        self.he_source[index] = source
+        self.he_face[index] = face
+        self.he_successor[index] = successor
+        return index
+
+    def __append_halfedge(self, source: int, face: int, successor: int) -> int:
+        """Appends a half-edge after the last, even if there is a slot of a removed half-edge, growing the half-edge
+        arrays geometrically when they are full.
+
+        Args:
+            source: The index of the source vertex for the half-edge.
+            face: The index of the face adjacent to the half-edge.
+            successor: The index of the successor half-edge to the half-edge.
+
+        Returns:
+            The index of the half-edge."""
+        index = self.num_halfedges
+        self.he_source = grow(self.he_source, index + 1)
+        self.he_face = grow(self.he_face, index + 1)
+        self.he_successor = grow(self.he_successor, index + 1)
+        self.he_source[index] = source
+        self.he_face[index] = face
+        self.he_successor[index] = successor
+        self.num_halfedges = index + 1
+        return index
+
+    def remove_halfedge(self, index: int) -> None:
+        """Removes a half-edge, marking its slot for reuse. Elements referring to it must be updated by the caller.
+
+        Args:
+            index: The index of the half-edge."""
+        self.he_source[index] = NO_INDEX
+        self.__free_halfedges.append(index)
+
+    def add_vertex(self, position: Vector3, in_halfedge: int, data: int = NO_INDEX) -> int:
+        """Appends a vertex, growing the vertex arrays geometrically when they are full.
+
+        Args:
+            position: The position vector of the vertex.
+            in_halfedge: The index of an arbitrary half-edge going into the vertex.
+            data: Data index, used for associating the vertex with data external to the HEDS. NO_INDEX (-1) if there is
+                none.
+
+        Returns:
+            The index of the vertex."""
+        index = self.num_vertices
+        self.v_pos = grow(self.v_pos, index + 1)
+        self.v_in_he = grow(self.v_in_he, index + 1)
+        self.v_data = grow(self.v_data, index + 1)
+        self.v_pos[index] = (position.x, position.y, position.z)
+        self.v_in_he[index] = in_halfedge
+        self.v_data[index] = data
+        self.num_vertices = index + 1
+        return index
+
+    def add_face(self, halfedge: int, hole: int = NO_INDEX, data: int = NO_INDEX) -> int:
+        """Appends a face, growing the face arrays geometrically when they are full.
+
+        Args:
+            halfedge: The index of an arbitrary half-edge on the boundary of the face.
+            hole: Index of the first hole in the list of holes in this face. NO_INDEX (-1) if there are no holes.
+            data: Data index, used for associating the face with data external to the HEDS. NO_INDEX (-1) if there is
+                none.
+
+        Returns:
+            The index of the face."""
+        index = self.num_faces
+        self.f_halfedge = grow(self.f_halfedge, index + 1)
+        self.f_hole = grow(self.f_hole, index + 1)
+        self.f_data = grow(self.f_data, index + 1)
+        self.f_halfedge[index] = halfedge
+        self.f_hole[index] = hole
+        self.f_data[index] = data
+        self.num_faces = index + 1
+        return index
+
+    def add_hole(self, halfedge: int, successor: int = NO_INDEX) -> int:
+        """Adds a hole in the slot of a removed hole if there is one, otherwise appends it, growing the hole arrays
+        geometrically when they are full.
+
+        Args:
+            halfedge: The index of an arbitrary half-edge on the boundary of the hole.
+            successor: Index of the successor hole to this hole. NO_INDEX (-1) if there is no successor to this hole.
+
+        Returns:
+            The index of the hole."""
+        if not self.__free_holes:
+            return self.__append_hole(halfedge, successor)
+        index = self.__free_holes.pop()
+        self.hole_halfedge[index] = halfedge
+        self.hole_successor[index] = successor
+        return index
+
+    def __append_hole(self, halfedge: int, successor: int = NO_INDEX) -> int:
+        """Appends a hole after the last, even if there is a slot of a removed hole, growing the hole arrays
+        geometrically when they are full.
+
+        Args:
+            halfedge: The index of an arbitrary half-edge on the boundary of the hole.
+            successor: Index of the successor hole to this hole. NO_INDEX (-1) if there is no successor to this hole.
+
+        Returns:
+            The index of the hole."""
+        index = self.num_holes
+        self.hole_halfedge = grow(self.hole_halfedge, index + 1)
+        self.hole_successor = grow(self.hole_successor, index + 1)
+        self.hole_halfedge[index] = halfedge
+        self.hole_successor[index] = successor
+        self.num_holes = index + 1
+        return index
+
+    def remove_hole(self, index: int) -> None:
+        """Removes a hole, marking its slot for reuse. Other elements referring to it must be updated by the caller.
+
+        Args:
+            index: The index of the hole."""
+        self.hole_halfedge[index] = NO_INDEX
+        self.__free_holes.append(index)
+
+    def halfedge(self, index: int) -> HEDSHalfEdge3:
+        """Gets a half-edge as an HEDSHalfEdge3. The HEDSHalfEdge3 is a copy: changing it does not change the HEDS.
+
+        Args:
+            index: The index of the half-edge.
+
+        Returns:
+            The half-edge."""
+        return HEDSHalfEdge3(int(self.he_source[index]), int(self.he_face[index]), int(self.he_successor[index]))
+
+    def vertex(self, index: int) -> HEDSVertex3:
+        """Gets a vertex as an HEDSVertex3. The HEDSVertex3 is a copy: changing it does not change the HEDS.
+
+        Args:
+            index: The index of the vertex.
+
+        Returns:
+            The vertex."""
+        x, y, z = self.v_pos[index].tolist()
+        return HEDSVertex3(Vector3(x, y, z), int(self.v_in_he[index]), int(self.v_data[index]))
+
+    def face(self, index: int) -> HEDSFace3:
+        """Gets a face as an HEDSFace3. The HEDSFace3 is a copy: changing it does not change the HEDS.
+
+        Args:
+            index: The index of the face.
+
+        Returns:
+            The face."""
+        return HEDSFace3(int(self.f_halfedge[index]), int(self.f_hole[index]), int(self.f_data[index]))
+
+    def hole(self, index: int) -> HEDSHole3:
+        """Gets a hole as an HEDSHole3. The HEDSHole3 is a copy: changing it does not change the HEDS.
+
+        Args:
+            index: The index of the hole.
+
+        Returns:
+            The hole."""
+        return HEDSHole3(int(self.hole_halfedge[index]), int(self.hole_successor[index]))
+
+    @property
+    def halfedges(self) -> ElementList:
+        """The half-edges, as HEDSHalfEdge3 that read and write the arrays. Assigning a list of HEDSHalfEdge3 replaces
+        them."""
+        return ElementList(lambda: self.num_halfedges, lambda index: _HEDSHalfEdgeView3(self, index),
+                           self.__store_halfedge, lambda h: self.__append_halfedge(h.source, h.face, h.successor))
+
+    @halfedges.setter
+    def halfedges(self, halfedges: List[HEDSHalfEdge3]) -> None:
+        source = np.array([h.source for h in halfedges], dtype=np.int32)
+        face = np.array([h.face for h in halfedges], dtype=np.int32)
+        successor = np.array([h.successor for h in halfedges], dtype=np.int32)
+        self.he_source = source  # type: np.ndarray
+        self.he_face = face  # type: np.ndarray
+        self.he_successor = successor  # type: np.ndarray
+        self.num_halfedges = len(source)
+        self.__free_halfedges = np.flatnonzero(source == NO_INDEX).tolist()  # type: List[int]
+
+    def __store_halfedge(self, index: int, halfedge: HEDSHalfEdge3) -> None:
+        self.he_source[index], self.he_face[index], self.he_successor[index] = \
+            halfedge.source, halfedge.face, halfedge.successor
+
+    @property
+    def vertices(self) -> ElementList:
+        """The vertices, as HEDSVertex3 that read and write the arrays. Assigning a list of HEDSVertex3 replaces
+        them."""
+        return ElementList(lambda: self.num_vertices, lambda index: _HEDSVertexView3(self, index),
+                           self.__store_vertex, lambda v: self.add_vertex(v.position, v.in_halfedge, v.data))
+
+    @vertices.setter
+    def vertices(self, vertices: List[HEDSVertex3]) -> None:
+        pos = np.array([(v.position.x, v.position.y, v.position.z) for v in vertices], dtype=np.float64).reshape(-1, 3)
+        in_he = np.array([v.in_halfedge for v in vertices], dtype=np.int32)
+        data = np.array([v.data for v in vertices], dtype=np.int32)
+        self.v_pos = pos  # type: np.ndarray
+        self.v_in_he = in_he  # type: np.ndarray
+        self.v_data = data  # type: np.ndarray
+        self.num_vertices = len(pos)
+
+    def __store_vertex(self, index: int, vertex: HEDSVertex3) -> None:
+        position = vertex.position
+        self.v_pos[index] = (position.x, position.y, position.z)
+        self.v_in_he[index], self.v_data[index] = vertex.in_halfedge, vertex.data
+
+    @property
+    def faces(self) -> ElementList:
+        """The faces, as HEDSFace3 that read and write the arrays. Assigning a list of HEDSFace3 replaces them."""
+        return ElementList(lambda: self.num_faces, lambda index: _HEDSFaceView3(self, index), self.__store_face,
+                           lambda f: self.add_face(f.halfedge, f.hole, f.data))
+
+    @faces.setter
+    def faces(self, faces: List[HEDSFace3]) -> None:
+        halfedge = np.array([f.halfedge for f in faces], dtype=np.int32)
+        hole = np.array([f.hole for f in faces], dtype=np.int32)
+        data = np.array([f.data for f in faces], dtype=np.int32)
+        self.f_halfedge = halfedge  # type: np.ndarray
+        self.f_hole = hole  # type: np.ndarray
+        self.f_data = data  # type: np.ndarray
+        self.num_faces = len(halfedge)
+
+    def __store_face(self, index: int, face: HEDSFace3) -> None:
+        self.f_halfedge[index], self.f_hole[index], self.f_data[index] = face.halfedge, face.hole, face.data
+
+    @property
+    def holes(self) -> ElementList:
+        """The holes, as HEDSHole3 that read and write the arrays. Assigning a list of HEDSHole3 replaces them."""
+        return ElementList(lambda: self.num_holes, lambda index: _HEDSHoleView3(self, index), self.__store_hole,
+                           lambda h: self.__append_hole(h.halfedge, h.successor))
+
+    @holes.setter
+    def holes(self, holes: List[HEDSHole3]) -> None:
+        halfedge = np.array([h.halfedge for h in holes], dtype=np.int32)
+        successor = np.array([h.successor for h in holes], dtype=np.int32)
+        self.hole_halfedge = halfedge  # type: np.ndarray
+        self.hole_successor = successor  # type: np.ndarray
+        self.num_holes = len(halfedge)
+        self.__free_holes = np.flatnonzero(halfedge == NO_INDEX).tolist()  # type: List[int]
+
+    def __store_hole(self, index: int, hole: HEDSHole3) -> None:
+        self.hole_halfedge[index], self.hole_successor[index] = hole.halfedge, hole.successor
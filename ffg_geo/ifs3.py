@@ -6,23 +6,34 @@ Indexed face set (IFS) representation of a mesh in 3D.
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
-from typing import Iterable, List, Optional
+from itertools import islice
+from typing import Any, Iterable, List, Optional, TYPE_CHECKING
 
+import numpy as np
+
+from .soa import NO_INDEX, ElementList, column, grow, position_column, reserve
 from .vector3 import Vector3
 
+if TYPE_CHECKING:
+    from .heds3 import HEDS3
+
 
 class IFSVertex3(object):
     """Vertex in an indexed face set.
 
     Attributes:
         position: Vector position of the vertex.
-        data: Optional data index, used for associating vertices with data external to the IFS."""
-    def __init__(self, position: Vector3, data: Optional[int] = None) -> None:
+        data: Data index, used for associating vertices with data external to the IFS. NO_INDEX (-1) if there
+            is none."""
+    __slots__ = ('position', 'data')
+
+    def __init__(self, position: Vector3, data: int = NO_INDEX) -> None:
         """Initializes the IFSVertex3.
 
         Args:
             position: Vector position of the vertex.
-            data: Optional data index, used for associating vertices with data external to the IFS."""
+            data: Data index, used for associating vertices with data external to the IFS. NO_INDEX (-1) if there
+                is none."""
         self.position = position
         self.data = data
 
@@ -32,33 +43,291 @@ class IFSTriangle3(object):
 
     Attributes:
         vertices: Indices of the vertices. Counter-clockwise order.
-        data: Optional data index, used for associating triangles with data external to the IFS."""
-    def __init__(self, vertices: Iterable[int], data: Optional[int] = None) -> None:
+        data: Data index, used for associating triangles with data external to the IFS. NO_INDEX (-1) if there
+            is none."""
+    __slots__ = ('vertices', 'data')
+
+    def __init__(self, vertices: Iterable[int], data: int = NO_INDEX) -> None:
         """Initializes the IFSTriangle3.
 
         Args:
             vertices: Indices of the vertices. Counter-clockwise order.
-            data: Optional data index, used for associating triangles with data external to the IFS."""
-        self.vertices = [value for value in vertices[:3]]
+            data: Data index, used for associating triangles with data external to the IFS. NO_INDEX (-1) if there
+                is none."""
+        self.vertices = list(islice(vertices, 3))
         self.data = data
 
 
+class _IFSVertexView3(IFSVertex3):
+    """Vertex of an IFS3 that reads and writes the IFS's arrays."""
+    __slots__ = ('mesh', 'index')
+    position = position_column('positions')
+    data = column('vertex_data')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'IFS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+
+class _IFSTriangleVertices3(list):
+    """Indices of the vertices of a triangle of an IFS3, as a list that writes the IFS's arrays when an index is
+    assigned."""
+    def __init__(self, mesh: 'IFS3', index: int) -> None:
+        super().__init__(mesh.triangle_vertices[index].tolist())
+        self.__mesh = mesh
+        self.__index = index
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.__mesh.set_triangle_vertices(self.__index, self)
+
+
+class _IFSTriangleView3(IFSTriangle3):
+    """Triangle of an IFS3 that reads and writes the IFS's arrays."""
+    __slots__ = ('mesh', 'index')
+    data = column('triangle_data')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mesh: 'IFS3', index: int) -> None:
+        self.mesh = mesh
+        self.index = index
+
+    @property
+    def vertices(self) -> List[int]:
+        return _IFSTriangleVertices3(self.mesh, self.index)
+
+    @vertices.setter
+    def vertices(self, vertices: Iterable[int]) -> None:
+        self.mesh.set_triangle_vertices(self.index, vertices)
+
+
 class IFS3(object):
-    """IFS mesh representation.
+    """IFS mesh representation, stored as arrays rather than as one object per vertex and triangle.
+
+    The arrays have spare capacity: only their first num_vertices or num_triangles rows are meaningful. Absent data
+    indices are NO_INDEX (-1), as in the element classes. Removed triangles leave their slot in place, marked by
+    vertices of NO_INDEX, and the slot is reused by the next addition.
+
+    The vertices and triangles attributes present the same elements as lists of element objects that read and write the
+    arrays, and assigning a list to one of them replaces the elements of that kind.
 
     Attributes:
-        vertices: List of IFSVertex3 vertices.
-        triangles: List of IFSTriangle3 triangles."""
-    def __init__(self, vertices: Optional[List[IFSVertex3]] = None, triangles: Optional[List[IFSTriangle3]] = None) -> \
-            None:
+        vertices: The vertices, as IFSVertex3 that read and write the arrays.
+        triangles: The triangles, as IFSTriangle3 that read and write the arrays.
+        positions: (capacity, 3) float64 array of vertex positions.
+        vertex_data: int32 array of vertex data indices.
+        triangle_vertices: (capacity, 3) int32 array of the indices of the vertices of each triangle. Counter-clockwise
+            order.
+        triangle_xor: int32 array of the exclusive or of the indices of the vertices of each triangle, from which the
+            third vertex of a triangle can be recovered given the other two.
+        triangle_data: int32 array of triangle data indices.
+        num_vertices: The number of vertices.
+        num_triangles: The number of triangle slots, including removed ones."""
+    def __init__(self, vertices: Optional[List[IFSVertex3]] = None, triangles: Optional[List[IFSTriangle3]] = None,
+                 n_vertices: int = 0, n_triangles: int = 0) -> None:
         """Initializes the IFS3.
 
         Args:
             vertices: List of IFSVertex3 vertices.
-            triangles: List of IFSTriangle3 triangles."""
+            triangles: List of IFSTriangle3 triangles.
+            n_vertices: Capacity hint: the number of vertices to allocate room for up front.
+            n_triangles: Capacity hint: the number of triangles to allocate room for up front, e.g. about twice the
+                number of vertices for a triangulation of a point set."""
         if vertices is None:
             vertices = []
         if triangles is None:
             triangles = []
-        self.vertices = vertices  # type: List[IFSVertex3]
-        self.triangles = triangles  # type: List[IFSTriangle3]
+        self.vertices = vertices
+        self.triangles = triangles
+        self.positions = reserve(self.positions, n_vertices)
+        self.vertex_data = reserve(self.vertex_data, n_vertices)
+        self.triangle_vertices = reserve(self.triangle_vertices, n_triangles)
+        self.triangle_xor = reserve(self.triangle_xor, n_triangles)
+        self.triangle_data = reserve(self.triangle_data, n_triangles)
+
+    @classmethod
+    def from_heds3(cls, heds: 'HEDS3') -> 'IFS3':
+        """Makes an IFS of a HEDS in bulk, walking the successors of every face at once rather than face by face.
+        Triangle i is face i, starting at the source of the face's half-edge.
+
+        Args:
+            heds: The HEDS. Every face must be a triangle without holes.
+
+        Returns:
+            The IFS.
+
+        Raises:
+            ValueError: If a face is not a triangle or has a hole."""
+        num_faces = heds.num_faces
+        successors = heds.he_successor
+        first = heds.f_halfedge[:num_faces]
+        second = successors[first]
+        third = successors[second]
+        if np.any(successors[third] != first):
+            raise ValueError('Every face must be a triangle.')
+        if np.any(heds.f_hole[:num_faces] != NO_INDEX):
+            raise ValueError('No face may have a hole.')
+        ifs = cls()
+        ifs.positions = heds.v_pos[:heds.num_vertices].copy()
+        ifs.vertex_data = heds.v_data[:heds.num_vertices].copy()
+        ifs.triangle_vertices = heds.he_source[np.stack((first, second, third), axis=1)]
+        ifs.triangle_xor = np.bitwise_xor.reduce(ifs.triangle_vertices, axis=1)
+        ifs.triangle_data = heds.f_data[:num_faces].copy()
+        ifs.num_vertices = heds.num_vertices
+        ifs.num_triangles = num_faces
+        return ifs
+
+    def add_vertex(self, position: Vector3, data: int = NO_INDEX) -> int:
+        """Appends a vertex, growing the vertex arrays geometrically when they are full.
+
+        Args:
+            position: Vector position of the vertex.
+            data: Data index, used for associating the vertex with data external to the IFS. NO_INDEX (-1) if there is
+                none.
+
+        Returns:
+            The index of the vertex."""
+        index = self.num_vertices
+        self.positions = grow(self.positions, index + 1)
+        self.vertex_data = grow(self.vertex_data, index + 1)
+        self.positions[index] = (position.x, position.y, position.z)
+        self.vertex_data[index] = data
+        self.num_vertices = index + 1
+        return index
+
+    def add_triangle(self, vertices: Iterable[int], data: int = NO_INDEX) -> int:
+        """Adds a triangle in the slot of a removed triangle if there is one, otherwise appends it, growing the triangle
+        arrays geometrically when they are full.
+
+        Args:
+            vertices: Indices of the vertices. Counter-clockwise order.
+            data: Data index, used for associating the triangle with data external to the IFS. NO_INDEX (-1) if there is
+                none.
+
+        Returns:
+            The index of the triangle."""
+        if not self.__free_triangles:
+            return self.__append_triangle(vertices, data)
+        index = self.__free_triangles.pop()
+        a, b, c = islice(vertices, 3)
+        self.triangle_vertices[index] = (a, b, c)
+        self.triangle_xor[index] = a ^ b ^ c
+        self.triangle_data[index] = data
+        return index
+
+    def __append_triangle(self, vertices: Iterable[int], data: int = NO_INDEX) -> int:
+        """Appends a triangle after the last, even if there is a slot of a removed triangle, growing the triangle arrays
+        geometrically when they are full.
+
+        Args:
+            vertices: Indices of the vertices. Counter-clockwise order.
+            data: Data index, used for associating the triangle with data external to the IFS. NO_INDEX (-1) if there is
+                none.
+
+        Returns:
+            The index of the triangle."""
+        index = self.num_triangles
+        self.triangle_vertices = grow(self.triangle_vertices, index + 1)
+        self.triangle_xor = grow(self.triangle_xor, index + 1)
+        self.triangle_data = grow(self.triangle_data, index + 1)
+        a, b, c = islice(vertices, 3)
+        self.triangle_vertices[index] = (a, b, c)
+        self.triangle_xor[index] = a ^ b ^ c
+        self.triangle_data[index] = data
+        self.num_triangles = index + 1
+        return index
+
+    def remove_triangle(self, index: int) -> None:
+        """Removes a triangle, marking its slot for reuse.
+
+        Args:
+            index: The index of the triangle."""
+        self.triangle_vertices[index] = NO_INDEX
+        self.triangle_xor[index] = NO_INDEX
+        self.__free_triangles.append(index)
+
+    def set_triangle_vertices(self, index: int, vertices: Iterable[int]) -> None:
+        """Sets the vertices of a triangle.
+
+        Args:
+            index: The index of the triangle.
+            vertices: Indices of the vertices. Counter-clockwise order."""
+        a, b, c = islice(vertices, 3)
+        self.triangle_vertices[index] = (a, b, c)
+        self.triangle_xor[index] = a ^ b ^ c
+
+    def third_vertex(self, triangle: int, a: int, b: int) -> int:
+        """Gets the vertex of a triangle other than two given vertices of it, with one exclusive or rather than a search
+        of the triangle's vertices.
+
+        Args:
+            triangle: The index of the triangle.
+            a: The index of a vertex of the triangle.
+            b: The index of another vertex of the triangle.
+
+        Returns:
+            The index of the remaining vertex of the triangle."""
+        return a ^ b ^ int(self.triangle_xor[triangle])
+
+    def vertex(self, index: int) -> IFSVertex3:
+        """Gets a vertex as an IFSVertex3. The IFSVertex3 is a copy: changing it does not change the IFS.
+
+        Args:
+            index: The index of the vertex.
+
+        Returns:
+            The vertex."""
+        x, y, z = self.positions[index].tolist()
+        return IFSVertex3(Vector3(x, y, z), int(self.vertex_data[index]))
+
+    def triangle(self, index: int) -> IFSTriangle3:
+        """Gets a triangle as an IFSTriangle3. The IFSTriangle3 is a copy: changing it does not change the IFS.
+
+        Args:
+            index: The index of the triangle.
+
+        Returns:
+            The triangle."""
+        return IFSTriangle3(self.triangle_vertices[index].tolist(), int(self.triangle_data[index]))
+
+    @property
+    def vertices(self) -> ElementList:
+        """The vertices, as IFSVertex3 that read and write the arrays. Assigning a list of IFSVertex3 replaces them."""
+        return ElementList(lambda: self.num_vertices, lambda index: _IFSVertexView3(self, index), self.__store_vertex,
+                           lambda v: self.add_vertex(v.position, v.data))
+
+    @vertices.setter
+    def vertices(self, vertices: List[IFSVertex3]) -> None:
+        positions = np.array([(v.position.x, v.position.y, v.position.z) for v in vertices],
+                             dtype=np.float64).reshape(-1, 3)
+        data = np.array([v.data for v in vertices], dtype=np.int32)
+        self.positions = positions  # type: np.ndarray
+        self.vertex_data = data  # type: np.ndarray
+        self.num_vertices = len(positions)
+
+    def __store_vertex(self, index: int, vertex: IFSVertex3) -> None:
+        position = vertex.position
+        self.positions[index] = (position.x, position.y, position.z)
+        self.vertex_data[index] = vertex.data
+
+    @property
+    def triangles(self) -> ElementList:
+        """The triangles, as IFSTriangle3 that read and write the arrays. Assigning a list of IFSTriangle3 replaces
+        them."""
+        return ElementList(lambda: self.num_triangles, lambda index: _IFSTriangleView3(self, index),
+                           self.__store_triangle, lambda t: self.__append_triangle(t.vertices, t.data))
+
+    @triangles.setter
+    def triangles(self, triangles: List[IFSTriangle3]) -> None:
+        vertices = np.array([list(t.vertices) for t in triangles], dtype=np.int32).reshape(-1, 3)
+        data = np.array([t.data for t in triangles], dtype=np.int32)
+        self.triangle_vertices = vertices  # type: np.ndarray
+        self.triangle_xor = np.bitwise_xor.reduce(vertices, axis=1)  # type: np.ndarray
+        self.triangle_data = data  # type: np.ndarray
+        self.num_triangles = len(vertices)
+        self.__free_triangles = np.flatnonzero(vertices[:, 0] == NO_INDEX).tolist()  # type: List[int]
+
+    def __store_triangle(self, index: int, triangle: IFSTriangle3) -> None:
+        self.set_triangle_vertices(index, list(triangle.vertices))
+        self.triangle_data[index] = triangle.data
@@ -6,39 +6,93 @@ Representation of a directed plane in 3D.
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
+import dataclasses
+import math
+from typing import Tuple
+
+import numpy as np
 
 from .vector3 import Vector3
 
 
+@dataclasses.dataclass(frozen=True, eq=False)
 class Plane3(object):
-    def __init__(self, normal: Vector3, w: float) -> None:
-        self.__normal = normal
-        self.__w = w
+    # An immutable value: the fields are plain slots rather than properties over private names, and planes compare and
+    # hash by the components of their normal and w. Vector3 compares by identity, so the generated __eq__ is not used.
+    __slots__ = ('normal', 'w', '__hash', '__normal_array')
+    COPLANAR = 0
+    FRONT = 1
+    BACK = -1
+
+    normal: Vector3
+    w: float
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_Plane3__hash', hash(self.__key()))
+
+    def __key(self) -> tuple:
+        return self.normal.x, self.normal.y, self.normal.z, self.w
 
-    @property
-    def normal(self) -> Vector3:
-        return self.__normal
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Plane3):
+            return NotImplemented
+        return self.__key() == other.__key()
 
-    @property
-    def w(self) -> float:
-        return self.__w
+    def __hash__(self) -> int:
+        return self.__hash
 
     def clone(self) -> 'Plane3':
-        return Plane3(self.__normal.clone(), self.__w)
+        return Plane3(self.normal.clone(), self.w)
 
     def flipped(self) -> 'Plane3':
-        return Plane3(self.__normal.negated(), -self.__w)
+        return Plane3(self.normal.negated(), -self.w)
 
     def distance(self, vector: Vector3) -> float:
-        return self.__normal.dot(vector) - self.__w
+        return self.normal.dot(vector) - self.w
+
+    def distance_batch(self, points: np.ndarray) -> np.ndarray:
+        # The signed distances of an (N, 3) array of points, as one matrix-vector product.
+        normal_array = getattr(self, '_Plane3__normal_array', None)
+        if normal_array is None:
+            normal_array = np.array((self.normal.x, self.normal.y, self.normal.z), dtype=np.float64)
+            object.__setattr__(self, '_Plane3__normal_array', normal_array)
+        return np.asarray(points, dtype=np.float64) @ normal_array - self.w
+
+    def classify_batch(self, points: np.ndarray, epsilon: float = 0.000001) -> np.ndarray:
+        # FRONT, BACK, or COPLANAR, as int8, for each of an (N, 3) array of points.
+        distances = self.distance_batch(points)
+        return (distances > epsilon).astype(np.int8) - (distances < -epsilon).astype(np.int8)
 
     def coplanar(self, vector: Vector3, epsilon: float = 0.000001) -> bool:
         return self.distance(vector) < epsilon
 
     def equivalent(self, other: 'Plane3', epsilon: float = 0.000001) -> bool:
-        return self.__normal.equivalent(other.__normal) and abs(self.__w - other.__w) < epsilon
+        return self.normal.equivalent(other.normal) and abs(self.w - other.w) < epsilon
+
+    @classmethod
+    def from_points(cls, a: Vector3, b: Vector3, c: Vector3) -> 'Plane3':
+        # b.minus(a).cross(c.minus(a)).unit() on locals, building only the final normal.
+        ax, ay, az = a.x, a.y, a.z
+        ex, ey, ez = b.x - ax, b.y - ay, b.z - az
+        fx, fy, fz = c.x - ax, c.y - ay, c.z - az
+        nx = ey * fz - ez * fy
+        ny = ez * fx - ex * fz
+        nz = ex * fy - ey * fx
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        nx /= length
+        ny /= length
+        nz /= length
+        return cls(Vector3(nx, ny, nz), nx * ax + ny * ay + nz * az)
+
 
-    @staticmethod
-    def from_points(a: Vector3, b: Vector3, c: Vector3) -> 'Plane3':
-        normal = b.minus(a).cross(c.minus(a)).unit()
-        return Plane3(normal, normal.dot(a))
+def planes_from_triangles(positions: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # The planes of a triangle soup at once, as Plane3.from_points computes them one at a time: positions is (N, 3),
+    # triangles is (M, 3) vertex indices, and the result is the (M, 3) unit normals and the (M,) w of every triangle.
+    positions = np.asarray(positions, dtype=np.float64)
+    triangles = np.asarray(triangles)
+    a = positions[triangles[:, 0]]
+    b = positions[triangles[:, 1]]
+    c = positions[triangles[:, 2]]
+    normals = np.cross(b - a, c - a)
+    normals /= np.sqrt(np.einsum('ij,ij->i', normals, normals))[:, np.newaxis]
+    return normals, np.einsum('ij,ij->i', normals, a)
@@ -7,22 +7,178 @@ License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
 import enum
+from fractions import Fraction
+import math
+from typing import Optional, Sequence
+
+import numpy as np
 
 from ffg_geo.vector2 import Vector2
 
 
-class Orientation(enum.Enum):
-    """Orientation enum for usage in sideness predicate."""
+class Orientation(enum.IntEnum):
+    """Orientation enum for usage in sideness predicate. Its values are the sign of the signed area."""
     CO_LINEAR = 0
     LEFT = 1
-    RIGHT = 2
+    RIGHT = -1
 
 
-class Position(enum.Enum):
-    """Position enum for usage in the in-circle predicate."""
+class Position(enum.IntEnum):
+    """Position enum for usage in the in-circle predicate. Its values are the sign of the in-circle determinant."""
     ON = 0
     INSIDE = 1
-    OUTSIDE = 2
+    OUTSIDE = -1
+
+
+# Module level aliases, which compare equal to the plain ints returned by the flat predicates and skip the enum class
+# attribute lookup in hot loops.
+CO_LINEAR = Orientation.CO_LINEAR
+LEFT = Orientation.LEFT
+RIGHT = Orientation.RIGHT
+ON = Position.ON
+INSIDE = Position.INSIDE
+OUTSIDE = Position.OUTSIDE
+
+
+# Shewchuk's bounds on the relative error of the floating point sideness and in-circle determinants, with
+# epsilon = 2 ** -53.
+_EPSILON = 2.0 ** -53
+_SIDE_ERRBOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_IN_CIRCLE_ERRBOUND = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+
+def side_f(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Vector sideness predicate on flat coordinates. Determines on which side (cx,cy) is of the line ((ax,ay),(bx,by)).
+    Takes and returns plain numbers so that hot loops avoid Vector2 attribute access and enum construction.
+
+    Args:
+        ax: The x coordinate of the source vector.
+        ay: The y coordinate of the source vector.
+        bx: The x coordinate of the destination vector.
+        by: The y coordinate of the destination vector.
+        cx: The x coordinate of the vector to determine sideness of.
+        cy: The y coordinate of the vector to determine sideness of.
+
+    Returns:
+        1 if left, -1 if right, or 0 if co-linear."""
+    detleft = (bx - ax) * (cy - ay)
+    detright = (cx - ax) * (by - ay)
+    area = detleft - detright
+    # Static filter after Shewchuk's adaptive predicates, as in in_circle_f. Only near co-linear inputs go further.
+    errbound = _SIDE_ERRBOUND * (abs(detleft) + abs(detright))
+    if area > errbound:
+        return 1
+    if area < -errbound:
+        return -1
+    if errbound == 0.0 or not math.isfinite(errbound):
+        # Both products are zero, so the area is exactly zero, or a coordinate is infinite or NaN and has no exact
+        # value. Branchless sign: bool subtraction yields the int 1, 0, or -1.
+        return (area > 0.0) - (area < 0.0)
+    return _side_exact(ax, ay, bx, by, cx, cy)
+
+
+def _side_exact(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Exact sideness predicate on flat coordinates, for when side_f's static filter cannot decide.
+
+    Args:
+        ax: The x coordinate of the source vector.
+        ay: The y coordinate of the source vector.
+        bx: The x coordinate of the destination vector.
+        by: The y coordinate of the destination vector.
+        cx: The x coordinate of the vector to determine sideness of.
+        cy: The y coordinate of the vector to determine sideness of.
+
+    Returns:
+        1 if left, -1 if right, or 0 if co-linear."""
+    exact_ax = Fraction(ax)
+    exact_ay = Fraction(ay)
+    area = (Fraction(bx) - exact_ax) * (Fraction(cy) - exact_ay) - (Fraction(cx) - exact_ax) * (Fraction(by) - exact_ay)
+    return (area > 0) - (area < 0)
+
+
+def in_circle_f(ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float) -> int:
+    """Vector in-circle predicate on flat coordinates. Determines (dx,dy)'s position w.r.t the circle defined by
+    ((ax,ay),(bx,by),(cx,cy)), which must be in counter-clockwise order or the opposite result will be returned. Takes
+    and returns plain numbers so that hot loops avoid Vector2 attribute access and enum construction.
+
+    Args:
+        ax: The x coordinate of vector a in the circle.
+        ay: The y coordinate of vector a in the circle.
+        bx: The x coordinate of vector b in the circle.
+        by: The y coordinate of vector b in the circle.
+        cx: The x coordinate of vector c in the circle.
+        cy: The y coordinate of vector c in the circle.
+        dx: The x coordinate of vector d to test the position of.
+        dy: The y coordinate of vector d to test the position of.
+
+    Returns:
+        1 if inside, -1 if outside, or 0 if on the circle."""
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+    abdet = adx * bdy - bdx * ady
+    bcdet = bdx * cdy - cdx * bdy
+    cadet = cdx * ady - adx * cdy
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    retval = alift * bcdet + blift * cadet + clift * abdet
+    # Static filter after Shewchuk's adaptive predicates: the rounding error of retval is at most errbound, so a larger
+    # magnitude has the right sign. Only near-degenerate inputs take the exact path.
+    errbound = _IN_CIRCLE_ERRBOUND * ((abs(bdx * cdy) + abs(cdx * bdy)) * alift +
+                                      (abs(cdx * ady) + abs(adx * cdy)) * blift +
+                                      (abs(adx * bdy) + abs(bdx * ady)) * clift)
+    if retval > errbound:
+        return 1
+    if retval < -errbound:
+        return -1
+    if not math.isfinite(errbound):
+        # Infinite or NaN coordinates have no exact value: keep the sign of the floating point determinant.
+        if retval > 0.0:
+            return 1
+        elif retval == 0.0:
+            return 0
+        return -1
+    return _in_circle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def _in_circle_exact(ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float) -> int:
+    """Exact in-circle predicate on flat coordinates, for when in_circle_f's static filter cannot decide. Every float
+    converts to a Fraction exactly, so the determinant is evaluated without rounding.
+
+    Args:
+        ax: The x coordinate of vector a in the circle.
+        ay: The y coordinate of vector a in the circle.
+        bx: The x coordinate of vector b in the circle.
+        by: The y coordinate of vector b in the circle.
+        cx: The x coordinate of vector c in the circle.
+        cy: The y coordinate of vector c in the circle.
+        dx: The x coordinate of vector d to test the position of.
+        dy: The y coordinate of vector d to test the position of.
+
+    Returns:
+        1 if inside, -1 if outside, or 0 if on the circle."""
+    # Fresh names rather than rebinding the float arguments, so every local keeps one static type.
+    exact_dx = Fraction(dx)
+    exact_dy = Fraction(dy)
+    adx = Fraction(ax) - exact_dx
+    ady = Fraction(ay) - exact_dy
+    bdx = Fraction(bx) - exact_dx
+    bdy = Fraction(by) - exact_dy
+    cdx = Fraction(cx) - exact_dx
+    cdy = Fraction(cy) - exact_dy
+    retval = ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+              (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+              (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+    return (retval > 0) - (retval < 0)
+
+
+# The results of the flat predicates, 0, 1, and -1, index these, which is cheaper than calling the enum classes.
+_ORIENTATIONS = (CO_LINEAR, LEFT, RIGHT)
+_POSITIONS = (ON, INSIDE, OUTSIDE)
 
 
 def side(a: Vector2, b: Vector2, c: Vector2) -> Orientation:
@@ -35,12 +191,7 @@ def side(a: Vector2, b: Vector2, c: Vector2) -> Orientation:
 
     Returns:
         The orientation (left, right, or co-linear)."""
-    area = ((b.x - a.x) * (c.y - a.y)) - ((c.x - a.x) * (b.y - a.y))
-    if area > 0.0:
-        return Orientation.LEFT
-    if area < 0.0:
-        return Orientation.RIGHT
-    return Orientation.CO_LINEAR
+    return _ORIENTATIONS[side_f(a.x, a.y, b.x, b.y, c.x, c.y)]
 
 
 def in_circle(a: Vector2, b: Vector2, c: Vector2, d: Vector2) -> Position:
@@ -56,21 +207,143 @@ def in_circle(a: Vector2, b: Vector2, c: Vector2, d: Vector2) -> Position:
     Returns:
         The position (in-circle, out-circle, or on-circle).
     """
-    adx = a.x - d.x
-    ady = a.y - d.y
-    bdx = b.x - d.x
-    bdy = b.y - d.y
-    cdx = c.x - d.x
-    cdy = c.y - d.y
-    abdet = adx * bdy - bdx * ady
-    bcdet = bdx * cdy - cdx * bdy
-    cadet = cdx * ady - adx * cdy
-    alift = adx * adx + ady * ady
-    blift = bdx * bdx + bdy * bdy
-    clift = cdx * cdx + cdy * cdy
-    retval = alift * bcdet + blift * cadet + clift * abdet
-    if retval > 0.0:
-        return Position.INSIDE
-    elif retval == 0.0:
-        return Position.ON
-    return Position.OUTSIDE
+    return _POSITIONS[in_circle_f(a.x, a.y, b.x, b.y, c.x, c.y, d.x, d.y)]
+
+
+def side_idx(x: Sequence[float], y: Sequence[float], a: int, b: int, c: int) -> int:
+    """Vector sideness predicate on indices into coordinate columns, as side_f. Points stored as columns, e.g. the
+    columns of an (N,2) array as lists, are read directly rather than through one Vector2 object per point.
+
+    Args:
+        x: The x coordinates of the points.
+        y: The y coordinates of the points.
+        a: The index of the source vector.
+        b: The index of the destination vector.
+        c: The index of the vector to determine sideness of.
+
+    Returns:
+        1 if left, -1 if right, or 0 if co-linear."""
+    return side_f(x[a], y[a], x[b], y[b], x[c], y[c])
+
+
+def in_circle_idx(x: Sequence[float], y: Sequence[float], a: int, b: int, c: int, d: int) -> int:
+    """Vector in-circle predicate on indices into coordinate columns, as in_circle_f. The points a, b, and c must be in
+    counter-clockwise order or the opposite result will be returned.
+
+    Args:
+        x: The x coordinates of the points.
+        y: The y coordinates of the points.
+        a: The index of vector a in the circle.
+        b: The index of vector b in the circle.
+        c: The index of vector c in the circle.
+        d: The index of vector d to test the position of.
+
+    Returns:
+        1 if inside, -1 if outside, or 0 if on the circle."""
+    return in_circle_f(x[a], y[a], x[b], y[b], x[c], y[c], x[d], y[d])
+
+
+def side_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Vector sideness predicate over arrays of vectors. Determines on which side each c[i] is of the line (a[i],b[i]).
+    Any of the arguments may be a single vector of shape (2,), which is broadcast against the others.
+
+    Args:
+        a: (N,2) array of source vectors.
+        b: (N,2) array of destination vectors.
+        c: (N,2) array of vectors to determine sideness of.
+
+    Returns:
+        (N,) int8 array of 1 if left, -1 if right, or 0 if co-linear, as side_f."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    detleft = (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+    detright = (c[..., 0] - a[..., 0]) * (b[..., 1] - a[..., 1])
+    area = detleft - detright
+    out = np.sign(area).astype(np.int8)
+    # The static filter of side_f: the few entries it cannot decide are redone one at a time on the exact path.
+    uncertain = np.abs(area) <= _SIDE_ERRBOUND * (np.abs(detleft) + np.abs(detright))
+    if np.any(uncertain):
+        a, b, c = np.broadcast_arrays(a, b, c)
+        for index in zip(*np.nonzero(uncertain)):
+            out[index] = side_f(*a[index].tolist(), *b[index].tolist(), *c[index].tolist())
+    return out
+
+
+def in_circle_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """Vector in-circle predicate over arrays of vectors. Determines each d[i]'s position w.r.t the circle defined by
+    (a[i],b[i],c[i]), which must be in counter-clockwise order or the opposite result will be returned. Any of the
+    arguments may be a single vector of shape (2,), which is broadcast against the others, e.g. to test many points
+    against one circle.
+
+    Args:
+        a: (N,2) array of vectors a in the circles.
+        b: (N,2) array of vectors b in the circles.
+        c: (N,2) array of vectors c in the circles.
+        d: (N,2) array of vectors d to test the position of.
+
+    Returns:
+        (N,) int8 array of 1 if inside, -1 if outside, or 0 if on the circle, as in_circle_f."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    d = np.asarray(d, dtype=np.float64)
+    return in_circle_columns(a[..., 0], a[..., 1], b[..., 0], b[..., 1], c[..., 0], c[..., 1], d[..., 0], d[..., 1])
+
+
+def in_circle_columns(ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray, cx: np.ndarray, cy: np.ndarray,
+                      dx: np.ndarray, dy: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Vector in-circle predicate over columns of coordinates, as in_circle_f on each index. Contiguous float64 columns
+    keep every step a unit-stride loop, and the arithmetic runs in place in a few scratch arrays rather than allocating
+    one temporary per operation. Any column may be a scalar, which is broadcast against the others.
+
+    Args:
+        ax: (N,) array of the x coordinates of vectors a in the circles.
+        ay: (N,) array of the y coordinates of vectors a in the circles.
+        bx: (N,) array of the x coordinates of vectors b in the circles.
+        by: (N,) array of the y coordinates of vectors b in the circles.
+        cx: (N,) array of the x coordinates of vectors c in the circles.
+        cy: (N,) array of the y coordinates of vectors c in the circles.
+        dx: (N,) array of the x coordinates of vectors d to test the position of.
+        dy: (N,) array of the y coordinates of vectors d to test the position of.
+        out: Optional (N,) int8 array to write the result to.
+
+    Returns:
+        (N,) int8 array of 1 if inside, -1 if outside, or 0 if on the circle. This is out if it was given."""
+    adx = np.subtract(ax, dx, dtype=np.float64)
+    ady = np.subtract(ay, dy, dtype=np.float64)
+    bdx = np.subtract(bx, dx, dtype=np.float64)
+    bdy = np.subtract(by, dy, dtype=np.float64)
+    cdx = np.subtract(cx, dx, dtype=np.float64)
+    cdy = np.subtract(cy, dy, dtype=np.float64)
+    # retval = alift * bcdet + blift * cadet + clift * abdet, accumulated term by term.
+    retval = bdx * cdy
+    retval -= cdx * bdy
+    retval *= adx * adx + ady * ady
+    term = cdx * ady
+    term -= adx * cdy
+    term *= bdx * bdx + bdy * bdy
+    retval += term
+    term = adx * bdy
+    term -= bdx * ady
+    term *= cdx * cdx + cdy * cdy
+    retval += term
+    if out is None:
+        out = np.empty(retval.shape, dtype=np.int8)
+    np.subtract(retval > 0.0, retval < 0.0, out=out, dtype=np.int8)
+    # The static filter of in_circle_f: the few entries it cannot decide are redone one at a time on the exact path.
+    permanent = np.abs(adx * bdy) + np.abs(bdx * ady)
+    permanent *= cdx * cdx + cdy * cdy
+    term = np.abs(bdx * cdy) + np.abs(cdx * bdy)
+    term *= adx * adx + ady * ady
+    permanent += term
+    term = np.abs(cdx * ady) + np.abs(adx * cdy)
+    term *= bdx * bdx + bdy * bdy
+    permanent += term
+    permanent *= _IN_CIRCLE_ERRBOUND
+    uncertain = np.abs(retval) <= permanent
+    if np.any(uncertain):
+        columns = np.broadcast_arrays(ax, ay, bx, by, cx, cy, dx, dy)
+        for index in zip(*np.nonzero(uncertain)):
+            out[index] = in_circle_f(*[float(column[index]) for column in columns])
+    return out
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""soa.py
+
+Helpers for meshes stored as structures of arrays (SoA): one array per field rather than one object per element.
+
+License:
+    http://www.apache.org/licenses/LICENSE-2.0"""
+
+import collections.abc
+from typing import Any, Callable, Iterable, Union
+
+import numpy as np
+
+from .vector3 import Vector3
+
+# Stored in place of an optional index, or an optional data index, of None.
+NO_INDEX = -1
+
+
+def grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Returns the array itself if it has room for size rows, otherwise a copy with at least double the rows, so that
+    appending one row at a time takes amortized constant time.
+
+    Args:
+        array: The array to grow.
+        size: The number of rows needed.
+
+    Returns:
+        An array with at least size rows whose leading rows are those of the input array."""
+    if size <= len(array):
+        return array
+    grown = np.empty((max(size, 2 * len(array), 8),) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def reserve(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Returns the array itself if it has at least capacity rows, otherwise a copy with exactly capacity rows, so that a
+    caller who knows the final size can allocate once up front.
+
+    Args:
+        array: The array to reserve rows in.
+        capacity: The number of rows to reserve.
+
+    Returns:
+        An array with at least capacity rows whose leading rows are those of the input array."""
+    if capacity <= len(array):
+        return array
+    reserved = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    reserved[:len(array)] = array
+    return reserved
+
+
+def column(name: str) -> property:
+    """Makes a property of an element view that reads and writes the view's row of one array of its mesh, so that
+    changing the view changes the mesh. The array is looked up by name on every access, since growing it replaces it.
+
+    Args:
+        name: The name of the mesh's int array.
+
+    Returns:
+        The property."""
+    def get(view: Any) -> int:
+        return int(getattr(view.mesh, name)[view.index])
+
+    def set_(view: Any, value: int) -> None:
+        getattr(view.mesh, name)[view.index] = value
+    return property(get, set_)
+
+
+def position_column(name: str) -> property:
+    """Makes a property of an element view that reads and writes the view's row of one (capacity, 3) array of its mesh
+    as a Vector3, as column does for an int array.
+
+    Args:
+        name: The name of the mesh's (capacity, 3) float64 array.
+
+    Returns:
+        The property."""
+    def get(view: Any) -> Vector3:
+        x, y, z = getattr(view.mesh, name)[view.index].tolist()
+        return Vector3(x, y, z)
+
+    def set_(view: Any, value: Vector3) -> None:
+        getattr(view.mesh, name)[view.index] = (value.x, value.y, value.z)
+    return property(get, set_)
+
+
+class ElementList(collections.abc.Sequence):
+    """The elements of one kind of a mesh stored as arrays, as a list of views: changing an element, assigning an
+    element by index, or appending an element changes the mesh. As with a list, append and extend add elements at the
+    end, never in the slot of a removed element; the mesh's add methods are the ones that reuse slots. Elements cannot
+    be removed or inserted, since that would renumber the elements after them; use the mesh's remove methods, or assign
+    a new list to the mesh's attribute."""
+    def __init__(self, length: Callable[[], int], view: Callable[[int], Any], store: Callable[[int, Any], None],
+                 append: Callable[[Any], int]) -> None:
+        """Initializes the ElementList.
+
+        Args:
+            length: Gets the number of elements.
+            view: Makes the view of the element at an index.
+            store: Stores the fields of an element at an index.
+            append: Adds an element to the mesh after its last element, returning its index."""
+        self.__length = length
+        self.__view = view
+        self.__store = store
+        self.__append = append
+
+    def __len__(self) -> int:
+        return self.__length()
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.__view(i) for i in range(*index.indices(len(self)))]
+        return self.__view(self.__index(index))
+
+    def __setitem__(self, index: int, element: Any) -> None:
+        self.__store(self.__index(index), element)
+
+    def __index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('Element index out of range.')
+        return index
+
+    def append(self, element: Any) -> None:
+        self.__append(element)
+
+    def extend(self, elements: Iterable[Any]) -> None:
+        for element in list(elements):
+            self.__append(element)
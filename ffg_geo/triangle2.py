@@ -6,7 +6,15 @@ A module implementing Triangle2, which is the representation of a 2-dimensional
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
-from typing import Iterable, List
+from itertools import islice
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from ffg_geo.soa import NO_INDEX
+
+# Record layout of a triangle in a triangle array: 24 bytes, against two lists and their int objects per Triangle2.
+TRIANGLE2_DTYPE = np.dtype([('v', np.int32, (3,)), ('n', np.int32, (3,))])
 
 
 class Triangle2(object):
@@ -15,18 +23,78 @@ class Triangle2(object):
     Attributes:
         v: The vertices in counter-clockwise order.
         n: The neighbors in counter-clockwise order."""
-    def __init__(self, v: Iterable = (None, None, None), n: Iterable = (None, None, None)) -> None:
+    __slots__ = ('v', 'n')
+
+    def __init__(self, v: Iterable[Optional[int]] = (None, None, None),
+                 n: Iterable[Optional[int]] = (None, None, None)) -> None:
         """Initializes the Triangle2.
 
         Args:
             v: The vertex indices.
             n: The neighbor triangle indices."""
-        self.v = list(v[:3])  # type: List[int]
-        self.n = list(n[:3])  # type: List[int]
+        self.v = list(islice(v, 3))  # type: List[Optional[int]]
+        self.n = list(islice(n, 3))  # type: List[Optional[int]]
 
     def __str__(self) -> str:
         """str's the triangle.
 
         Returns:
             The triangle as a str."""
-        return 'Triangle: v: {} n: {}'.format(tuple(self.v), tuple(self.n))
+        v, n = self.v, self.n
+        return f'Triangle: v: ({v[0]}, {v[1]}, {v[2]}) n: ({n[0]}, {n[1]}, {n[2]})'
+
+
+def triangle_array(n: int) -> np.ndarray:
+    """Makes a triangle array: the compact alternative to a list of Triangle2, one TRIANGLE2_DTYPE record per triangle.
+    Absent indices, such as vertex 2 of a ghost triangle, are NO_INDEX (-1) rather than None.
+
+    Args:
+        n: The number of triangles.
+
+    Returns:
+        (n,) TRIANGLE2_DTYPE array with every index NO_INDEX."""
+    triangles = np.empty(n, dtype=TRIANGLE2_DTYPE)
+    triangles['v'] = NO_INDEX
+    triangles['n'] = NO_INDEX
+    return triangles
+
+
+def triangle_array_from(triangles: List[Triangle2]) -> np.ndarray:
+    """Makes a triangle array from a list of Triangle2, such as the triangles of a Triangulation2.
+
+    Args:
+        triangles: The triangles.
+
+    Returns:
+        (len(triangles),) TRIANGLE2_DTYPE array of the triangles, with None indices as NO_INDEX (-1)."""
+    array = triangle_array(len(triangles))
+    array['v'] = [[NO_INDEX if value is None else value for value in t.v] for t in triangles]
+    array['n'] = [[NO_INDEX if value is None else value for value in t.n] for t in triangles]
+    return array
+
+
+def neighbor(triangles: np.ndarray, i: int, edge: int) -> int:
+    """Gets a neighbor of a triangle in a triangle array.
+
+    Args:
+        triangles: The triangle array.
+        i: The index of the triangle.
+        edge: The edge the neighbor is opposite, between vertices edge and (edge + 1) % 3 of the triangle.
+
+    Returns:
+        The index of the neighbor triangle."""
+    return int(triangles['n'][i, edge])
+
+
+def format_triangle(triangles: np.ndarray, i: int) -> str:
+    """str's a triangle of a triangle array, as Triangle2 does.
+
+    Args:
+        triangles: The triangle array.
+        i: The index of the triangle.
+
+    Returns:
+        The triangle as a str."""
+    v0, v1, v2 = triangles['v'][i].tolist()
+    n0, n1, n2 = triangles['n'][i].tolist()
+    return f'Triangle: v: ({v0}, {v1}, {v2}) n: ({n0}, {n1}, {n2})'
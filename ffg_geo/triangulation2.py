@@ -6,16 +6,67 @@ A module implementing Triangulation2, which serves as the vehicle for triangulat
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
-import collections
-import copy
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 import enum
 import math
-from typing import Deque, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
-from ffg_geo.predicates import in_circle, Orientation, Position, side
+import numpy as np
+
+from ffg_geo.predicates import in_circle_f, side_f, side_idx
+from ffg_geo.soa import ElementList, grow, NO_INDEX, reserve
 from ffg_geo.triangle2 import Triangle2
-from ffg_geo.vector2 import Vector2
-from ffg_geo.window import Window
+from ffg_geo.vector2 import rotated_batch, Vector2
+from ffg_geo.window import LineType, Window
+
+
+# Below this many vertices a range is triangulated in one process: starting a worker costs more than it saves.
+_PARALLEL_MIN_VERTICES = 4096
+
+# Below this many vertices nearest scans every vertex: building and walking the grid costs more than it saves.
+_GRID_MIN_VERTICES = 64
+
+# The grid of Triangulation2.nearest, as Triangulation2.__build_grid returns it.
+_Grid = Tuple[float, float, float, int, int, List[int], List[int], List[float], List[float]]
+
+
+def _trivial_template(v: Tuple[Tuple[Optional[int], ...], ...], n: Tuple[Tuple[int, ...], ...],
+                      ghosts: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, ...]]:
+    """Makes a base case of Triangulation2.__trivial_triangulation into arrays, so that the base case is written with
+    two array additions rather than a triangle at a time.
+
+    Args:
+        v: The vertex rows, as offsets from the first vertex of the range. None for the missing vertex 2 of a ghost
+            triangle.
+        n: The neighbor rows, as offsets from the first triangle of the base case.
+        ghosts: Triangles 2, 3, 6, and 7, as offsets from the first triangle of the base case.
+
+    Returns:
+        The vertex offsets, the multiplier of the first vertex for each vertex (0 for a missing vertex), the neighbor
+        offsets, and the offsets of triangles 2, 3, 6, and 7.
+    """
+    v_offsets = np.array([[NO_INDEX if value is None else value for value in row] for row in v], dtype=np.int32)
+    v_begin = np.array([[0 if value is None else 1 for value in row] for row in v], dtype=np.int32)
+    return v_offsets, v_begin, np.array(n, dtype=np.int32), ghosts
+
+
+# The base cases of Triangulation2.__trivial_triangulation. 2 is the case of 2 vertices, connected as an edge. The
+# others are the cases of 3 vertices, by the orientation of the 3rd vertex w.r.t. the edge connecting the first 2:
+# 1 (left) and -1 (right) are connected as a triangle, and 0 (co-linear) as 2 edges.
+_TRIVIAL_TEMPLATES = {
+    2: _trivial_template(((0, 1, None), (1, 0, None)),
+                         ((1, 1, 1), (0, 0, 0)),
+                         (0, 1, 1, 0)),
+    1: _trivial_template(((0, 1, 2), (1, 0, None), (2, 1, None), (0, 2, None)),
+                         ((1, 2, 3), (0, 3, 2), (0, 1, 3), (0, 2, 1)),
+                         (3, 1, 2, 3)),
+    -1: _trivial_template(((0, 2, 1), (2, 0, None), (1, 2, None), (0, 1, None)),
+                          ((1, 2, 3), (0, 3, 2), (0, 1, 3), (0, 2, 1)),
+                          (3, 1, 1, 2)),
+    0: _trivial_template(((0, 1, None), (1, 0, None), (1, 2, None), (2, 1, None)),
+                         ((1, 2, 1), (0, 0, 3), (3, 3, 0), (2, 1, 2)),
+                         (0, 1, 3, 2)),
+}
 
 
 class MergeMethod(enum.Enum):
@@ -30,6 +81,57 @@ class CutMethod(enum.Enum):
     ALTERNATING = 2
 
 
+def _indices(values: Iterable[Optional[int]]) -> List[int]:
+    """Stores the indices of a triangle as a row of a triangle array does.
+
+    Args:
+        values: The indices, with None for an absent index.
+
+    Returns:
+        The indices, with NO_INDEX for an absent index."""
+    return [NO_INDEX if value is None else value for value in values]
+
+
+class _TriangleIndices2(list):
+    """Vertex or neighbor indices of a triangle of a Triangulation2, as a list that writes the triangulation's array
+    when an index is assigned. Absent indices read as None."""
+    def __init__(self, triangulation: 'Triangulation2', name: str, index: int) -> None:
+        super().__init__(None if value == NO_INDEX else value for value in getattr(triangulation, name)[index].tolist())
+        self.__triangulation = triangulation
+        self.__name = name
+        self.__index = index
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        getattr(self.__triangulation, self.__name)[self.__index] = _indices(self)
+
+
+class _TriangleView2(Triangle2):
+    """Triangle of a Triangulation2 that reads and writes the triangulation's arrays."""
+    __slots__ = ('triangulation', 'index')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, triangulation: 'Triangulation2', index: int) -> None:
+        self.triangulation = triangulation
+        self.index = index
+
+    @property
+    def v(self) -> List[Optional[int]]:
+        return _TriangleIndices2(self.triangulation, '_tv', self.index)
+
+    @v.setter
+    def v(self, v: Iterable[Optional[int]]) -> None:
+        self.triangulation._tv[self.index] = _indices(v)
+
+    @property
+    def n(self) -> List[Optional[int]]:
+        return _TriangleIndices2(self.triangulation, '_tn', self.index)
+
+    @n.setter
+    def n(self, n: Iterable[Optional[int]]) -> None:
+        self.triangulation._tn[self.index] = _indices(n)
+
+
 class Triangulation2(object):
     """
     A class representing a (potentially constrained) (potentially Delaunay) triangulation.
@@ -111,47 +213,89 @@ class Triangulation2(object):
                   both triangles are existent.
 
     Attributes:
-        vertices: The vertices to triangulate.
+        vertices: The vertices to triangulate, as Vector2s read from and written to points, in the order of the vertices
+            after sorting. Assigning a Vector2 to an index changes the vertex, and assigning a list of Vector2s replaces
+            the vertices.
         segments: The segments of the CDT.
-        triangles: The triangles created as a result of the triangulation.
+        triangles: The triangles created as a result of the triangulation, as Triangle2s that read and write the
+            triangle arrays. Changing a triangle's v or n, or assigning a Triangle2 to an index, changes the
+            triangulation, and assigning a list of Triangle2s replaces the triangles.
+        num_triangles: The number of triangles.
+        points: (N,2) float64 array of the coordinates of the vertices, in the order of the vertices after sorting. This
+            is where the vertices are stored, and the accessor to use for reading many vertices at once.
         window: The window to draw to. Optional.
         display_mode: If images drawn should appear on the screen or be written to a video.
         order: The order to draw elements when drawing.
+        debug_draw: If intermediate states are drawn: after every triangle the merge step stitches, after every half
+            the divide-and-conquer solves, and after every flip. Off by default: each draw visits the whole
+            triangulation.
+        verbose: If the divide-and-conquer prints every range it triangulates and merges. Off by default.
     """
-    def __init__(self, vertices: List[Vector2], segments: Optional[List[Tuple[int, int]]] = None,
-                 window: Optional[Window] = None, display_mode: bool = True, order: str = 'geshv') -> None:
+    def __init__(self, vertices: Union[List[Vector2], np.ndarray], segments: Optional[List[Tuple[int, int]]] = None,
+                 window: Optional[Window] = None, display_mode: bool = True, order: str = 'geshv',
+                 debug_draw: bool = False, verbose: bool = False) -> None:
         """
         Initializes the Triangulation2.
 
         Args:
-            vertices: The vertices to triangulate.
+            vertices: The vertices to triangulate, as Vector2s or as an (N,2) array of their coordinates.
             segments: The segments of the CDT.
             window: An optional Window. If it is not None, upon drawing the Triangulation2 will either display or save
             an image depicting its current state.
             display_mode: If drawn images should be displayed (if False, they will be saved). Only relevant if window is
             not None.
             order: The order to draw elements when drawing. See the description of the order arg for the draw method.
+            debug_draw: If intermediate states should be drawn: after every triangle the merge step stitches, after
+            every half the divide-and-conquer solves, and after every flip. Only relevant if window is not None.
+            verbose: If the divide-and-conquer should print every range it triangulates and merges.
         """
-        self.vertices = vertices
+        # The vertices are stored as one array of coordinates rather than as one Vector2 per vertex.
+        if isinstance(vertices, np.ndarray):
+            points = np.array(vertices, dtype=np.float64).reshape(-1, 2)
+        else:
+            points = np.array([(v.x, v.y) for v in vertices], dtype=np.float64).reshape(-1, 2)
         self.indices = []
         if segments is None:
             self.__segments = []
         else:
             self.__segments = segments
-        self.triangles = []  # type: List[Triangle2]
+        # The segments as (low, high) edges, kept for draw as a set and as an (S,2) int64 array.
+        self.__segment_edges = frozenset(
+            (a, b) if a < b else (b, a) for a, b in self.__segments)  # type: FrozenSet[Tuple[int, int]]
+        self.__segment_array = self.__edge_array(self.__segment_edges)  # type: np.ndarray
+        # The vertex and neighbor indices of every triangle, as rows. Only the first num_triangles rows are meaningful,
+        # and the missing vertex 2 of a ghost triangle is NO_INDEX (-1).
+        self._tv = np.empty((0, 3), dtype=np.int32)  # type: np.ndarray
+        self._tn = np.empty((0, 3), dtype=np.int32)  # type: np.ndarray
+        self.num_triangles = 0
+        self.points = points  # type: np.ndarray
+        self.__x = []  # type: List[float]
+        self.__y = []  # type: List[float]
+        # The grid nearest searches, built on the first search after the vertices are set.
+        self.__grid = None  # type: Optional[_Grid]
         self.window = window
         self.display_mode = display_mode
         self.order = order
+        self.debug_draw = debug_draw
+        self.verbose = verbose
 
-    def triangulate(self, merge_method: MergeMethod, cut_method: CutMethod) -> None:
+    def triangulate(self, merge_method: MergeMethod, cut_method: CutMethod, workers: int = 1) -> None:
         """Triangulates the vertices using a recursive divide-and-conquer method using the specified merge and and cut
         methods.
 
+        The halves of the top levels of the recursion are independent until they are merged, so with more than one
+        worker they are triangulated in worker processes and merged here. The triangles are the same, in the same
+        order, as those of a sequential triangulation. Fewer than _PARALLEL_MIN_VERTICES vertices, or a window to draw
+        the intermediate triangulations to, triangulate sequentially. The worker processes are opt-in: where they are
+        spawned rather than forked (Windows, macOS), they import the calling script, which must then guard its
+        top-level code with if __name__ == '__main__'.
+
         Args:
             merge_method: The method to merge with.
             cut_method: The method to cut with.
+            workers: The number of worker processes. 1 triangulates sequentially, in this process.
         """
-        self.triangles = []
+        self.num_triangles = 0
 
         # TODO: Implement.
         if merge_method is MergeMethod.FLIP or merge_method is MergeMethod.DELAUNAY:
@@ -161,15 +305,240 @@ class Triangulation2(object):
         if cut_method is CutMethod.HORIZONTAL or cut_method is CutMethod.ALTERNATING:
             raise Exception('NOT IMPLEMENTED.')
 
-        # Sort in accordance with cut method.
+        # Sort in accordance with cut method. This also sets the coordinate columns the predicates read.
         self.__sort(cut_method)
 
         # Cannot triangulate 1 point.
-        if len(self.vertices) < 2:
+        if len(self.points) < 2:
+            return
+
+        # Triangulate recursively. A triangulation of n vertices, ghost triangles included, has at most 2n - 2
+        # triangles, so the triangle arrays are allocated once for all of them.
+        num_vertices = len(self.points)
+        self._tv = reserve(self._tv, 2 * num_vertices)
+        self._tn = reserve(self._tn, 2 * num_vertices)
+        if workers < 2 or num_vertices < _PARALLEL_MIN_VERTICES or self.window is not None:
+            self.__divide_and_conquer(0, num_vertices)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}  # type: Dict[Tuple[int, int], Future]
+            self.__submit_ranges(executor, futures, 0, num_vertices, workers)
+            self.__gather_ranges(futures, 0, num_vertices)
+
+    def _triangulate_sorted_range(self, begin: int, end: int) -> Tuple[np.ndarray, np.ndarray, int, int, int, int]:
+        """Triangulates a range of the vertices as the only triangles of this Triangulation2, without sorting: points
+        must already be sorted and free of duplicates, as triangulate leaves them.
+
+        Args:
+            begin: The beginning of the range of vertices to triangulate (inclusive).
+            end: The end of the range of vertices to triangulate (exclusive).
+
+        Returns:
+            The vertex and neighbor rows of the triangles, then triangles 2, 3, 6, and 7 of the triangulation.
+        """
+        self.__set_points(self.points)
+        self.num_triangles = 0
+        self._tv = reserve(self._tv, 2 * (end - begin))
+        self._tn = reserve(self._tn, 2 * (end - begin))
+        tri_2, tri_3, tri_6, tri_7 = self.__divide_and_conquer(begin, end)
+        return (self._tv[:self.num_triangles], self._tn[:self.num_triangles],
+                int(tri_2), int(tri_3), int(tri_6), int(tri_7))
+
+    def __submit_ranges(self, executor: Executor, futures: Dict[Tuple[int, int], Future], begin: int, end: int,
+                        workers: int) -> None:
+        """Splits a range of the vertices as __divide_and_conquer does until there is a range per worker, and submits
+        the triangulation of each range to the executor.
+
+        Args:
+            executor: The executor to submit to.
+            futures: The futures of the submitted ranges, by (begin, end). Filled by this method.
+            begin: The beginning of the range of vertices (inclusive).
+            end: The end of the range of vertices (exclusive).
+            workers: The number of workers for the range.
+        """
+        if workers < 2 or end - begin < _PARALLEL_MIN_VERTICES:
+            futures[begin, end] = executor.submit(_triangulate_range_worker, self.points, begin, end)
             return
+        divider = ((end - begin) >> 1) + begin
+        self.__submit_ranges(executor, futures, begin, divider, (workers + 1) >> 1)
+        self.__submit_ranges(executor, futures, divider, end, workers >> 1)
+
+    def __gather_ranges(self, futures: Dict[Tuple[int, int], Future], begin: int,
+                        end: int) -> Tuple[int, int, int, int]:
+        """The counterpart of __divide_and_conquer for ranges split by __submit_ranges. Appends the triangles of each
+        submitted range, shifting their neighbor indices past the triangles already present, and merges the ranges in
+        the order __divide_and_conquer would.
+
+        Args:
+            futures: The futures of the submitted ranges, by (begin, end).
+            begin: The beginning of the range of vertices (inclusive).
+            end: The end of the range of vertices (exclusive).
+
+        Returns:
+            Triangles 2, 3, 6, and 7 of the triangulation.
+        """
+        if (begin, end) in futures:
+            tv, tn, tri_2, tri_3, tri_6, tri_7 = futures[begin, end].result()
+            offset = self.num_triangles
+            count = len(tv)
+            self._tv = grow(self._tv, offset + count)
+            self._tn = grow(self._tn, offset + count)
+            self._tv[offset:offset + count] = tv
+            self._tn[offset:offset + count] = tn + offset
+            self.num_triangles = offset + count
+            return tri_2 + offset, tri_3 + offset, tri_6 + offset, tri_7 + offset
+        divider = ((end - begin) >> 1) + begin
+        tri_l2, tri_l3, tri_l6, tri_l7 = self.__gather_ranges(futures, begin, divider)
+        tri_r2, tri_r3, tri_r6, tri_r7 = self.__gather_ranges(futures, divider, end)
+        self.__merge_arbitrary(tri_l6, tri_l7, tri_r2, tri_r3)
+        return self.__find_ghosts(tri_l2, tri_l3, tri_r6, tri_r7)
+
+    @property
+    def vertices(self) -> ElementList:
+        """The vertices, as Vector2s read from and written to points one at a time. Assigning a list of Vector2s
+        replaces them."""
+        return ElementList(lambda: len(self.points), self.__vertex, self.__store_vertex, self.__add_vertex)
+
+    @vertices.setter
+    def vertices(self, vertices: List[Vector2]) -> None:
+        self.__set_points(np.array([(v.x, v.y) for v in vertices], dtype=np.float64).reshape(-1, 2))
+
+    def __vertex(self, index: int) -> Vector2:
+        x, y = self.points[index].tolist()
+        return Vector2(x, y)
+
+    def __store_vertex(self, index: int, vertex: Vector2) -> None:
+        self.points[index] = (vertex.x, vertex.y)
+        if index < len(self.__x):
+            self.__x[index] = vertex.x
+            self.__y[index] = vertex.y
+        self.__grid = None
+
+    def __add_vertex(self, vertex: Vector2) -> int:
+        index = len(self.points)
+        self.__set_points(np.concatenate((self.points, [(vertex.x, vertex.y)])))
+        return index
+
+    @property
+    def triangles(self) -> ElementList:
+        """The triangles, as Triangle2s that read and write the triangle arrays, with the missing vertex 2 of a ghost
+        triangle as None. Assigning a list of Triangle2s replaces them."""
+        return ElementList(lambda: self.num_triangles, lambda index: _TriangleView2(self, index), self.__store_triangle,
+                           lambda t: self.__add_triangle(_indices(t.v), _indices(t.n)))
+
+    @triangles.setter
+    def triangles(self, triangles: List[Triangle2]) -> None:
+        self._tv = np.array([_indices(t.v) for t in triangles], dtype=np.int32).reshape(-1, 3)
+        self._tn = np.array([_indices(t.n) for t in triangles], dtype=np.int32).reshape(-1, 3)
+        self.num_triangles = len(triangles)
+
+    def __store_triangle(self, index: int, triangle: Triangle2) -> None:
+        self._tv[index] = _indices(triangle.v)
+        self._tn[index] = _indices(triangle.n)
+
+    def nearest(self, point: Vector2) -> int:
+        """Finds the vertex nearest to a point.
+
+        With at least _GRID_MIN_VERTICES vertices, a uniform grid of the vertices is built on the first search and
+        searched ring by ring outward from the cell of the point, so a search visits a few cells rather than every
+        vertex. The grid is rebuilt after the vertices change, as triangulate does when it sorts them.
+
+        Args:
+            point: The point to search from.
+
+        Returns:
+            The index of a vertex nearest to the point, in the order of the vertices after sorting. NO_INDEX if there
+            are no vertices.
+        """
+        num_vertices = len(self.points)
+        if num_vertices == 0:
+            return NO_INDEX
+        px = point.x
+        py = point.y
+        if num_vertices < _GRID_MIN_VERTICES:
+            offsets = self.points - (px, py)
+            return int(np.argmin(np.einsum('ij,ij->i', offsets, offsets)))
+        if self.__grid is None:
+            self.__grid = self.__build_grid()
+        min_x, min_y, size, columns, rows, starts, indices, x, y = self.__grid
+        # column, row: The cell of the point, which may be outside the grid. The search starts at the first ring of
+        # cells around it that reaches the grid.
+        column = math.floor((px - min_x) / size)
+        row = math.floor((py - min_y) / size)
+        ring = max(0, -column, column - columns + 1, -row, row - rows + 1)
+        best = NO_INDEX
+        best_d2 = math.inf
+        while True:
+            column_0 = max(column - ring, 0)
+            column_1 = min(column + ring, columns - 1)
+            for cell_row in range(max(row - ring, 0), min(row + ring, rows - 1) + 1):
+                if cell_row == row - ring or cell_row == row + ring:
+                    cell_columns = range(column_0, column_1 + 1)
+                else:
+                    cell_columns = [c for c in (column - ring, column + ring) if 0 <= c < columns]
+                for cell_column in cell_columns:
+                    cell = cell_row * columns + cell_column
+                    for slot in range(starts[cell], starts[cell + 1]):
+                        dx = x[slot] - px
+                        dy = y[slot] - py
+                        d2 = dx * dx + dy * dy
+                        if d2 < best_d2:
+                            best_d2 = d2
+                            best = slot
+            # Every cell outside the rings searched is at least ring * size from the point.
+            reach = ring * size
+            if best_d2 <= reach * reach or (column - ring <= 0 and column + ring >= columns - 1 and
+                                            row - ring <= 0 and row + ring >= rows - 1):
+                return indices[best]
+            ring += 1
+
+    def __build_grid(self) -> _Grid:
+        """Builds the grid nearest searches: square cells over the bounding box of the vertices, about two vertices to
+        a cell.
+
+        Returns:
+            The lower corner of the grid, the side of a cell, the numbers of columns and rows, the start of each cell's
+            vertices plus the end of the last, and the indices and coordinates of the vertices, ordered by cell.
+        """
+        points = self.points
+        num_vertices = len(points)
+        min_x, min_y = points.min(axis=0).tolist()
+        max_x, max_y = points.max(axis=0).tolist()
+        width = max_x - min_x
+        height = max_y - min_y
+        if width * height > 0.0:
+            size = math.sqrt(2.0 * width * height / num_vertices)
+        else:
+            # Co-linear or coincident vertices: cells along the line, or a single cell.
+            size = 2.0 * max(width, height) / num_vertices or 1.0
+        columns = int(width / size) + 1
+        rows = int(height / size) + 1
+        cell_columns = np.minimum(((points[:, 0] - min_x) / size).astype(np.intp), columns - 1)
+        cell_rows = np.minimum(((points[:, 1] - min_y) / size).astype(np.intp), rows - 1)
+        cells = cell_rows * columns + cell_columns
+        order = np.argsort(cells, kind='stable')
+        starts = np.searchsorted(cells[order], np.arange(columns * rows + 1))
+        ordered = points[order]
+        return (min_x, min_y, size, columns, rows, starts.tolist(), order.tolist(), ordered[:, 0].tolist(),
+                ordered[:, 1].tolist())
+
+    def __add_triangle(self, v: Tuple[int, int, int], n: Tuple[int, int, int]) -> int:
+        """Appends a triangle, growing the triangle arrays geometrically when they are full.
 
-        # Triangulate recursively.
-        self.__divide_and_conquer(0, len(self.vertices))
+        Args:
+            v: The vertex indices. NO_INDEX for the missing vertex 2 of a ghost triangle.
+            n: The neighbor triangle indices.
+
+        Returns:
+            The index of the triangle.
+        """
+        index = self.num_triangles
+        self._tv = grow(self._tv, index + 1)
+        self._tn = grow(self._tn, index + 1)
+        self._tv[index] = v
+        self._tn[index] = n
+        self.num_triangles = index + 1
+        return index
 
     def __sort(self, cut_method: CutMethod) -> None:
         """Sorts the vertices according to the kind of cuts that will be used in the divide-and-conquer portion of the
@@ -178,26 +547,27 @@ class Triangulation2(object):
         Args:
             cut_method: The method to cut with.
         """
-        if len(self.vertices) < 2:
+        # Sorting and finding duplicates run over the columns of the coordinates rather than over Vector2s with a key
+        # function per vertex.
+        points = self.points
+        if len(points) < 2:
+            self.__set_points(points)
             return
 
-        # Sort the vertices so that duplicates can be discarded.
+        # Sort the vertices so that duplicates can be discarded. The sort is stable, so duplicates keep their order.
         if cut_method is CutMethod.HORIZONTAL:
-            enumerated_vertices = sorted(enumerate(self.vertices), key=lambda vp: (vp[1][1], vp[1][0]))
+            order = np.lexsort((points[:, 0], points[:, 1]))
         else:
-            enumerated_vertices = sorted(enumerate(self.vertices), key=lambda vp: (vp[1][0], vp[1][1]))
-
-        # Eliminate duplicates.
-        self.vertices = []
-        self.indices = [None] * len(enumerated_vertices)  # type: List[Optional[int]]
-        self.vertices.append(enumerated_vertices[0][1])
-        self.indices[enumerated_vertices[0][0]] = 0
-        for index, vertex in enumerated_vertices[1:]:
-            if self.vertices[len(self.vertices) - 1] == vertex:
-                self.indices[index] = len(self.vertices) - 1
-                continue
-            self.indices[index] = len(self.vertices)
-            self.vertices.append(vertex)
+            order = np.lexsort((points[:, 1], points[:, 0]))
+        points = points[order]
+
+        # Eliminate duplicates, keeping the first of each run of equal vertices.
+        duplicate = np.zeros(len(points), dtype=bool)
+        duplicate[1:] = np.all(points[1:] == points[:-1], axis=1)
+        indices = np.empty(len(points), dtype=np.intp)
+        indices[order] = np.cumsum(~duplicate) - 1
+        self.indices = indices.tolist()  # type: List[Optional[int]]
+        self.__set_points(points[~duplicate])
 
         # TODO: Implement.
         # Sort for alternating cuts.
@@ -205,12 +575,35 @@ class Triangulation2(object):
             raise Exception('NOT IMPLEMENTED.')
 
         # Adjust the segments.
-        old_segments = self.__segments
-        self.__segments = []
-        for old_segment in old_segments:
-            new_segment = (self.indices[old_segment[0]], self.indices[old_segment[1]])
-            new_segment = (min(new_segment), max(new_segment))
-            self.__segments.append(new_segment)
+        if self.__segments:
+            segments = indices[np.asarray(self.__segments, dtype=np.intp).reshape(-1, 2)]
+            segments.sort(axis=1)
+            self.__segments = [(a, b) for a, b in segments.tolist()]
+            self.__segment_edges = frozenset(self.__segments)
+            self.__segment_array = self.__edge_array(self.__segment_edges)
+
+    @staticmethod
+    def __edge_array(edges: FrozenSet[Tuple[int, int]]) -> np.ndarray:
+        """Makes an array of a set of edges.
+
+        Args:
+            edges: The edges, as (low, high) vertex indices.
+
+        Returns:
+            (S,2) int64 array of the edges, in sorted order.
+        """
+        return np.array(sorted(edges), dtype=np.int64).reshape(-1, 2)
+
+    def __set_points(self, points: np.ndarray) -> None:
+        """Sets the coordinates of the vertices, as the (N,2) array and as the columns the predicates read.
+
+        Args:
+            points: (N,2) float64 array of the coordinates of the vertices, in the order of the vertices.
+        """
+        self.points = points
+        self.__grid = None
+        self.__x = points[:, 0].tolist()
+        self.__y = points[:, 1].tolist()
 
     # def debug_print(self) -> None:
     #     print('-------------------- DEBUG --------------------')
@@ -237,7 +630,7 @@ class Triangulation2(object):
                 's': Segment edges.
                 'h': Ghost vertices.
                 'v': Regular vertices.
-            radius: The radius of vertices (in pixels).
+            radius: The radius of vertices (in pixels). They are drawn without anti-aliasing, all at once.
             vertex_color: The color of existent vertices (BGR).
             edge_color: The color of regular edges (BGR).
             ghost_color: The color of ghost edges and vertices (BGR).
@@ -250,66 +643,60 @@ class Triangulation2(object):
         if self.window is None:
             return
         self.window.flush()
-        vertices_copy = copy.deepcopy(self.vertices)
-        triangles_copy = copy.deepcopy(self.triangles)
-        segment_edges = set()
-        ghost_edges = set()
-        inner_edges = set()
-        drawn_edges = set()
-        for t in triangles_copy:
-            if t.v[2] is None:
-                v_0 = vertices_copy[t.v[0]]
-                v_1 = vertices_copy[t.v[1]]
-                v_2 = v_0.lerp(v_1, 0.5)
-                v_t = v_1 - v_0
-                v_t = v_t.rotated(math.pi * 0.5)
-                v_t = v_t * ghost_factor
-                v_2 = v_2 + v_t
-                vertices_copy.append(v_2)
-                t.v[2] = len(vertices_copy) - 1
-        for edge in self.__segments:
-            edge = (min(edge), max(edge))
-            segment_edges.add(edge)
-        for t in triangles_copy:
-            for edge in [(t.v[i], t.v[(i + 1) % 3]) for i in range(3)]:
-                edge = (min(edge), max(edge))
-                if edge in segment_edges:
-                    continue
-                if edge[1] >= len(self.vertices):
-                    ghost_edges.add(edge)
-                else:
-                    inner_edges.add(edge)
+        # Ghost vertices get display positions appended after the vertices, one per ghost triangle in triangle order,
+        # a ghost_factor of the hull edge out from its midpoint. They are computed for all the ghost triangles at once,
+        # with the operations of Vector2.lerp, rotated_batch, and Vector2.times in the same order, and the ghost rows
+        # of the triangle vertices point at them.
+        num_vertices = len(self.points)
+        tv = self._tv[:self.num_triangles].astype(np.int64)
+        ghost = tv[:, 2] == NO_INDEX
+        tv[ghost, 2] = np.arange(num_vertices, num_vertices + np.count_nonzero(ghost))
+        v_0 = self.points[tv[ghost, 0]]
+        v_1 = self.points[tv[ghost, 1]]
+        v_t = rotated_batch(v_1 - v_0, math.pi * 0.5)
+        v_2 = (v_0 + (v_1 - v_0) * 0.5) + v_t * ghost_factor
+        all_points = np.concatenate((self.points, v_2))
+        # Every edge of every triangle as (low, high), coded as low * len(all_points) + high so that deduplicating
+        # the edges and removing the segment edges are array operations. Ghost edges are the ones to a ghost vertex.
+        num_codes = len(all_points)
+        edges = np.concatenate((tv[:, [0, 1]], tv[:, [1, 2]], tv[:, [2, 0]]))
+        edges.sort(axis=1)
+        codes = np.unique(edges[:, 0] * num_codes + edges[:, 1])
+        segment_edges = self.__segment_edges
+        if segment_edges:
+            segment_codes = self.__segment_array[:, 0] * num_codes + self.__segment_array[:, 1]
+            codes = codes[~np.isin(codes, segment_codes)]
+        is_ghost = codes % num_codes >= num_vertices
+        ghost_edges = np.divmod(codes[is_ghost], num_codes)
+        inner_edges = np.divmod(codes[~is_ghost], num_codes)
+        # The ghost and regular edges are disjoint, so an edge can only be drawn twice if order repeats a character.
+        drawn = set()
         for char in order:
             if char == 'g':
-                for edge in ghost_edges:
-                    if edge not in drawn_edges:
-                        self.window.draw_line(vertices_copy[edge[0]], vertices_copy[edge[1]], ghost_color,
-                                              ghost_thickness)
-                        drawn_edges.add(edge)
+                if char not in drawn:
+                    self.window.draw_lines(all_points[ghost_edges[0]], all_points[ghost_edges[1]], ghost_color,
+                                           ghost_thickness)
+                    drawn.add(char)
             elif char == 'e':
-                for edge in inner_edges:
-                    if edge not in drawn_edges:
-                        self.window.draw_line(vertices_copy[edge[0]], vertices_copy[edge[1]], edge_color,
-                                              real_thickness)
-                        drawn_edges.add(edge)
+                if char not in drawn:
+                    self.window.draw_lines(all_points[inner_edges[0]], all_points[inner_edges[1]], edge_color,
+                                           real_thickness)
+                    drawn.add(char)
             elif char == 's':
-                for edge in segment_edges:
-                    if edge not in drawn_edges:
-                        self.window.draw_line(vertices_copy[edge[0]], vertices_copy[edge[1]], segment_color,
-                                              real_thickness)
+                segments = self.__segment_array
+                self.window.draw_lines(all_points[segments[:, 0]], all_points[segments[:, 1]], segment_color,
+                                       real_thickness)
             elif char == 'h':
-                for v in vertices_copy[len(self.vertices):]:
-                    self.window.draw_circle(v, radius, ghost_color, -1)
+                self.window.draw_circles(all_points[num_vertices:], radius, ghost_color, -1, LineType.LINE_8)
             elif char == 'v':
-                for v in self.vertices:
-                    self.window.draw_circle(v, radius, vertex_color, -1)
+                self.window.draw_circles(all_points[:num_vertices], radius, vertex_color, -1, LineType.LINE_8)
         if self.display_mode:
             self.window.display()
         else:
             for _ in range(n):
                 self.window.save_image()
 
-    def __side(self, a: int, b: int, c: int) -> Orientation:
+    def __side(self, a: int, b: int, c: int) -> int:
         """Vector sideness predicate.
 
         Args:
@@ -318,25 +705,9 @@ class Triangulation2(object):
             c: The index of the vector to determine sideness of w.r.t. (a,b).
 
         Returns:
-            The orientation (left, right, or co-linear).
-        """
-        return side(self.vertices[a], self.vertices[b], self.vertices[c])
-
-    def __in_circle(self, t: int, d: Vector2) -> Position:
-        """Vector in-circle predicate.
-
-        Args:
-            t: The triangle with counter-clockwise vertices (a,b,c).
-            d: Vector d to test the position of w.r.t. (a,b,c).
-
-        Returns:
-            The position (in-circle, out-circle, or on-circle).
+            The orientation as the sign of the signed area: >0 if left, <0 if right, or 0 if co-linear.
         """
-        triangle = self.triangles[t]
-        a = self.vertices[triangle.v[0]]
-        b = self.vertices[triangle.v[1]]
-        c = self.vertices[triangle.v[2]]
-        return in_circle(a, b, c, d)
+        return side_idx(self.__x, self.__y, a, b, c)
 
     def __trivial_triangulation(self, begin: int, end: int) -> Tuple[int, int, int, int]:
         """Trivial triangulation of 2 or 3 vertices.
@@ -355,59 +726,25 @@ class Triangulation2(object):
         # TODO: Make this also return triangles 0, 1, 4, and 5 of the triangulation.
         # NOTE: We need to do this in order to support horizontal or alternating cuts.
         # NOTE: This should be very straight forward.
-        num = end - begin
-        num_t = len(self.triangles)
-        if num < 3:
+        if end - begin < 3:
             # There are 2 vertices. Connect them as an edge.
             # t_0 is the ghost triangle with the ghost vertex to the left of the edge connecting the vertices in order.
             # t_1 is the ghost triangle on the opposite side of the edge.
-            t_0 = Triangle2((begin, begin + 1, None), (num_t + 1, num_t + 1, num_t + 1))
-            t_1 = Triangle2((begin + 1, begin, None), (num_t, num_t, num_t))
-            self.triangles.append(t_0)
-            self.triangles.append(t_1)
-            return num_t, num_t + 1, num_t + 1, num_t
+            case = 2
         else:
-            # There are 3 vertices. Connect them as a triangle if they are not co-linear.
-            orientation = self.__side(begin, begin + 1, begin + 2)
-            if orientation is Orientation.LEFT:
-                # The 3rd vertex is to the left of the edge connecting the first 2 vertices in order.
-                print('Trivial: Oriented left.')
-                end_pt = begin + 1
-                left_pt = begin + 2
-                t_0 = Triangle2((begin, end_pt, left_pt), (num_t + 1, num_t + 2, num_t + 3))
-                t_1 = Triangle2((end_pt, begin, None), (num_t, num_t + 3, num_t + 2))
-                t_2 = Triangle2((left_pt, end_pt, None), (num_t, num_t + 1, num_t + 3))
-                t_3 = Triangle2((begin, left_pt, None), (num_t, num_t + 2, num_t + 1))
-                self.triangles.append(t_0)
-                self.triangles.append(t_1)
-                self.triangles.append(t_2)
-                self.triangles.append(t_3)
-                return num_t + 3, num_t + 1, num_t + 2, num_t + 3
-            elif orientation is Orientation.RIGHT:
-                # The 3rd vertex is to the right of the edge connecting the first 2 vertices in order.
-                print('Trivial: Oriented right.')
-                end_pt = begin + 2
-                left_pt = begin + 1
-                t_0 = Triangle2((begin, end_pt, left_pt), (num_t + 1, num_t + 2, num_t + 3))
-                t_1 = Triangle2((end_pt, begin, None), (num_t, num_t + 3, num_t + 2))
-                t_2 = Triangle2((left_pt, end_pt, None), (num_t, num_t + 1, num_t + 3))
-                t_3 = Triangle2((begin, left_pt, None), (num_t, num_t + 2, num_t + 1))
-                self.triangles.append(t_0)
-                self.triangles.append(t_1)
-                self.triangles.append(t_2)
-                self.triangles.append(t_3)
-                return num_t + 3, num_t + 1, num_t + 1, num_t + 2
-            # The 3 vertices are co-linear.
-            print('Trivial: Oriented co-linear.')
-            t_0 = Triangle2((begin, begin + 1, None), (num_t + 1, num_t + 2, num_t + 1))
-            t_1 = Triangle2((begin + 1, begin, None), (num_t, num_t, num_t + 3))
-            t_2 = Triangle2((begin + 1, begin + 2, None), (num_t + 3, num_t + 3, num_t))
-            t_3 = Triangle2((begin + 2, begin + 1, None), (num_t + 2, num_t + 1, num_t + 2))
-            self.triangles.append(t_0)
-            self.triangles.append(t_1)
-            self.triangles.append(t_2)
-            self.triangles.append(t_3)
-            return num_t, num_t + 1, num_t + 3, num_t + 2
+            # There are 3 vertices. Connect them as a triangle if they are not co-linear. The case is 1 if the 3rd
+            # vertex is to the left of the edge connecting the first 2 vertices in order, -1 if it is to the right, or 0
+            # if the 3 vertices are co-linear.
+            case = self.__side(begin, begin + 1, begin + 2)
+        v_offsets, v_begin, n_offsets, ghosts = _TRIVIAL_TEMPLATES[case]
+        num_t = self.num_triangles
+        count = len(n_offsets)
+        self._tv = grow(self._tv, num_t + count)
+        self._tn = grow(self._tn, num_t + count)
+        self._tv[num_t:num_t + count] = v_offsets + begin * v_begin
+        self._tn[num_t:num_t + count] = n_offsets + num_t
+        self.num_triangles = num_t + count
+        return num_t + ghosts[0], num_t + ghosts[1], num_t + ghosts[2], num_t + ghosts[3]
 
     def __merge_arbitrary(self, tri_l6: int, tri_l7: int, tri_r2: int, tri_r3: int) -> None:
         """Merges 2 triangulations.
@@ -433,67 +770,65 @@ class Triangulation2(object):
         # NOTE:   addition, add every hull edge (the base of the resurrected triangle) to tbe edge queue. Why? We can
         # NOTE:   envision a scenario I think where the edge created might be locally delaunay but the previous hull
         # NOTE:   edge might not be.
-        num_t = len(self.triangles)
+        num_t = self.num_triangles
+        # The stitching loops run on locals and call side_f on the coordinate columns directly, as the interpreter
+        # spends more on attribute lookups and the calls through __side than on the predicate itself. Each index is
+        # read once per iteration with item(), which returns a plain int rather than a numpy scalar that every later
+        # subscript and comparison would have to unbox. Appending a triangle may reallocate the triangle arrays, so
+        # they are bound again after it.
+        tv = self._tv
+        tn = self._tn
+        x = self.__x
+        y = self.__y
         # lr_v: the index of the left triangulation's right most vertex.
         # lru_v: the index of the vertex counter-clockwise lr_v on the hull.
         # lrd_v: the index of the vertex clockwise lr_v on the hull.
         # rl_v: the index of the right triangulation's left most vertex.
         # rlu_v: the index of the vertex clockwise rl_v on the hull.
         # rld_v: the index of the vertex counter-clockwise rld_v on the hull.
-        lr_v = self.triangles[tri_l6].v[0]
-        lru_v = self.triangles[tri_l7].v[0]
-        lrd_v = self.triangles[tri_l6].v[1]
-        rl_v = self.triangles[tri_r2].v[0]
-        rlu_v = self.triangles[tri_r2].v[1]
-        rld_v = self.triangles[tri_r3].v[0]
-        if self.__side(lru_v, lr_v, rl_v) is Orientation.LEFT:
-            # We can begin by resurrecting tri_l7
-            initial_tri = tri_l7
-            initial_v = rl_v
-            initial_based_left = True
-            initial_opposite_tri = tri_r2
-            later_opposite_tri = tri_r3
-        elif self.__side(lrd_v, lr_v, rl_v) is Orientation.RIGHT:
-            # We can begin by resurrecting tri_l6
-            initial_tri = tri_l6
-            initial_v = rl_v
-            initial_based_left = True
-            initial_opposite_tri = tri_r2
-            later_opposite_tri = tri_r3
-        elif self.__side(lr_v, rl_v, rlu_v) is Orientation.LEFT:
-            # We can begin by resurrecting tri_r2
-            initial_tri = tri_r2
-            initial_v = lr_v
-            initial_based_left = False
-            initial_opposite_tri = tri_l7
-            later_opposite_tri = tri_l6
-        elif self.__side(lr_v, rl_v, rld_v) is Orientation.RIGHT:
-            # We can begin by resurrecting tri_r3
-            initial_tri = tri_r3
-            initial_v = lr_v
-            initial_based_left = False
-            initial_opposite_tri = tri_l7
-            later_opposite_tri = tri_l6
+        lr_v, lrd_v = tv[tri_l6, :2].tolist()
+        rl_v, rlu_v = tv[tri_r2, :2].tolist()
+        lru_v = int(tv[tri_l7, 0])
+        rld_v = int(tv[tri_r3, 0])
+        # The ghost triangle to resurrect first is picked by the first of four sideness tests that holds. Each test
+        # indexes a row of (initial_tri, initial_v, initial_based_left, initial_opposite_tri, later_opposite_tri), so
+        # the outcome is one lookup rather than a branch per test that repeats the assignments.
+        if side_f(x[lru_v], y[lru_v], x[lr_v], y[lr_v], x[rl_v], y[rl_v]) > 0:
+            # We can begin by resurrecting tri_l7.
+            case = 0
+        elif side_f(x[lrd_v], y[lrd_v], x[lr_v], y[lr_v], x[rl_v], y[rl_v]) < 0:
+            # We can begin by resurrecting tri_l6.
+            case = 1
+        elif side_f(x[lr_v], y[lr_v], x[rl_v], y[rl_v], x[rlu_v], y[rlu_v]) > 0:
+            # We can begin by resurrecting tri_r2.
+            case = 2
+        elif side_f(x[lr_v], y[lr_v], x[rl_v], y[rl_v], x[rld_v], y[rld_v]) < 0:
+            # We can begin by resurrecting tri_r3.
+            case = 3
         else:
             # We are dealing with co-linear points.
-            t_0 = Triangle2((lr_v, rl_v, None), (num_t + 1, tri_r2, tri_l7))
-            t_1 = Triangle2((rl_v, lr_v, None), (num_t + 0, tri_l6, tri_r3))
-            self.triangles[tri_l7].n[1] = num_t + 0
-            self.triangles[tri_r2].n[2] = num_t + 0
-            self.triangles[tri_l6].n[2] = num_t + 1
-            self.triangles[tri_r3].n[1] = num_t + 1
-            self.triangles.append(t_0)
-            self.triangles.append(t_1)
+            tn[tri_l7, 1] = num_t + 0
+            tn[tri_r2, 2] = num_t + 0
+            tn[tri_l6, 2] = num_t + 1
+            tn[tri_r3, 1] = num_t + 1
+            self.__add_triangle((lr_v, rl_v, NO_INDEX), (num_t + 1, tri_r2, tri_l7))
+            self.__add_triangle((rl_v, lr_v, NO_INDEX), (num_t + 0, tri_l6, tri_r3))
             return
+        initial_tri, initial_v, initial_based_left, initial_opposite_tri, later_opposite_tri = (
+            (tri_l7, rl_v, True, tri_r2, tri_r3),
+            (tri_l6, rl_v, True, tri_r2, tri_r3),
+            (tri_r2, lr_v, False, tri_l7, tri_l6),
+            (tri_r3, lr_v, False, tri_l7, tri_l6),
+        )[case]
         # Resurrect initial_tri.
-        self.triangles[initial_tri].v[2] = initial_v
+        tv[initial_tri, 2] = initial_v
         # Stitch above the initial triangle.
         based_left = initial_based_left
         current_tri = initial_tri
         opposite_tri = initial_opposite_tri
         while True:
-            # FIXME: Get rid of draws when debugging not necessary.
-            self.draw(order=self.order)
+            if self.debug_draw:
+                self.draw(order=self.order)
             # First we determine the following indices:
             # l_v: The upper left vertex on the most recently resurrect ghost triangle.
             # r_v: The upper right vertex on the most recently resurrect ghost triangle.
@@ -502,130 +837,130 @@ class Triangulation2(object):
             # How we get these values is different depending on if the resurrected triangle is from the left or right
             # triangulation.
             if based_left:
-                l_v = self.triangles[current_tri].v[0]
-                r_v = self.triangles[current_tri].v[2]
-                lg_tri = self.triangles[current_tri].n[2]
+                l_v = tv.item(current_tri, 0)
+                r_v = tv.item(current_tri, 2)
+                lg_tri = tn.item(current_tri, 2)
                 rg_tri = opposite_tri
-                lu_v = self.triangles[lg_tri].v[0]
-                ru_v = self.triangles[opposite_tri].v[1]
+                lu_v = tv.item(lg_tri, 0)
+                ru_v = tv.item(opposite_tri, 1)
                 c_tri_neighbor = 2
             else:
-                l_v = self.triangles[current_tri].v[2]
-                r_v = self.triangles[current_tri].v[1]
+                l_v = tv.item(current_tri, 2)
+                r_v = tv.item(current_tri, 1)
                 lg_tri = opposite_tri
-                rg_tri = self.triangles[current_tri].n[1]
-                lu_v = self.triangles[opposite_tri].v[0]
-                ru_v = self.triangles[rg_tri].v[1]
+                rg_tri = tn.item(current_tri, 1)
+                lu_v = tv.item(opposite_tri, 0)
+                ru_v = tv.item(rg_tri, 1)
                 c_tri_neighbor = 1
             # We now have the specified vertices and can determine which triangle to resurrect.
-            if self.__side(lu_v, l_v, r_v) is Orientation.LEFT:
+            if side_f(x[lu_v], y[lu_v], x[l_v], y[l_v], x[r_v], y[r_v]) > 0:
                 # We can resurrect the left triangle.
                 # Resurrect it.
-                self.triangles[lg_tri].v[2] = r_v
+                tv[lg_tri, 2] = r_v
                 # Make the two recently resurrected triangles neighbors.
-                self.triangles[lg_tri].n[1] = current_tri
-                self.triangles[current_tri].n[c_tri_neighbor] = lg_tri
+                tn[lg_tri, 1] = current_tri
+                tn[current_tri, c_tri_neighbor] = lg_tri
                 # Update the information we need for the next iteration.
                 if not based_left:
                     opposite_tri = rg_tri
-                    # opposite_tri = self.triangles[opposite_tri].n[2]
+                    # opposite_tri = tn[opposite_tri, 2]
                 based_left = True
                 current_tri = lg_tri
-            elif self.__side(ru_v, r_v, l_v) is Orientation.RIGHT:
+            elif side_f(x[ru_v], y[ru_v], x[r_v], y[r_v], x[l_v], y[l_v]) < 0:
                 # We can resurrect the right triangle.
                 # Resurrect it.
-                self.triangles[rg_tri].v[2] = l_v
+                tv[rg_tri, 2] = l_v
                 # Make the two recently resurrected triangles neighbors.
-                self.triangles[rg_tri].n[2] = current_tri
-                self.triangles[current_tri].n[c_tri_neighbor] = rg_tri
+                tn[rg_tri, 2] = current_tri
+                tn[current_tri, c_tri_neighbor] = rg_tri
                 # Update the information we need for the next iteration.
                 if based_left:
                     opposite_tri = lg_tri
-                    # opposite_tri = self.triangles[opposite_tri].n[1]
+                    # opposite_tri = tn[opposite_tri, 1]
                 based_left = False
                 current_tri = rg_tri
             else:
                 # We cannot stitch upwards anymore.
                 # Create a new ghost triangle and break.
-                num_tri = len(self.triangles)
+                num_tri = self.num_triangles
                 if based_left:
                     rg_tri = opposite_tri
-                    lg_tri = self.triangles[current_tri].n[2]
-                    self.triangles[current_tri].n[2] = num_tri
+                    lg_tri = tn.item(current_tri, 2)
+                    tn[current_tri, 2] = num_tri
                 else:
-                    rg_tri = self.triangles[current_tri].n[1]
+                    rg_tri = tn.item(current_tri, 1)
                     lg_tri = opposite_tri
-                    self.triangles[current_tri].n[1] = num_tri
-                self.triangles[rg_tri].n[2] = num_tri
-                self.triangles[lg_tri].n[1] = num_tri
-                new_ghost = Triangle2((l_v, r_v, None), (current_tri, rg_tri, lg_tri))
-                self.triangles.append(new_ghost)
+                    tn[current_tri, 1] = num_tri
+                tn[rg_tri, 2] = num_tri
+                tn[lg_tri, 1] = num_tri
+                self.__add_triangle((l_v, r_v, NO_INDEX), (current_tri, rg_tri, lg_tri))
                 break
         # Stitch below the initial triangle.
+        tv = self._tv
+        tn = self._tn
         based_left = initial_based_left
         current_tri = initial_tri
         opposite_tri = later_opposite_tri
         while True:
-            # FIXME: Get rid of draws when debugging not necessary.
-            self.draw(order=self.order)
+            if self.debug_draw:
+                self.draw(order=self.order)
             if based_left:
-                l_v = self.triangles[current_tri].v[1]
-                r_v = self.triangles[current_tri].v[2]
-                lg_tri = self.triangles[current_tri].n[1]
+                l_v = tv.item(current_tri, 1)
+                r_v = tv.item(current_tri, 2)
+                lg_tri = tn.item(current_tri, 1)
                 rg_tri = opposite_tri
-                ld_v = self.triangles[lg_tri].v[1]
-                rd_v = self.triangles[opposite_tri].v[0]
+                ld_v = tv.item(lg_tri, 1)
+                rd_v = tv.item(opposite_tri, 0)
                 c_tri_neighbor = 1
             else:
-                l_v = self.triangles[current_tri].v[2]
-                r_v = self.triangles[current_tri].v[0]
+                l_v = tv.item(current_tri, 2)
+                r_v = tv.item(current_tri, 0)
                 lg_tri = opposite_tri
-                rg_tri = self.triangles[current_tri].n[2]
-                ld_v = self.triangles[opposite_tri].v[1]
-                rd_v = self.triangles[rg_tri].v[0]
+                rg_tri = tn.item(current_tri, 2)
+                ld_v = tv.item(opposite_tri, 1)
+                rd_v = tv.item(rg_tri, 0)
                 c_tri_neighbor = 2
-            if self.__side(ld_v, l_v, r_v) is Orientation.RIGHT:
+            if side_f(x[ld_v], y[ld_v], x[l_v], y[l_v], x[r_v], y[r_v]) < 0:
                 # We can resurrect the left triangle.
                 # Resurrect it.
-                self.triangles[lg_tri].v[2] = r_v
+                tv[lg_tri, 2] = r_v
                 # Make the two recently resurrected triangles neighbors.
-                self.triangles[lg_tri].n[2] = current_tri
-                self.triangles[current_tri].n[c_tri_neighbor] = lg_tri
+                tn[lg_tri, 2] = current_tri
+                tn[current_tri, c_tri_neighbor] = lg_tri
                 # Update the information we need for the next iteration.
                 if not based_left:
                     opposite_tri = rg_tri
-                    # opposite_tri = self.triangles[opposite_tri].n[1]
+                    # opposite_tri = tn[opposite_tri, 1]
                 based_left = True
                 current_tri = lg_tri
-            elif self.__side(rd_v, r_v, l_v) is Orientation.LEFT:
+            elif side_f(x[rd_v], y[rd_v], x[r_v], y[r_v], x[l_v], y[l_v]) > 0:
                 # We can resurrect the right triangle.
                 # Resurrect it.
-                self.triangles[rg_tri].v[2] = l_v
+                tv[rg_tri, 2] = l_v
                 # Make the two recently resurrected triangles neighbors.
-                self.triangles[rg_tri].n[1] = current_tri
-                self.triangles[current_tri].n[c_tri_neighbor] = rg_tri
+                tn[rg_tri, 1] = current_tri
+                tn[current_tri, c_tri_neighbor] = rg_tri
                 # Update the information we need for the next iteration.
                 if based_left:
                     opposite_tri = lg_tri
-                    # opposite_tri = self.triangles[opposite_tri].n[2]
+                    # opposite_tri = tn[opposite_tri, 2]
                 based_left = False
                 current_tri = rg_tri
             else:
                 # We cannot stitch downwards anymore.
                 # Create a new ghost triangle and break.
-                num_tri = len(self.triangles)
+                num_tri = self.num_triangles
                 if based_left:
-                    rg_tri = self.triangles[current_tri].n[1]
+                    rg_tri = tn.item(current_tri, 1)
                     lg_tri = opposite_tri
-                    self.triangles[current_tri].n[1] = num_tri
+                    tn[current_tri, 1] = num_tri
                 else:
                     rg_tri = opposite_tri
-                    lg_tri = self.triangles[current_tri].n[2]
-                    self.triangles[current_tri].n[2] = num_tri
-                self.triangles[rg_tri].n[2] = num_tri
-                self.triangles[lg_tri].n[1] = num_tri
-                new_ghost = Triangle2((r_v, l_v, None), (current_tri, rg_tri, lg_tri))
-                self.triangles.append(new_ghost)
+                    lg_tri = tn.item(current_tri, 2)
+                    tn[current_tri, 2] = num_tri
+                tn[rg_tri, 2] = num_tri
+                tn[lg_tri, 1] = num_tri
+                self.__add_triangle((r_v, l_v, NO_INDEX), (current_tri, rg_tri, lg_tri))
                 break
 
     def __find_ghosts(self, tri_l2: int, tri_l3: int, tri_r6: int, tri_r7: int) -> Tuple[int, int, int, int]:
@@ -648,42 +983,32 @@ class Triangulation2(object):
         """
         # TODO: Figure out how to fix tri_d0, tri_d1, tri_u4, and tri_u5.
         # NOTE: This method might suffice as it is now if I pass them in. It might not. Look into it.
-        # Find triangle 2 from tri_l2.
-        first_done = False
-        while self.triangles[tri_l2].v[2] is not None:
-            if first_done:
-                tri_l2 = self.triangles[tri_l2].n[1]
-            else:
-                tri_l2 = self.triangles[tri_l2].n[2]
-                first_done = True
-        # Find triangle 3 from tri_l3.
-        first_done = False
-        while self.triangles[tri_l3].v[2] is not None:
-            if first_done:
-                tri_l3 = self.triangles[tri_l3].n[2]
-            else:
-                tri_l3 = self.triangles[tri_l3].n[1]
-                first_done = True
-        # Find triangle 6 from tri_r6.
-        first_done = False
-        while self.triangles[tri_r6].v[2] is not None:
-            if first_done:
-                tri_r6 = self.triangles[tri_r6].n[1]
-            else:
-                tri_r6 = self.triangles[tri_r6].n[2]
-                first_done = True
-        # Find triangle 7 from tri_r7.
-        first_done = False
-        while self.triangles[tri_r7].v[2] is not None:
-            if first_done:
-                tri_r7 = self.triangles[tri_r7].n[2]
-            else:
-                tri_r7 = self.triangles[tri_r7].n[1]
-                first_done = True
-        return tri_l2, tri_l3, tri_r6, tri_r7
+        return (self.__walk_to_hull(tri_l2, 2, 1), self.__walk_to_hull(tri_l3, 1, 2),
+                self.__walk_to_hull(tri_r6, 2, 1), self.__walk_to_hull(tri_r7, 1, 2))
+
+    def __walk_to_hull(self, tri: int, first_n: int, rest_n: int) -> int:
+        """Walks from a triangle to the nearest ghost triangle, as __find_ghosts does for each of its four triangles.
+
+        Args:
+            tri: The index of the triangle to walk from.
+            first_n: The neighbor slot to step across first.
+            rest_n: The neighbor slot to step across after the first step.
+
+        Returns:
+            The index of the ghost triangle: tri itself if it is a ghost triangle.
+        """
+        # The walk reads the triangle arrays with item(), which returns a plain int rather than a numpy scalar.
+        tv_item = self._tv.item
+        tn_item = self._tn.item
+        if tv_item(tri, 2) == NO_INDEX:
+            return tri
+        tri = tn_item(tri, first_n)
+        while tv_item(tri, 2) != NO_INDEX:
+            tri = tn_item(tri, rest_n)
+        return tri
 
     def __divide_and_conquer(self, begin: int, end: int) -> Tuple[int, int, int, int]:
-        """Recursive method for delaunay triangulation.
+        """Divide-and-conquer method for delaunay triangulation.
 
         Note:
             The assumption is made upon entering this method that the vertices in the range are sorted x, y
@@ -709,35 +1034,45 @@ class Triangulation2(object):
         # NOTE:   alternating cuts.
         # TODO: Make the merge algorithm to call here dynamic.
         # NOTE: A simple if condition should suffice I think.
-        # Handle base cases.
-        if end - begin < 4:
-            return self.__trivial_triangulation(begin, end)
-        divider = ((end - begin) >> 1) + begin
-
-        # Solve the left half recursively.
-        print('NOW RECURSIVELY TRIANGULATING {} THROUGH {}'.format(begin, divider))
-        tri_l2, tri_l3, tri_l6, tri_l7 = self.__divide_and_conquer(begin, divider)
-        # FIXME: Get rid of draws when debugging not necessary.
-        print('RECURSIVELY TRIANGULATED {} THROUGH {}'.format(begin, divider))
-        self.draw(order=self.order)
-        # self.debug_print()
-
-        # Solve the right half recursively.
-        print('NOW  RECURSIVELY TRIANGULATING {} THROUGH {}'.format(divider, end))
-        tri_r2, tri_r3, tri_r6, tri_r7 = self.__divide_and_conquer(divider, end)
-        # FIXME: Get rid of draws when debugging not necessary.
-        print('RECURSIVELY TRIANGULATED {} THROUGH {}'.format(divider, end))
-        self.draw(order=self.order)
-        # self.debug_print()
-
-        # Merge.
-        print('NOW MERGING {} THROUGH {}'.format(begin, end))
-        self.__merge_arbitrary(tri_l6, tri_l7, tri_r2, tri_r3)
-        # FIXME: Get rid of draws when debugging not necessary.
-        # self.draw(order=self.order)
-        # self.debug_print()
-
-        return self.__find_ghosts(tri_l2, tri_l3, tri_r6, tri_r7)
+        # The recursion runs on an explicit stack of frames of (begin, end, the triangles 2, 3, 6, and 7 of the halves
+        # solved so far), so the depth of the input does not reach the interpreter's recursion limit and no call is made
+        # per range. Frames are visited in the order the recursive calls would be, so the triangles are the same and in
+        # the same order.
+        stack = [(begin, end, [])]  # type: List[Tuple[int, int, List[Tuple[int, int, int, int]]]]
+        while True:
+            begin, end, halves = stack[-1]
+            if end - begin < 4:
+                # Handle base cases.
+                ghosts = self.__trivial_triangulation(begin, end)
+            elif not halves:
+                # Solve the left half.
+                divider = ((end - begin) >> 1) + begin
+                if self.verbose:
+                    print('NOW RECURSIVELY TRIANGULATING {} THROUGH {}'.format(begin, divider))
+                stack.append((begin, divider, []))
+                continue
+            elif len(halves) < 2:
+                # Solve the right half.
+                divider = ((end - begin) >> 1) + begin
+                if self.verbose:
+                    print('NOW  RECURSIVELY TRIANGULATING {} THROUGH {}'.format(divider, end))
+                stack.append((divider, end, []))
+                continue
+            else:
+                # Merge.
+                (tri_l2, tri_l3, tri_l6, tri_l7), (tri_r2, tri_r3, tri_r6, tri_r7) = halves
+                if self.verbose:
+                    print('NOW MERGING {} THROUGH {}'.format(begin, end))
+                self.__merge_arbitrary(tri_l6, tri_l7, tri_r2, tri_r3)
+                ghosts = self.__find_ghosts(tri_l2, tri_l3, tri_r6, tri_r7)
+            stack.pop()
+            if not stack:
+                return ghosts
+            stack[-1][2].append(ghosts)
+            if self.verbose:
+                print('RECURSIVELY TRIANGULATED {} THROUGH {}'.format(begin, end))
+            if self.debug_draw:
+                self.draw(order=self.order)
 
     def enforce_delaunay(self) -> None:
         """The flip algorithm. Repeatedly flips edges that are not locally Delaunay until the entire triangulation is
@@ -747,76 +1082,67 @@ class Triangulation2(object):
             The vertices must already be triangulated. Otherwise this method is a no-op (if no triangles exist) or
             undefined (if triangles exist but do not represent a complete triangulation of the vertices).
         """
-        # TODO: Test the timing of this algorithm under various conditions to see which is, in practice, more efficient.
-        # NOTE: The conditions are as follows:
-        # NOTE: - pop() and popleft() when we pull from the edge queue. pop() looks like it does less flips than
-        # NOTE:   popleft()?
-        # NOTE: - The order that we add edges to the queue. I think pop() only looks like it does less flips because of
-        # NOTE:   the order we add to the queue. It might be ideal, when transferring this to C/C++, to use a stack
-        # NOTE:   rather than a FIFO queue, so it would be good if we could make that efficient.
-        edge_set = set()  # type: Set[Tuple[int, int]]
-        edge_queue = collections.deque()  # type: Deque[Tuple[Tuple[int, int], int, int]]
-
-        # Add every edge in the triangulation to the queue.
-        for t_i, t in enumerate(self.triangles):
-            if t.v[2] is None:
+        # The edges to test are kept on a stack (LIFO), as in Lawson's flip algorithm: pop() does fewer flips than
+        # popleft(), as the edges around the most recent flip are the likeliest to still not be locally Delaunay. An
+        # edge is pushed as the int t << 2 | n: the edge of triangle t that begins at its vertex n. A flip may have
+        # changed that edge since it was pushed, but whatever edge is there then is tested instead, which is harmless.
+        edge_queue = []  # type: List[int]
+
+        # The loop runs on list copies of the triangle arrays, which index faster than the arrays do, and calls
+        # in_circle_f on the coordinate columns directly. The arrays are written once, after the last flip.
+        tv = self._tv[:self.num_triangles].tolist()
+        tn = self._tn[:self.num_triangles].tolist()
+        x = self.__x
+        y = self.__y
+
+        # Add every edge in the triangulation to the queue. Each edge between two existent triangles is added once,
+        # from the triangle with the lower index.
+        for t_i, (v, n) in enumerate(zip(tv, tn)):
+            if v[2] == NO_INDEX:
                 continue
             for n_i in range(3):
-                if self.triangles[t.n[n_i]].v[2] is None:
+                if n[n_i] < t_i or tv[n[n_i]][2] == NO_INDEX:
                     continue
-                edge = (t.v[n_i], t.v[(n_i + 1) % 3])
-                edge = (min(edge), max(edge))
-                if edge in edge_set:
-                    continue
-                edge_set.add(edge)
-                edge_queue.append((edge, t_i, n_i))
+                edge_queue.append(t_i << 2 | n_i)
 
         # Flip every edge in the queue.
-        while len(edge_queue) > 0:
+        while edge_queue:
 
-            # edge: (a, b)
             # t_index_i: The index of triangle i.
             # t_n_index_i: The index in triangle i where edge begins.
-            # Pop the next item from the queue (FIFO).
-            edge, t_index_i, t_n_index_i = edge_queue.popleft()
+            # Pop the next item from the queue (LIFO).
+            entry = edge_queue.pop()
+            t_index_i = entry >> 2
+            t_n_index_i = entry & 3
 
-            # triangle_i: Triangle i.
+            # v_i: The vertices of triangle i.
             # Do not continue if it is a ghost triangle.
-            triangle_i = self.triangles[t_index_i]
-            if triangle_i.v[2] is None:
+            v_i = tv[t_index_i]
+            if v_i[2] == NO_INDEX:
                 continue
 
-            # edge_i: The actual edge given the parameters.
-            # We use this to check if the edge still exists.
-            triangle_i = self.triangles[t_index_i]
-            edge_i = (triangle_i.v[t_n_index_i], triangle_i.v[(t_n_index_i + 1) % 3])
-            edge_i = (min(edge_i), max(edge_i))
-            if edge != edge_i:
+            # t_index_j: The index of triangle j.
+            # v_j: The vertices of triangle j.
+            # Do not continue if it is a ghost triangle, as the edge is then on the hull.
+            n_i = tn[t_index_i]
+            t_index_j = n_i[t_n_index_i]
+            v_j = tv[t_index_j]
+            if v_j[2] == NO_INDEX:
                 continue
 
-            # t_index_j: The index of triangle j.
-            # triangle_j: Triangle j.
-            # t_n_index_j: The index in triangle j where the edge begins.
-            # We use a loop to find t_n_index_j.
-            # This is used to find the vertices and neighbors of triangle j.
-            t_index_j = triangle_i.n[t_n_index_i]
-            triangle_j = self.triangles[t_index_j]
-            t_n_index_j = None
-            for j in range(3):
-                edge_j = (triangle_j.v[j], triangle_j.v[(j + 1) % 3])
-                edge_j = (min(edge_j), max(edge_j))
-                if edge_i == edge_j:
-                    t_n_index_j = j
-                    break
-            if t_n_index_j is None:
-                raise Exception('Source triangle index missing in neighbor triangle.')
+            # edge_0, edge_1: The vertices of the edge, in the order of triangle i.
+            # t_n_index_j: The index in triangle j where the edge begins. Triangle j has the edge in the opposite order,
+            # so it begins at edge_1.
+            edge_0 = v_i[t_n_index_i]
+            edge_1 = v_i[(t_n_index_i + 1) % 3]
+            t_n_index_j = v_j.index(edge_1)
 
             # Get all vertices and indices we need.
-            v_index_i = triangle_i.v[(t_n_index_i + 2) % 3]
-            v_index_j = triangle_j.v[(t_n_index_j + 2) % 3]
-            vertex_j = self.vertices[v_index_j]
+            v_index_i = v_i[(t_n_index_i + 2) % 3]
+            v_index_j = v_j[(t_n_index_j + 2) % 3]
 
-            if self.__in_circle(t_index_i, vertex_j) is Position.INSIDE:
+            a, b, c = v_i
+            if in_circle_f(x[a], y[a], x[b], y[b], x[c], y[c], x[v_index_j], y[v_index_j]) > 0:
                 # At this point, we need to flip.
 
                 # t_index_i1: The index of triangle i's neighbor ccw of triangle j.
@@ -824,63 +1150,64 @@ class Triangulation2(object):
                 # t_index_j1: The index of triangle j's neighbor ccw of triangle i.
                 # t_index_j2: The index of triangle j's neighbor cw of triangle i.
                 # Note these are actual indices of the triangles, not in indexes in the neighbor array.
-                t_index_i1 = triangle_i.n[(t_n_index_i + 1) % 3]
-                t_index_i2 = triangle_i.n[(t_n_index_i + 2) % 3]
-                t_index_j1 = triangle_j.n[(t_n_index_j + 1) % 3]
-                t_index_j2 = triangle_j.n[(t_n_index_j + 2) % 3]
-                triangle_i1 = self.triangles[t_index_i1]
-                triangle_i2 = self.triangles[t_index_i2]
-                triangle_j1 = self.triangles[t_index_j1]
-                triangle_j2 = self.triangles[t_index_j2]
-
-                # Fix triangle i1.
-                for i, n in enumerate(triangle_i1.n):
-                    if n == t_index_i:
-                        triangle_i1.n[i] = t_index_j
-                        break
-
-                # Fix triangle j1.
-                for i, n in enumerate(triangle_j1.n):
-                    if n == t_index_j:
-                        triangle_j1.n[i] = t_index_i
-                        break
-
-                # Fix triangles i and j.
-                # How we fix these triangles depends on the orientation of edge.
-                triangle_i.n = [t_index_j, t_index_i2, t_index_j1]
-                triangle_j.n = [t_index_i, t_index_j2, t_index_i1]
-                if triangle_i.v[t_n_index_i] == edge[0]:
-                    triangle_i.v = [v_index_j, v_index_i, edge[0]]
-                    triangle_j.v = [v_index_i, v_index_j, edge[1]]
-                else:
-                    triangle_i.v = [v_index_j, v_index_i, edge[1]]
-                    triangle_j.v = [v_index_i, v_index_j, edge[0]]
+                n_j = tn[t_index_j]
+                t_index_i1 = n_i[(t_n_index_i + 1) % 3]
+                t_index_i2 = n_i[(t_n_index_i + 2) % 3]
+                t_index_j1 = n_j[(t_n_index_j + 1) % 3]
+                t_index_j2 = n_j[(t_n_index_j + 2) % 3]
+
+                # Fix triangles i1 and j1. list.index finds the slot in one call rather than a loop over the row.
+                n_i1 = tn[t_index_i1]
+                n_i1[n_i1.index(t_index_i)] = t_index_j
+                n_j1 = tn[t_index_j1]
+                n_j1[n_j1.index(t_index_j)] = t_index_i
+
+                # Fix triangles i and j, in place in their rows. Triangle i keeps the vertex where the edge began in it,
+                # and triangle j the one where it ended.
+                n_i[0], n_i[1], n_i[2] = t_index_j, t_index_i2, t_index_j1
+                n_j[0], n_j[1], n_j[2] = t_index_i, t_index_j2, t_index_i1
+                v_i[0], v_i[1], v_i[2] = v_index_j, v_index_i, edge_0
+                v_j[0], v_j[1], v_j[2] = v_index_i, v_index_j, edge_1
 
                 # We have to push all edges around the new (i, j) to the queue.
 
                 # Add the edge between triangle i and triangle i2 (between i and a/b).
-                if triangle_i2.v[2] is not None:
-                    edge = (triangle_i.v[1], triangle_i.v[2])
-                    edge = (min(edge), max(edge))
-                    edge_queue.append((edge, t_index_i, 1))
+                if tv[t_index_i2][2] != NO_INDEX:
+                    edge_queue.append(t_index_i << 2 | 1)
 
                 # Add the edge between triangle i and triangle j1 (between a/b and j).
-                if triangle_j1.v[2] is not None:
-                    edge = (triangle_i.v[0], triangle_i.v[2])
-                    edge = (min(edge), max(edge))
-                    edge_queue.append((edge, t_index_i, 2))
+                if tv[t_index_j1][2] != NO_INDEX:
+                    edge_queue.append(t_index_i << 2 | 2)
 
                 # Add the edge between triangle j and triangle j2 (between j and a/b).
-                if triangle_j2.v[2] is not None:
-                    edge = (triangle_j.v[1], triangle_j.v[2])
-                    edge = (min(edge), max(edge))
-                    edge_queue.append((edge, t_index_j, 1))
+                if tv[t_index_j2][2] != NO_INDEX:
+                    edge_queue.append(t_index_j << 2 | 1)
 
                 # Add the edge between triangle j and triangle i1 (between a/b and i).
-                if triangle_i1.v[2] is not None:
-                    edge = (triangle_j.v[0], triangle_j.v[2])
-                    edge = (min(edge), max(edge))
-                    edge_queue.append((edge, t_index_j, 2))
+                if tv[t_index_i1][2] != NO_INDEX:
+                    edge_queue.append(t_index_j << 2 | 2)
+
+                if self.debug_draw and self.window is not None:
+                    self._tv[:self.num_triangles] = tv
+                    self._tn[:self.num_triangles] = tn
+                    self.draw()
+
+        if tv:
+            self._tv[:self.num_triangles] = tv
+            self._tn[:self.num_triangles] = tn
+
 
-                # FIXME: Get rid of draws when debugging not necessary.
-                self.draw()
+def _triangulate_range_worker(points: np.ndarray, begin: int,
+                              end: int) -> Tuple[np.ndarray, np.ndarray, int, int, int, int]:
+    """The body of a worker process of Triangulation2.triangulate: triangulates a range of the vertices on a
+    Triangulation2 of the worker's own.
+
+    Args:
+        points: (N,2) float64 array of the coordinates of all the sorted vertices.
+        begin: The beginning of the range of vertices to triangulate (inclusive).
+        end: The end of the range of vertices to triangulate (exclusive).
+
+    Returns:
+        The vertex and neighbor rows of the triangles, then triangles 2, 3, 6, and 7 of the triangulation.
+    """
+    return Triangulation2(points)._triangulate_sorted_range(begin, end)
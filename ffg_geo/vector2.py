@@ -8,10 +8,14 @@ License:
 
 import math
 
+import numpy as np
+
 
 class Vector2(object):
+    __slots__ = ('__x', '__y')
+
     def __init__(self, x: float, y: float) -> None:
-        self.__c = (x, y)
+        self.__x, self.__y = x, y
 
     def __add__(self, other: 'Vector2') -> 'Vector2':
         return self.plus(other)
@@ -25,37 +29,44 @@ class Vector2(object):
     def __truediv__(self, other: float) -> 'Vector2':
         return self.divide(other)
 
+    def __len__(self) -> int:
+        return 2
+
     def __getitem__(self, item: int) -> float:
-        return self.__c[item]
+        if item == 0:
+            return self.__x
+        if item == 1:
+            return self.__y
+        return (self.__x, self.__y)[item]
 
     @property
     def x(self) -> float:
-        return self.__c[0]
+        return self.__x
 
     @property
     def y(self) -> float:
-        return self.__c[1]
+        return self.__y
 
     def clone(self) -> 'Vector2':
-        return Vector2(self.__c[0], self.__c[1])
+        return Vector2(self.__x, self.__y)
 
     def negated(self) -> 'Vector2':
-        return Vector2(-self.__c[0], -self.__c[1])
+        return Vector2(-self.__x, -self.__y)
 
     def plus(self, a: 'Vector2') -> 'Vector2':
-        return Vector2(self.__c[0] + a.__c[0], self.__c[1] + a.__c[1])
+        return Vector2(self.__x + a.__x, self.__y + a.__y)
 
     def minus(self, a: 'Vector2') -> 'Vector2':
-        return Vector2(self.__c[0] - a.__c[0], self.__c[1] - a.__c[1])
+        return Vector2(self.__x - a.__x, self.__y - a.__y)
 
     def times(self, a: float) -> 'Vector2':
-        return Vector2(self.__c[0] * a, self.__c[1] * a)
+        return Vector2(self.__x * a, self.__y * a)
 
     def divide(self, a: float) -> 'Vector2':
-        return Vector2(self.__c[0] / a, self.__c[1] / a)
+        return Vector2(self.__x / a, self.__y / a)
 
     def dot(self, a: 'Vector2') -> float:
-        return self.__c[0] * a.__c[0] + self.__c[1] * a.__c[1]
+        return self.__x * a.__x + self.__y * a.__y
 
     def lerp(self, a: 'Vector2', t: float) -> 'Vector2':
         return self.plus(a.minus(self).times(t))
@@ -70,7 +81,9 @@ class Vector2(object):
         return self.divide(self.length())
 
     def angle(self, a: 'Vector2') -> float:
-        return math.acos(self.unit().dot(a.unit()))
+        # One square root and no intermediate vectors, clamped so round-off cannot take acos out of its domain.
+        cosine = self.dot(a) / math.sqrt(self.dot(self) * a.dot(a))
+        return math.acos(min(max(cosine, -1.0), 1.0))
 
     def projection(self, a: 'Vector2') -> 'Vector2':
         return self.times(a.dot(self))
@@ -81,6 +94,17 @@ class Vector2(object):
         return False
 
     def rotated(self, rad: float) -> 'Vector2':
-        x = self.__c[0] * math.cos(rad) - self.__c[1] * math.sin(rad)
-        y = self.__c[0] * math.sin(rad) - self.__c[1] * math.cos(rad)
-        return Vector2(x, y)
+        # Counter-clockwise by rad.
+        cos = math.cos(rad)
+        sin = math.sin(rad)
+        x = self.__x
+        y = self.__y
+        return Vector2(x * cos - y * sin, x * sin + y * cos)
+
+
+def rotated_batch(xy: np.ndarray, rad: float) -> np.ndarray:
+    # An (N, 2) array of vectors each rotated as Vector2.rotated does, with the sine and cosine taken once.
+    xy = np.asarray(xy, dtype=np.float64)
+    cos = math.cos(rad)
+    sin = math.sin(rad)
+    return np.stack((xy[:, 0] * cos - xy[:, 1] * sin, xy[:, 0] * sin + xy[:, 1] * cos), axis=1)
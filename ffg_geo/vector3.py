@@ -10,8 +10,10 @@ import math
 
 
 class Vector3(object):
+    __slots__ = ('__x', '__y', '__z')
+
     def __init__(self, x: float, y: float, z: float) -> None:
-        self.__c = (x, y, z)
+        self.__x, self.__y, self.__z = x, y, z
 
     def __add__(self, other: 'Vector3') -> 'Vector3':
         return self.plus(other)
@@ -25,41 +27,50 @@ class Vector3(object):
     def __truediv__(self, other: float) -> 'Vector3':
         return self.divide(other)
 
+    def __len__(self) -> int:
+        return 3
+
     def __getitem__(self, item: int) -> float:
-        return self.__c[item]
+        if item == 0:
+            return self.__x
+        if item == 1:
+            return self.__y
+        if item == 2:
+            return self.__z
+        return (self.__x, self.__y, self.__z)[item]
 
     @property
     def x(self) -> float:
-        return self.__c[0]
+        return self.__x
 
     @property
     def y(self) -> float:
-        return self.__c[1]
+        return self.__y
 
     @property
     def z(self) -> float:
-        return self.__c[2]
+        return self.__z
 
     def clone(self) -> 'Vector3':
-        return Vector3(self.__c[0], self.__c[1], self.__c[2])
+        return Vector3(self.__x, self.__y, self.__z)
 
     def negated(self) -> 'Vector3':
-        return Vector3(-self.__c[0], -self.__c[1], -self.__c[2])
+        return Vector3(-self.__x, -self.__y, -self.__z)
 
     def plus(self, a: 'Vector3') -> 'Vector3':
-        return Vector3(self.__c[0] + a.__c[0], self.__c[1] + a.__c[1], self.__c[2] + a.__c[2])
+        return Vector3(self.__x + a.__x, self.__y + a.__y, self.__z + a.__z)
 
     def minus(self, a: 'Vector3') -> 'Vector3':
-        return Vector3(self.__c[0] - a.__c[0], self.__c[1] - a.__c[1], self.__c[2] - a.__c[2])
+        return Vector3(self.__x - a.__x, self.__y - a.__y, self.__z - a.__z)
 
     def times(self, a: float) -> 'Vector3':
-        return Vector3(self.__c[0] * a, self.__c[1] * a, self.__c[2] * a)
+        return Vector3(self.__x * a, self.__y * a, self.__z * a)
 
     def divide(self, a: float) -> 'Vector3':
-        return Vector3(self.__c[0] / a, self.__c[1] / a, self.__c[2] / a)
+        return Vector3(self.__x / a, self.__y / a, self.__z / a)
 
     def dot(self, a: 'Vector3') -> float:
-        return self.__c[0] * a.__c[0] + self.__c[1] * a.__c[1] + self.__c[2] * a.__c[2]
+        return self.__x * a.__x + self.__y * a.__y + self.__z * a.__z
 
     def lerp(self, a: 'Vector3', t: float) -> 'Vector3':
         return self.plus(a.minus(self).times(t))
@@ -74,7 +85,9 @@ class Vector3(object):
         return self.divide(self.length())
 
     def angle(self, a: 'Vector3') -> float:
-        return math.acos(self.unit().dot(a.unit()))
+        # One square root and no intermediate vectors, clamped so round-off cannot take acos out of its domain.
+        cosine = self.dot(a) / math.sqrt(self.dot(self) * a.dot(a))
+        return math.acos(min(max(cosine, -1.0), 1.0))
 
     def projection(self, a: 'Vector3') -> 'Vector3':
         return self.times(a.dot(self))
@@ -83,5 +96,5 @@ class Vector3(object):
         return self.distance(other) < epsilon
 
     def cross(self, a: 'Vector3') -> 'Vector3':
-        return Vector3(self.__c[1] * a.__c[2] - self.__c[2] * a.__c[1], self.__c[2] * a.__c[0] - self.__c[0] * a.__c[2],
-                       self.__c[0] * a.__c[1] - self.__c[1] * a.__c[0])
+        return Vector3(self.__y * a.__z - self.__z * a.__y, self.__z * a.__x - self.__x * a.__z,
+                       self.__x * a.__y - self.__y * a.__x)
@@ -6,17 +6,30 @@ A module implementing the Window class, which allows drawing and the saving of i
 License:
     http://www.apache.org/licenses/LICENSE-2.0"""
 
+import atexit
+import collections
+import concurrent.futures
 import enum
 import os
 import pathlib
-from typing import Any, Tuple
+import queue
+import threading
+from typing import Any, Deque, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
+# The number of threads that decode the images of a video, and the number of images decoded ahead of the one written.
+_VIDEO_READ_WORKERS = 4
+_VIDEO_READ_AHEAD = 8
+# The number of images save_image queues for the writer thread before it waits for the writer to catch up. It is
+# also the number of screen-sized buffers the queued images are copied into.
+_IMAGE_WRITE_QUEUE = 32
 
+
+# An IntEnum, so that a member is the int cv2 takes and is passed to it as is.
 # noinspection PyUnresolvedReferences
-class LineType(enum.Enum):
+class LineType(enum.IntEnum):
     FILLED = cv2.FILLED
     LINE_4 = cv2.LINE_4
     LINE_8 = cv2.LINE_8
@@ -27,7 +40,7 @@ class Window(object):
     """A class for rendering and displaying primitives."""
     def __init__(self, window_name: str, dim: Tuple[int, int],
                  color: Tuple[float, float, float] = (255.0, 255.0, 255.0), resizeable: bool = False,
-                 image_dir: str = 'results_images', video_dir: str = 'results_videos') -> None:
+                 image_dir: str = 'results_images', video_dir: str = 'results_videos', max_frames: int = 256) -> None:
         """Initializes the window. Does not create the actual cv2 window.
 
         Note:
@@ -41,6 +54,7 @@ class Window(object):
             resizeable: If the window should be resizeable.
             image_dir: The directory to save images in.
             video_dir: The directory to save videos in.
+            max_frames: The number of frames save_frame may keep in memory before save_video or flush_images.
         """
         if dim[0] < 1:
             dim = (1, dim[1])
@@ -51,10 +65,15 @@ class Window(object):
         self.__right = float(self.__dim[0])
         self.__top = 0.0
         self.__bottom = float(self.__dim[1])
+        # The scale from world to screen coordinates on each axis, kept by set_coordinate_system_naive.
+        self.__scale_x = 1.0
+        self.__scale_y = 1.0
         self.__color = color
         # noinspection PyUnresolvedReferences
         self.__screen = np.zeros((self.__dim[1], self.__dim[0], 3), np.uint8)
         self.__screen[:] = self.__color
+        # A screen of only the background color, which flush copies rather than filling the screen with the color.
+        self.__background = self.__screen.copy()
         self.__window_created = False
         self.__window_name = window_name
         self.__window_title = window_name
@@ -67,20 +86,42 @@ class Window(object):
         self.__image_dir = image_dir
         self.__video_dir = video_dir
         self.__image_count = 0
+        # The frames save_frame has saved in memory, in order, for save_video. Each is a copy of the screen.
+        self.__frames: List[np.ndarray] = []
+        self.__max_frames = max(max_frames, 1)
+        # The paths of the images save_image has saved, in order, so that save_video need not list the directory.
+        self.__image_paths: List[str] = []
+        # The video frames are streamed to between start_video and stop_video. None if there is none.
+        self.__video: Optional[cv2.VideoWriter] = None
+        # The images save_image queues, as (filename, image), and the thread that writes them. The thread starts
+        # with the first image and a None entry stops it. close is registered to run at exit while it runs, so that the
+        # queued images are written even if the Window is not closed.
+        self.__image_queue: queue.Queue = queue.Queue(maxsize=_IMAGE_WRITE_QUEUE)
+        self.__image_writer: Optional[threading.Thread] = None
+        # The first error the writer thread met since wait_images_written last raised one. The thread carries on with
+        # the rest of the queue, and wait_images_written raises the error.
+        self.__write_error: Optional[Exception] = None
+        # The buffers the queued images are copied into, reused once written rather than allocated per image. They are
+        # allocated as needed, up to _IMAGE_WRITE_QUEUE.
+        self.__free_buffers: queue.Queue = queue.Queue()
+        self.__num_buffers = 0
         pathlib.Path(self.__image_dir).mkdir(parents=False, exist_ok=True)
         pathlib.Path(self.__video_dir).mkdir(parents=False, exist_ok=True)
         self.flush_images()
 
     def flush_images(self) -> None:
-        """Deletes all images in the image directory."""
+        """Deletes all frames saved in memory and all images in the image directory."""
+        self.wait_images_written()
         filenames = [filename for filename in os.listdir(self.__image_dir) if filename.endswith('.png')]
         for filename in filenames:
             os.remove(os.path.join(self.__image_dir, filename))
+        self.__frames.clear()
+        self.__image_paths.clear()
         self.__image_count = 0
 
     def flush(self) -> None:
         """Refills the screen with the background color."""
-        self.__screen[:] = self.__color
+        np.copyto(self.__screen, self.__background)
 
     def set_title(self, window_title: str) -> None:
         """Sets the title of the window.
@@ -116,33 +157,196 @@ class Window(object):
         # noinspection PyUnresolvedReferences
         return cv2.waitKey(ms)
 
+    def save_frame(self) -> None:
+        """Saves a copy of the screen in memory, as the next frame of the video save_video saves, without writing an
+        image file.
+
+        Note:
+            Each frame takes the full size of the screen in memory until save_video or flush_images. For longer videos,
+            use save_image, or start_video and record_frame, which do not keep the frames in memory.
+
+        Raises:
+            RuntimeError: If max_frames frames are already saved in memory.
+        """
+        if len(self.__frames) >= self.__max_frames:
+            raise RuntimeError('{} frames are already saved in memory.'.format(self.__max_frames))
+        self.__frames.append(self.__screen.copy())
+
     def save_image(self) -> None:
-        """Saves an image in the save_dir with the filename 'image-#.pgn' where # is the image's index."""
+        """Saves an image in the image_dir with the filename 'image-#.png' where # is the image's index. The image is
+        written on a background thread: wait_images_written waits until it is on disk.
+        """
         filename = '{}/image-{}.png'.format(self.__image_dir, str(self.__image_count).zfill(6))
         print('TAKING SCREENSHOT {}'.format(filename))
-        # noinspection PyUnresolvedReferences
-        cv2.imwrite(filename, self.__screen)
+        if self.__image_writer is None:
+            self.__image_writer = threading.Thread(target=self.__write_images, name='image writer', daemon=True)
+            self.__image_writer.start()
+            atexit.register(self.close)
+        if self.__free_buffers.empty() and self.__num_buffers < _IMAGE_WRITE_QUEUE:
+            buffer = np.empty_like(self.__screen)
+            self.__num_buffers += 1
+        else:
+            buffer = self.__free_buffers.get()
+        np.copyto(buffer, self.__screen)
+        self.__image_queue.put((filename, buffer))
+        self.__image_paths.append(filename)
         self.__image_count += 1
 
-    def save_video(self, filename: str = 'video', fps: float = 20) -> None:
-        """Saves a video from the images saved.
+    def wait_images_written(self) -> None:
+        """Waits until every image save_image has saved is written to the image directory.
+
+        Raises:
+            Exception: The first error met writing an image since the last one raised, once the rest are written.
+        """
+        self.__image_queue.join()
+        if self.__write_error is not None:
+            error, self.__write_error = self.__write_error, None
+            raise error
+
+    def close(self) -> None:
+        """Finishes the images being written and the video being recorded, and stops the image writer thread.
+
+        Raises:
+            Exception: The first error met writing an image since the last one raised.
+        """
+        try:
+            self.wait_images_written()
+        finally:
+            self.stop_video()
+            if self.__image_writer is not None:
+                self.__image_queue.put(None)
+                self.__image_writer.join()
+                self.__image_writer = None
+                atexit.unregister(self.close)
+
+    def __write_images(self) -> None:
+        """The body of the image writer thread: writes the queued images until a None entry. An error writing an image
+        is kept for wait_images_written rather than ending the thread, which would leave the queue never drained.
+        """
+        while True:
+            entry = self.__image_queue.get()
+            try:
+                if entry is None:
+                    return
+                filename, buffer = entry
+                # The image is encoded in memory and then written, so that its buffer is back in the pool before the
+                # write rather than after it.
+                try:
+                    # noinspection PyUnresolvedReferences
+                    encoded_ok, encoded = cv2.imencode('.png', buffer)
+                finally:
+                    self.__free_buffers.put(buffer)
+                if not encoded_ok:
+                    raise RuntimeError('Could not encode {}.'.format(filename))
+                with open(filename, 'wb') as file:
+                    file.write(encoded)
+            except Exception as error:
+                if self.__write_error is None:
+                    self.__write_error = error
+            finally:
+                self.__image_queue.task_done()
+
+    def save_video(self, filename: str = 'video', fps: float = 20, codec: str = 'mp4v', ext: str = 'mp4') -> None:
+        """Saves a video from the frames save_frame has saved in memory if there are any, otherwise from the images in
+        the image directory.
 
         Args:
             filename: The filename to save the video with. Note: should not include extension.
             fps: The frames per second.
+            codec: The four character code of the codec to encode the video with.
+            ext: The extension of the video file, which selects its container.
+
+        Raises:
+            RuntimeError: If the codec is not available, or does not fit the container.
         """
-        filename = '{}.avi'.format(filename)
-        filename = os.path.join(self.__video_dir, filename)
-        image_names = [filename_ for filename_ in os.listdir(self.__image_dir) if filename_.endswith('.png')]
-        if len(image_names) < 1:
+        if self.__frames:
+            # The frames in memory are written as they are, without an encode and decode through PNG files.
+            video = self.__open_video(filename, fps, codec, ext)
+            try:
+                for frame in self.__frames:
+                    video.write(frame)
+            finally:
+                video.release()
             return
+        # The images are written in the order of their indices. Images this Window did not save are only found by
+        # listing the directory, in the order their zero-filled names sort in, if it saved none itself.
+        self.wait_images_written()
+        image_paths = self.__image_paths
+        if not image_paths:
+            with os.scandir(self.__image_dir) as entries:
+                image_paths = sorted(entry.path for entry in entries if entry.name.endswith('.png') and entry.is_file())
+        if len(image_paths) < 1:
+            return
+        video = self.__open_video(filename, fps, codec, ext)
+        # The images are decoded on worker threads, up to _VIDEO_READ_AHEAD ahead of the one being written, so decoding
+        # overlaps with encoding. cv2 releases the GIL in both. They are decoded as 3-channel BGR, the format of the
+        # screen and of the video, so they are written without a conversion.
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_VIDEO_READ_WORKERS) as executor:
+                pending: Deque[concurrent.futures.Future] = collections.deque()
+                for image_path in image_paths:
+                    # noinspection PyUnresolvedReferences
+                    pending.append(executor.submit(cv2.imread, image_path, cv2.IMREAD_COLOR))
+                    if len(pending) > _VIDEO_READ_AHEAD:
+                        video.write(pending.popleft().result())
+                while pending:
+                    video.write(pending.popleft().result())
+        finally:
+            video.release()
+
+    def start_video(self, filename: str = 'video', fps: float = 20, codec: str = 'mp4v', ext: str = 'mp4') -> None:
+        """Starts a video that record_frame streams frames to, with no images saved in between. Stops the video already
+        started, if there is one.
+
+        Args:
+            filename: The filename to save the video with. Note: should not include extension.
+            fps: The frames per second.
+            codec: The four character code of the codec to encode the video with.
+            ext: The extension of the video file, which selects its container.
+
+        Raises:
+            RuntimeError: If the codec is not available, or does not fit the container.
+        """
+        self.stop_video()
+        self.__video = self.__open_video(filename, fps, codec, ext)
+
+    def record_frame(self) -> None:
+        """Writes the screen to the video started by start_video, as its next frame.
+
+        Raises:
+            RuntimeError: If no video has been started.
+        """
+        if self.__video is None:
+            raise RuntimeError('No video has been started.')
+        self.__video.write(self.__screen)
+
+    def stop_video(self) -> None:
+        """Finishes the video started by start_video, if there is one."""
+        if self.__video is not None:
+            self.__video.release()
+            self.__video = None
+
+    def __open_video(self, filename: str, fps: float, codec: str, ext: str) -> 'cv2.VideoWriter':
+        """Opens a video in the video directory, the size of the screen.
+
+        Args:
+            filename: The filename to save the video with. Note: should not include extension.
+            fps: The frames per second.
+            codec: The four character code of the codec to encode the video with.
+            ext: The extension of the video file, which selects its container.
+
+        Returns:
+            The video writer.
+
+        Raises:
+            RuntimeError: If the codec is not available, or does not fit the container.
+        """
+        filename = os.path.join(self.__video_dir, '{}.{}'.format(filename, ext))
         # noinspection PyUnresolvedReferences
-        fourcc = cv2.VideoWriter_fourcc(*'DIVX')
-        # noinspection PyUnresolvedReferences
-        video = cv2.VideoWriter(filename, fourcc, fps, self.__dim)
-        for filename in image_names:
-            # noinspection PyUnresolvedReferences
-            video.write(cv2.imread(os.path.join(self.__image_dir, filename)))
+        video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*codec), fps, self.__dim)
+        if not video.isOpened():
+            raise RuntimeError('Could not open {} to encode with {}.'.format(filename, codec))
+        return video
 
     def set_coordinate_system(self, left: float, right: float, top: float, bottom: float) -> None:
         """Sets the coordinate system, maintaining the aspect ratio.
@@ -161,28 +365,18 @@ class Window(object):
             # We can fit by padding on the y-axis.
             y_center = (top + bottom) * 0.5
             y_adjustment = y_to_x_ratio_screen / y_to_x_ratio_world
-            # Top.
-            top_off_center = top - y_center
-            top_new_off_center = top_off_center * y_adjustment
-            top = top_new_off_center + y_center
-            # Bottom.
-            bottom_off_center = bottom - y_center
-            bottom_new_off_center = bottom_off_center * y_adjustment
-            bottom = bottom_new_off_center + y_center
+            # Scale the distances of the top and the bottom from the center.
+            top = (top - y_center) * y_adjustment + y_center
+            bottom = (bottom - y_center) * y_adjustment + y_center
         else:
             # We can fit by padding on the x-axis.
             x_to_y_ratio_screen = self.__dim[0] / self.__dim[1]
             x_to_y_ratio_world = x_span / y_span
             x_center = (left + right) * 0.5
             x_adjustment = x_to_y_ratio_screen / x_to_y_ratio_world
-            # Left.
-            left_off_center = left - x_center
-            left_new_off_center = left_off_center * x_adjustment
-            left = left_new_off_center + x_center
-            # Right.
-            right_off_center = right - x_center
-            right_new_off_center = right_off_center * x_adjustment
-            right = right_new_off_center + x_center
+            # Scale the distances of the left and the right from the center.
+            left = (left - x_center) * x_adjustment + x_center
+            right = (right - x_center) * x_adjustment + x_center
         self.set_coordinate_system_naive(left, right, top, bottom)
 
     def set_coordinate_system_naive(self, left: float, right: float, top: float, bottom: float) -> None:
@@ -204,6 +398,8 @@ class Window(object):
         self.__right = right
         self.__top = top
         self.__bottom = bottom
+        self.__scale_x = self.__dim[0] / (right - left)
+        self.__scale_y = self.__dim[1] / (bottom - top)
 
     def __get_screen_point(self, p: Any) -> Tuple[int, int]:
         """Given a point in world coordinates, return the point in screen coordinates.
@@ -218,15 +414,21 @@ class Window(object):
         Returns:
             A point in screen coordinates.
         """
-        # x_distance is the percentage of the way that the point is from the left to the right.
-        # y_distance is the same except from the top to the bottom.
-        x_distance = (p[0] - self.__left) / (self.__right - self.__left)
-        y_distance = (p[1] - self.__top) / (self.__bottom - self.__top)
-        # x_value and y_values are the actual screen coordinates casted into ints so that the point lies directly on an
-        # actual pixel.
-        x_value = int(x_distance * self.__dim[0])
-        y_value = int(y_distance * self.__dim[1])
-        return x_value, y_value
+        # The screen coordinates are cast into ints so that the point lies directly on an actual pixel.
+        return int((p[0] - self.__left) * self.__scale_x), int((p[1] - self.__top) * self.__scale_y)
+
+    def __get_screen_points(self, points: np.ndarray) -> np.ndarray:
+        """Given an array of points in world coordinates, return the points in screen coordinates, as
+        __get_screen_point does for each.
+
+        Args:
+            points: (..., 2) array of points in world coordinates.
+
+        Returns:
+            (..., 2) int32 array of the points in screen coordinates.
+        """
+        screen = (np.asarray(points, dtype=np.float64) - (self.__left, self.__top)) * (self.__scale_x, self.__scale_y)
+        return screen.astype(np.int32)
 
     def draw_line(self, pt1: Any, pt2: Any, color: Tuple[float, float, float], thickness: int = 1,
                   line_type: LineType = LineType.LINE_AA) -> None:
@@ -248,8 +450,36 @@ class Window(object):
         """
         pt1 = self.__get_screen_point(pt1)
         pt2 = self.__get_screen_point(pt2)
+        # Lines with both ends past the same edge of the screen, by more than the line's reach beyond its ends, draw
+        # nothing, and are skipped without the call into cv2.
+        reach = abs(thickness) + 2
+        width, height = self.__dim
+        if ((pt1[0] < -reach and pt2[0] < -reach) or (pt1[0] >= width + reach and pt2[0] >= width + reach) or
+                (pt1[1] < -reach and pt2[1] < -reach) or (pt1[1] >= height + reach and pt2[1] >= height + reach)):
+            return
         # noinspection PyUnresolvedReferences
-        cv2.line(img=self.__screen, pt1=pt1, pt2=pt2, color=color, thickness=thickness, lineType=line_type.value)
+        cv2.line(img=self.__screen, pt1=pt1, pt2=pt2, color=color, thickness=thickness, lineType=line_type)
+
+    def draw_lines(self, pts1: np.ndarray, pts2: np.ndarray, color: Tuple[float, float, float], thickness: int = 1,
+                   line_type: LineType = LineType.LINE_AA) -> None:
+        """Draws many lines at once, as draw_line does for each pair of points, with one call into cv2.
+
+        Note:
+            A thickness > 1 is required for LineType.FILLED.
+
+        Args:
+            pts1: (N,2) array of the source points of the lines in world coordinates.
+            pts2: (N,2) array of the destination points of the lines in world coordinates.
+            color: The BGR color of the lines.
+            thickness: The thickness of the lines in pixels.
+            line_type: The type of line.
+        """
+        lines = self.__get_screen_points(np.stack((pts1, pts2), axis=1))
+        if len(lines) < 1:
+            return
+        # noinspection PyUnresolvedReferences
+        cv2.polylines(img=self.__screen, pts=lines, isClosed=False, color=color, thickness=thickness,
+                      lineType=line_type)
 
     def draw_circle(self, center: Any, radius: int, color: Tuple[float, float, float], thickness: int = 1,
                     line_type: LineType = LineType.LINE_AA) -> None:
@@ -270,12 +500,58 @@ class Window(object):
             line_type: The type of line.
         """
         center = self.__get_screen_point(center)
+        # Circles entirely past an edge of the screen draw nothing, and are skipped without the call into cv2.
+        reach = radius + abs(thickness) + 2
+        if (center[0] < -reach or center[0] >= self.__dim[0] + reach or center[1] < -reach or
+                center[1] >= self.__dim[1] + reach):
+            return
         # noinspection PyUnresolvedReferences
         cv2.circle(img=self.__screen, center=center, radius=radius, color=color, thickness=thickness,
-                   lineType=line_type.value)
+                   lineType=line_type)
+
+    def draw_circles(self, centers: np.ndarray, radius: int, color: Tuple[float, float, float], thickness: int = 1,
+                     line_type: LineType = LineType.LINE_AA) -> None:
+        """Draws many circles of one radius at once, as draw_circle does for each center.
+
+        Note:
+            A thickness > 1 is required for LineType.FILLED. Anti-aliased circles blend with what is under them, so
+            they are still drawn one cv2 call at a time: pass another line type for them to be drawn at once.
+
+        Args:
+            centers: (N,2) array of the centers of the circles in world coordinates.
+            radius: The radius of the circles in pixels (NOT WORLD COORDINATES).
+            color: The BGR color of the circles.
+            thickness: The thickness of the circles in pixels.
+            line_type: The type of line.
+        """
+        points = self.__get_screen_points(centers).reshape(-1, 2)
+        screen = self.__screen
+        # Circles entirely past an edge of the screen draw nothing, as in draw_circle, and are dropped first.
+        reach = radius + abs(thickness) + 2
+        points = points[(points[:, 0] >= -reach) & (points[:, 0] < self.__dim[0] + reach) &
+                        (points[:, 1] >= -reach) & (points[:, 1] < self.__dim[1] + reach)]
+        pad = radius + abs(thickness) + 1
+        if line_type != LineType.LINE_AA:
+            # Other than anti-aliased circles, which blend with the screen, circles overwrite their pixels with the
+            # color, and cv2 draws the same pixels around every integer center away from the edges of the screen. So
+            # the pixels of one circle are drawn once, around the center of a patch, and set for every such center at
+            # once. Circles that reach the edges are clipped by cv2, and are drawn one at a time below.
+            inside = ((points[:, 0] >= pad) & (points[:, 0] < self.__dim[0] - pad) &
+                      (points[:, 1] >= pad) & (points[:, 1] < self.__dim[1] - pad))
+            patch = np.zeros((2 * pad + 1, 2 * pad + 1), np.uint8)
+            # noinspection PyUnresolvedReferences
+            cv2.circle(patch, (pad, pad), radius, 255, thickness, line_type)
+            offset_y, offset_x = np.nonzero(patch)
+            stamped = points[inside]
+            screen[(stamped[:, 1:2] + (offset_y - pad)).ravel(), (stamped[:, 0:1] + (offset_x - pad)).ravel()] = \
+                np.clip(np.rint(color), 0, 255)
+            points = points[~inside]
+        for center in points.tolist():
+            # noinspection PyUnresolvedReferences
+            cv2.circle(screen, center, radius, color, thickness, line_type)
 
     def draw_cross(self, center: Any, color: Tuple[float, float, float], length: int, thickness: int = 1,
-                   line_type: LineType = LineType.LINE_AA) -> None:
+                   line_type: LineType = LineType.LINE_8) -> None:
         """Draws a cross.
 
         Note:
@@ -290,14 +566,39 @@ class Window(object):
             color: The BGR color of the cross.
             length: The length of the arms of the cross in pixels (NOT WORLD COORDINATES).
             thickness: The thickness of the arms of the cross in pixels.
-            line_type: The type of line.
+            line_type: The type of line. LINE_8 by default: the arms are horizontal and vertical, so they need no
+                anti-aliasing to look straight, and LINE_8 draws them crisp and several times faster than LINE_AA.
         """
         center = self.__get_screen_point(center)
         left = (center[0] - length, center[1])
         right = (center[0] + length, center[1])
         top = (center[0], center[1] - length)
         bottom = (center[0], center[1] + length)
+        # Both arms are drawn with one call into cv2.
+        arms = np.array((left, right, top, bottom), dtype=np.int32).reshape(2, 2, 2)
         # noinspection PyUnresolvedReferences
-        cv2.line(img=self.__screen, pt1=left, pt2=right, color=color, thickness=thickness, lineType=line_type.value)
+        cv2.polylines(img=self.__screen, pts=arms, isClosed=False, color=color, thickness=thickness,
+                      lineType=line_type)
+
+    def draw_crosses(self, centers: np.ndarray, color: Tuple[float, float, float], length: int, thickness: int = 1,
+                     line_type: LineType = LineType.LINE_8) -> None:
+        """Draws many crosses at once, as draw_cross does for each center, with one call into cv2.
+
+        Note:
+            A thickness > 1 is required for LineType.FILLED.
+
+        Args:
+            centers: (N,2) array of the centers of the crosses in world coordinates.
+            color: The BGR color of the crosses.
+            length: The length of the arms of the crosses in pixels (NOT WORLD COORDINATES).
+            thickness: The thickness of the arms of the crosses in pixels.
+            line_type: The type of line. LINE_8 by default, as for draw_cross.
+        """
+        centers = self.__get_screen_points(centers).reshape(-1, 1, 1, 2)
+        if len(centers) < 1:
+            return
+        # The horizontal and then the vertical arm of every cross, as offsets from its center.
+        arms = np.array(((-length, 0), (length, 0), (0, -length), (0, length)), dtype=np.int32).reshape(2, 2, 2)
         # noinspection PyUnresolvedReferences
-        cv2.line(img=self.__screen, pt1=top, pt2=bottom, color=color, thickness=thickness, lineType=line_type.value)
+        cv2.polylines(img=self.__screen, pts=(centers + arms).reshape(-1, 2, 2), isClosed=False, color=color,
+                      thickness=thickness, lineType=line_type)